@@ -0,0 +1,231 @@
+"""Offline benchmark of pose detector configurations on a recorded video.
+
+Every variant runs the same frames through a fresh ``VIDEO`` mode landmarker,
+exactly as the capture pipeline feeds them, and reports per-frame inference
+latency together with landmark quality. No ground truth is needed: quality
+is measured against a reference variant (the heavy model on full-resolution
+frames by default) as the mean landmark error in pixels and PCK, the share
+of landmarks within ``--pck-threshold`` of the longer frame side.
+
+A variant is written as ``model[@max_side]``, e.g. ``lite@480``. With
+``--roi-padding`` the variants also crop frames to the previous pose, as the
+detector does with ``ROI_PADDING``; the reference always sees full frames.
+
+Run:
+    uv run python -m benchmark.detector_variants --video recording.mp4 \\
+        --variants lite lite@480 full full@640 heavy
+"""
+
+import argparse
+import json
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Literal, cast
+
+import cv2
+import mediapipe as mp
+import numpy as np
+import numpy.typing as npt
+
+from ppe_client.adapters.poses import (
+    MediaPipePoseDetectorFactory,
+    PoseDetectorSettings,
+)
+from ppe_client.adapters.poses.inference_image import InferencePreprocessor
+from ppe_client.application.poses import Landmark
+
+type Landmarks = npt.NDArray[np.float64]
+
+
+@dataclass(frozen=True)
+class Variant:
+    model: Literal["lite", "full", "heavy"]
+    max_side: int | None
+
+    @classmethod
+    def parse(cls, spec: str) -> "Variant":
+        model, _, max_side = spec.partition("@")
+        if model not in ("lite", "full", "heavy"):
+            raise argparse.ArgumentTypeError(f"unknown model variant: {spec}")
+        return cls(
+            model=cast(Literal["lite", "full", "heavy"], model),
+            max_side=int(max_side) if max_side else None,
+        )
+
+    @property
+    def name(self) -> str:
+        return self.model if self.max_side is None else f"{self.model}@{self.max_side}"
+
+
+@dataclass(frozen=True)
+class VariantReport:
+    variant: str
+    frames: int
+    detection_rate: float
+    latency_mean_ms: float
+    latency_p50_ms: float
+    latency_p95_ms: float
+    mean_error_px: float
+    pck: float
+
+    def format(self) -> str:
+        return (
+            f"{self.variant:<12} detected {self.detection_rate:6.1%}"
+            f"  latency mean/p50/p95 {self.latency_mean_ms:6.1f} /"
+            f" {self.latency_p50_ms:6.1f} / {self.latency_p95_ms:6.1f} ms"
+            f"  error {self.mean_error_px:6.1f} px  PCK {self.pck:6.1%}"
+        )
+
+
+def read_video(
+    path: Path, max_frames: int | None
+) -> list[tuple[npt.NDArray[np.uint8], int]]:
+    """Decode the video into frames with their timestamps in milliseconds."""
+    capture = cv2.VideoCapture(str(path))
+    if not capture.isOpened():
+        raise RuntimeError(f"Failed to open video: {path}")
+    fps = capture.get(cv2.CAP_PROP_FPS) or 30.0
+    frames: list[tuple[npt.NDArray[np.uint8], int]] = []
+    try:
+        while max_frames is None or len(frames) < max_frames:
+            ok, image = capture.read()
+            if not ok:
+                break
+            frames.append(
+                (np.ascontiguousarray(image), round(len(frames) * 1000 / fps))
+            )
+    finally:
+        capture.release()
+    return frames
+
+
+type VariantRun = tuple[list[Landmarks | None], npt.NDArray[np.float64]]
+
+
+def run_variant(
+    variant: Variant,
+    frames: list[tuple[npt.NDArray[np.uint8], int]],
+    masks: bool,
+    roi_padding: float | None = None,
+) -> VariantRun:
+    """Run inference of one variant over all frames.
+
+    Returns:
+        VariantRun: Normalized
+            ``(33, 2)`` landmarks per frame (``None`` without a detected pose)
+            and per-frame latency in milliseconds, preprocessing included.
+    """
+    settings = PoseDetectorSettings(
+        pose_model=variant.model,
+        segmentation_masks=masks,
+        inference_max_side=variant.max_side,
+    )
+    landmarker = MediaPipePoseDetectorFactory(settings).create_landmarker()
+    preprocessor = InferencePreprocessor(variant.max_side, roi_padding)
+    poses: list[Landmarks | None] = []
+    latencies = np.empty(len(frames), dtype=np.float64)
+    try:
+        for i, (image, timestamp_ms) in enumerate(frames):
+            started = time.perf_counter()
+            data, region = preprocessor.prepare(image)
+            mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=data)
+            result = landmarker.detect_for_video(mp_image, timestamp_ms=timestamp_ms)
+            landmarks = (
+                [
+                    region.to_frame(Landmark(x=lm.x, y=lm.y, z=lm.z))
+                    for lm in result.pose_landmarks[0]
+                ]
+                if result.pose_landmarks
+                else None
+            )
+            preprocessor.track(landmarks)
+            latencies[i] = (time.perf_counter() - started) * 1000
+            poses.append(
+                np.array([(lm.x, lm.y) for lm in landmarks], dtype=np.float64)
+                if landmarks
+                else None
+            )
+    finally:
+        landmarker.close()
+    return poses, latencies
+
+
+def compare(
+    name: str,
+    run: VariantRun,
+    reference: list[Landmarks | None],
+    frame_size: tuple[int, int],
+    pck_threshold: float,
+) -> VariantReport:
+    poses, latencies = run
+    width, height = frame_size
+    scale = np.array([width, height], dtype=np.float64)
+    errors = np.array(
+        [
+            np.linalg.norm((pose - ref) * scale, axis=1)
+            for pose, ref in zip(poses, reference, strict=True)
+            if pose is not None and ref is not None
+        ]
+    ).reshape(-1)
+    p50, p95 = np.percentile(latencies, [50, 95]) if latencies.size else (0.0, 0.0)
+    return VariantReport(
+        variant=name,
+        frames=len(poses),
+        detection_rate=sum(pose is not None for pose in poses) / max(len(poses), 1),
+        latency_mean_ms=float(latencies.mean()) if latencies.size else 0.0,
+        latency_p50_ms=float(p50),
+        latency_p95_ms=float(p95),
+        mean_error_px=float(errors.mean()) if errors.size else float("nan"),
+        pck=float((errors <= pck_threshold * max(width, height)).mean())
+        if errors.size
+        else float("nan"),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--video", type=Path, required=True)
+    parser.add_argument(
+        "--variants",
+        type=Variant.parse,
+        nargs="+",
+        default=[Variant.parse(spec) for spec in ("lite", "full", "heavy")],
+    )
+    parser.add_argument("--reference", type=Variant.parse, default="heavy")
+    parser.add_argument("--masks", action="store_true")
+    parser.add_argument("--roi-padding", type=float)
+    parser.add_argument("--max-frames", type=int)
+    parser.add_argument("--pck-threshold", type=float, default=0.05)
+    parser.add_argument("--output", type=Path, help="write the reports as JSON")
+    args = parser.parse_args()
+
+    frames = read_video(args.video, args.max_frames)
+    if not frames:
+        raise SystemExit("The video has no frames.")
+    height, width = frames[0][0].shape[:2]
+
+    reference, _ = run_variant(args.reference, frames, args.masks)
+    reports = []
+    for variant in args.variants:
+        report = compare(
+            variant.name,
+            run_variant(variant, frames, args.masks, args.roi_padding),
+            reference,
+            (width, height),
+            args.pck_threshold,
+        )
+        reports.append(report)
+        print(report.format())
+
+    if args.output:
+        args.output.write_text(
+            json.dumps([asdict(report) for report in reports], indent=2),
+            encoding="utf-8",
+        )
+
+
+if __name__ == "__main__":
+    main()
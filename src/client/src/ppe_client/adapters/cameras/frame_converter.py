@@ -1,7 +1,7 @@
 import numpy as np
 from PySide6 import QtGui
 
-from ppe_client.application.cameras import Frame
+from ppe_client.application.cameras import Frame, FrameOrigin
 
 
 class FrameConverter:
@@ -20,4 +20,23 @@ class FrameConverter:
 
     @classmethod
     def to_ndarray(cls, frame: Frame) -> np.ndarray:
+        """Return a read-only array that shares the frame buffer."""
         return np.frombuffer(frame.raw, np.uint8).reshape(frame.shape)
+
+    @classmethod
+    def from_ndarray(
+        cls, image: np.ndarray, timestamp_ms: int, origin: FrameOrigin
+    ) -> Frame:
+        """Wrap an image into a frame without copying its pixels.
+
+        The frame keeps a reference to the image buffer, so the image must not
+        be modified after wrapping.
+        """
+        image = np.ascontiguousarray(image, dtype=np.uint8)
+        height, width, channels = image.shape
+        return Frame(
+            raw=memoryview(image).cast("B").toreadonly(),
+            shape=(height, width, channels),
+            timestamp_ms=timestamp_ms,
+            origin=origin,
+        )
@@ -7,6 +7,8 @@ from PySide6 import QtCore
 
 from ppe_client.application.cameras import Frame, FrameOrigin
 
+from ..frame_converter import FrameConverter
+
 
 class OpenCVCameraSession(QtCore.QObject):
     _worker: "_CaptureWorker | None"
@@ -70,8 +72,8 @@ class OpenCVCameraSession(QtCore.QObject):
         if not callbacks_snapshor:
             return
 
-        frame = Frame(
-            cv_image.tobytes(), cv_image.shape, int(timestamp_ms), FrameOrigin.CV2
+        frame = FrameConverter.from_ndarray(
+            cv_image, int(timestamp_ms), FrameOrigin.CV2
         )
 
         for callback in self._callbacks:
@@ -0,0 +1,30 @@
+import struct
+
+import numpy as np
+
+FRAME_SUBPROTOCOL = "ppe.frame.v1"
+FRAME_VERSION = 1
+
+# version, landmarks count, emg readings count, flags
+FRAME_HEADER = struct.Struct("<BBBB")
+FRAME_SEQUENCE = struct.Struct("<I")
+FLAG_SEQUENCE = 0x01
+LANDMARK_DTYPE = np.dtype("<f4")
+
+ZONE_CODES: dict[str, int] = {"Green": 0, "Yellow": 1, "Red": 2}
+
+
+def encode_binary_frame(
+    landmarks: np.ndarray, emgs: list[tuple[str, str]], seq: int | None = None
+) -> bytes:
+    points = np.ascontiguousarray(landmarks, dtype=LANDMARK_DTYPE)
+    flags = FLAG_SEQUENCE if seq is not None else 0
+    parts = [FRAME_HEADER.pack(FRAME_VERSION, points.shape[0], len(emgs), flags)]
+    if seq is not None:
+        parts.append(FRAME_SEQUENCE.pack(seq))
+    parts.append(points.tobytes())
+    for sensor_name, zone in emgs:
+        name = sensor_name.encode("utf-8")
+        parts.append(bytes((ZONE_CODES[zone], len(name))))
+        parts.append(name)
+    return b"".join(parts)
@@ -1,12 +1,19 @@
 import asyncio
 import json
+from collections import deque
 from collections.abc import Callable
 
 import httpx
 import websockets
 from websockets.asyncio.client import ClientConnection
+from websockets.typing import Subprotocol
 
-from ppe_client.adapters.network.mappers import map_to_list, map_to_schema
+from ppe_client.adapters.network.binary_frame import FRAME_SUBPROTOCOL
+from ppe_client.adapters.network.mappers import (
+    map_to_binary_frame,
+    map_to_list,
+    map_to_schema,
+)
 from ppe_client.application.feedback import Feedback
 from ppe_client.application.process_data import ProcessData
 
@@ -26,6 +33,11 @@ class ExerciseSession:
         self.websocket: ClientConnection | None = None
         self._recv_lock = asyncio.Lock()
         self._callback: Callable[[list[Feedback]], None] | None = None
+        self._next_seq = 0
+        self._in_flight: deque[int] = deque()
+        self._window_changed = asyncio.Condition()
+        self._dropped_frames = 0
+        self._rejected_frames = 0
 
     async def get_exercises(self) -> list[ExerciseItem]:
         async with httpx.AsyncClient() as client:
@@ -49,7 +61,31 @@ class ExerciseSession:
             await self.__connect(session_id)
 
     async def __connect(self, session_id: str) -> None:
-        self.websocket = await websockets.connect(self.settings.analyze_url(session_id))
+        subprotocols = (
+            [Subprotocol(FRAME_SUBPROTOCOL)] if self.settings.binary_frames else None
+        )
+        self.websocket = await websockets.connect(
+            self.settings.analyze_url(session_id), subprotocols=subprotocols
+        )
+
+    @property
+    def uses_binary_frames(self) -> bool:
+        return (
+            self.websocket is not None
+            and self.websocket.subprotocol == FRAME_SUBPROTOCOL
+        )
+
+    @property
+    def dropped_frames(self) -> int:
+        return self._dropped_frames
+
+    @property
+    def rejected_frames(self) -> int:
+        return self._rejected_frames
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
 
     async def receive_feedbacks(
         self, queue: asyncio.Queue[ProcessData]
@@ -58,12 +94,94 @@ class ExerciseSession:
             raise RuntimeError("WebSocket connection not established")
 
         data = await queue.get()
-        request = map_to_schema(data)
+        message = self.__encode(data)
 
         async with self._recv_lock:
-            await self.websocket.send(json.dumps(request.model_dump()))
+            await self.websocket.send(message)
             response = await self.websocket.recv()
 
+        return self.__decode(response)
+
+    async def stream_feedbacks(self, queue: asyncio.Queue[ProcessData]) -> None:
+        """
+        Pipelined counterpart of receive_feedbacks: frames are sent without waiting
+        for the previous response, up to `pipeline_window` frames in flight.
+        Feedback is delivered to the callback passed to start(). An error for a
+        single frame (one that carries its `seq`) only releases that frame and is
+        counted in `rejected_frames`; an error without `seq` ends the stream.
+        Runs until cancelled or the connection is closed.
+        """
+        if not self.websocket:
+            raise RuntimeError("WebSocket connection not established")
+
+        self._in_flight.clear()
+        tasks = {
+            asyncio.create_task(self.__send_loop(queue)),
+            asyncio.create_task(self.__receive_loop()),
+        }
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        for task in done:
+            task.result()
+
+    async def __send_loop(self, queue: asyncio.Queue[ProcessData]) -> None:
+        assert self.websocket is not None
+        window = max(1, self.settings.pipeline_window)
+        while True:
+            data = await queue.get()
+            async with self._window_changed:
+                await self._window_changed.wait_for(
+                    lambda: len(self._in_flight) < window
+                )
+            if self.settings.drop_policy == "drop_oldest":
+                # Frames that piled up in the meantime are already stale:
+                # only the most recent one is worth sending.
+                while not queue.empty():
+                    data = queue.get_nowait()
+                    self._dropped_frames += 1
+
+            seq = self._next_seq
+            self._next_seq = (seq + 1) & 0xFFFFFFFF
+            self._in_flight.append(seq)
+            await self.websocket.send(self.__encode(data, seq))
+
+    async def __receive_loop(self) -> None:
+        assert self.websocket is not None
+        loop = asyncio.get_running_loop()
+        async for response in self.websocket:
+            payload = json.loads(response)
+            seq = payload.get("seq")
+            await self.__acknowledge(seq)
+            if "error" in payload:
+                if seq is None:
+                    raise RuntimeError(payload["error"])
+                self._rejected_frames += 1
+                continue
+            if self._callback is not None:
+                loop.call_soon(self._callback, map_to_list(FeedbackResponse(**payload)))
+
+    async def __acknowledge(self, seq: int | None) -> None:
+        # Acknowledgement is cumulative: the server may skip stale frames, so a
+        # response for `seq` also releases every frame sent before it.
+        async with self._window_changed:
+            if seq is None or seq not in self._in_flight:
+                if self._in_flight:
+                    self._in_flight.popleft()
+            else:
+                while self._in_flight and self._in_flight.popleft() != seq:
+                    pass
+            self._window_changed.notify_all()
+
+    def __encode(self, data: ProcessData, seq: int | None = None) -> str | bytes:
+        if self.uses_binary_frames:
+            return map_to_binary_frame(data, seq)
+        return json.dumps(map_to_schema(data, seq).model_dump(exclude_none=True))
+
+    def __decode(self, response: str | bytes) -> list[Feedback]:
         payload = json.loads(response)
 
         if "error" in payload:
@@ -1,8 +1,12 @@
+import numpy as np
+
+from ppe_client.adapters.network.binary_frame import encode_binary_frame
 from ppe_client.adapters.network.schemas.feedback import FeedbackResponse
 from ppe_client.adapters.network.schemas.process import EmgSensor, ProcessRequest
 from ppe_client.adapters.poses.pose_converter import PoseConverter
 from ppe_client.application.feedback import Feedback, FeedbackType
-from ppe_client.application.process_data import ProcessData
+from ppe_client.application.process_data import EmgReading, ProcessData
+from ppe_client.application.sensors.calibration.calibration_data import ValueZone
 
 
 def map_to_list(data: FeedbackResponse) -> list[Feedback]:
@@ -13,9 +17,24 @@ def map_to_list(data: FeedbackResponse) -> list[Feedback]:
     return items
 
 
-def map_to_schema(data: ProcessData) -> ProcessRequest:
+def map_to_schema(data: ProcessData, seq: int | None = None) -> ProcessRequest:
     landmarks = PoseConverter.to_list(data.pose)
     emgs = [
-        EmgSensor(sensor_name=emg.sensor_name, zone=emg.zone.value) for emg in data.emgs
+        EmgSensor(sensor_name=emg.sensor_name, zone=emg.zone.value)
+        for emg in _known_zone_emgs(data)
     ]
-    return ProcessRequest(landmarks=landmarks, emgs=emgs)
+    return ProcessRequest(landmarks=landmarks, emgs=emgs, seq=seq)
+
+
+def map_to_binary_frame(data: ProcessData, seq: int | None = None) -> bytes:
+    landmarks = np.array(
+        [(landmark.x, landmark.y, landmark.z) for landmark in data.pose.landmarks],
+        dtype=np.float32,
+    )
+    emgs = [(emg.sensor_name, emg.zone.value) for emg in _known_zone_emgs(data)]
+    return encode_binary_frame(landmarks, emgs, seq)
+
+
+def _known_zone_emgs(data: ProcessData) -> list[EmgReading]:
+    # The server knows only calibrated zones, uncalibrated readings are not sent
+    return [emg for emg in data.emgs if emg.zone is not ValueZone.UNKNOWN]
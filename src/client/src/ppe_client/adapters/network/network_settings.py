@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic.v1 import BaseSettings
 
 
@@ -5,6 +7,9 @@ class NetworkSettings(BaseSettings):
     server_host: str = "172.20.10.2"
     http_port: int = 8000
     ws_port: int = 8000
+    binary_frames: bool = True
+    pipeline_window: int = 4
+    drop_policy: Literal["drop_oldest", "block"] = "drop_oldest"
 
     class Config:
         env_file = ".env"
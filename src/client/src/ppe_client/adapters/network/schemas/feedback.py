@@ -8,3 +8,4 @@ class FeedbackItem(BaseModel):
 
 class FeedbackResponse(BaseModel):
     feedbacks: list[FeedbackItem]
+    seq: int | None = None
@@ -9,3 +9,4 @@ class EmgSensor(BaseModel):
 class ProcessRequest(BaseModel):
     landmarks: list[list[float]]
     emgs: list[EmgSensor]
+    seq: int | None = None
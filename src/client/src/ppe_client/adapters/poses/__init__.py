@@ -1,15 +1,22 @@
 from . import restoration
 from .dummy_reciever import DummyReciever
 from .landmarks_drawer import LandmarksDrawer
+from .mediapipe_detector_pool import MediaPipeDetectorPool
+from .mediapipe_detector_worker import DetectorWorker, DetectorWorkerStats
 from .mediapipe_pose_detector import MediaPipePoseDetector
 from .mediapipe_pose_detector_factory import MediaPipePoseDetectorFactory
 from .pose_converter import PoseConverter
+from .pose_detector_settings import PoseDetectorSettings
 
 __all__ = [
+    "DetectorWorker",
+    "DetectorWorkerStats",
     "DummyReciever",
     "LandmarksDrawer",
+    "MediaPipeDetectorPool",
     "MediaPipePoseDetector",
     "MediaPipePoseDetectorFactory",
     "PoseConverter",
+    "PoseDetectorSettings",
     "restoration",
 ]
@@ -0,0 +1,137 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+import numpy.typing as npt
+
+from ppe_client.application.poses import Landmark
+
+
+def downscale(
+    image: npt.NDArray[np.uint8], max_side: int | None
+) -> npt.NDArray[np.uint8]:
+    """Shrink an image so that its longer side does not exceed ``max_side``.
+
+    MediaPipe returns landmarks normalized to the image size, so a uniformly
+    scaled image yields landmarks that are valid for the original frame.
+
+    Args:
+        image (npt.NDArray[np.uint8]): Image of shape ``(height, width, 3)``.
+        max_side (int | None): Longest allowed side; ``None`` keeps the
+            original size.
+
+    Returns:
+        npt.NDArray[np.uint8]: Downscaled image, or the input itself when it
+            is already small enough.
+    """
+    height, width = image.shape[:2]
+    if max_side is None or max(height, width) <= max_side:
+        return image
+    scale = max_side / max(height, width)
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    resized = cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+    return resized.astype(np.uint8, copy=False)
+
+
+@dataclass(frozen=True, slots=True)
+class Region:
+    """Part of a frame in normalized frame coordinates."""
+
+    left: float = 0.0
+    top: float = 0.0
+    width: float = 1.0
+    height: float = 1.0
+
+    def to_frame(self, landmark: Landmark) -> Landmark:
+        """Map a landmark normalized to the region into frame coordinates.
+
+        MediaPipe scales ``z`` like ``x``, so it follows the region width.
+        """
+        return Landmark(
+            x=self.left + landmark.x * self.width,
+            y=self.top + landmark.y * self.height,
+            z=landmark.z * self.width,
+            visibility=landmark.visibility,
+            presence=landmark.presence,
+        )
+
+
+FULL_FRAME = Region()
+
+
+class InferencePreprocessor:
+    """Prepares the frames of one camera for pose inference.
+
+    Frames are downscaled to the inference size, and while a person is
+    tracked they are first cropped to the padded bounding box of the
+    previous pose. The crop is dropped as soon as the pose is lost, so the
+    next frame is searched in full.
+    """
+
+    _max_side: int | None
+    _roi_padding: float | None
+    _region: Region
+
+    def __init__(
+        self, max_side: int | None = None, roi_padding: float | None = None
+    ) -> None:
+        """Configure the preprocessing.
+
+        Args:
+            max_side (int | None): Longest image side fed to the model;
+                ``None`` keeps the original size.
+            roi_padding (float | None): Padding added to each side of the
+                pose bounding box, relative to its larger side; ``None``
+                disables cropping.
+        """
+        self._max_side = max_side
+        self._roi_padding = roi_padding
+        self._region = FULL_FRAME
+
+    def prepare(
+        self, image: npt.NDArray[np.uint8]
+    ) -> tuple[npt.NDArray[np.uint8], Region]:
+        """Crop and downscale a frame.
+
+        Returns:
+            tuple[npt.NDArray[np.uint8], Region]: Contiguous inference image
+                and the frame region it covers.
+        """
+        region = self._region
+        if region != FULL_FRAME:
+            height, width = image.shape[:2]
+            left, top = round(region.left * width), round(region.top * height)
+            right = max(left + 1, round((region.left + region.width) * width))
+            bottom = max(top + 1, round((region.top + region.height) * height))
+            image = image[top:bottom, left:right]
+            region = Region(
+                left / width,
+                top / height,
+                (right - left) / width,
+                (bottom - top) / height,
+            )
+        return np.ascontiguousarray(downscale(image, self._max_side)), region
+
+    def track(self, landmarks: Sequence[Landmark] | None) -> None:
+        """Remember the pose found in the frame for the next crop.
+
+        Args:
+            landmarks (Sequence[Landmark] | None): Landmarks in frame
+                coordinates, or ``None`` when no pose was found.
+        """
+        if self._roi_padding is None or not landmarks:
+            self._region = FULL_FRAME
+            return
+
+        xs = [landmark.x for landmark in landmarks]
+        ys = [landmark.y for landmark in landmarks]
+        padding = self._roi_padding * max(max(xs) - min(xs), max(ys) - min(ys))
+        left = max(min(xs) - padding, 0.0)
+        top = max(min(ys) - padding, 0.0)
+        right = min(max(xs) + padding, 1.0)
+        bottom = min(max(ys) + padding, 1.0)
+        if right <= left or bottom <= top:
+            self._region = FULL_FRAME
+            return
+        self._region = Region(left, top, right - left, bottom - top)
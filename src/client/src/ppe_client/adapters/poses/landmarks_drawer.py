@@ -18,6 +18,7 @@ class LandmarksDrawer:
     @classmethod
     def draw(cls, pose: Pose, frame: Frame) -> Frame:
         landmarks = PoseConverter.to_mediapipe(pose)
+        # The frame buffer is shared with other consumers, so draw on a copy
         image = np.copy(FrameConverter.to_ndarray(frame))
 
         landmark_style = get_default_pose_landmarks_style()
@@ -31,9 +32,4 @@ class LandmarksDrawer:
             connection_drawing_spec=connection_style,
         )
 
-        return Frame(
-            raw=image.data.tobytes(),
-            shape=frame.shape,
-            timestamp_ms=frame.timestamp_ms,
-            origin=frame.origin,
-        )
+        return FrameConverter.from_ndarray(image, frame.timestamp_ms, frame.origin)
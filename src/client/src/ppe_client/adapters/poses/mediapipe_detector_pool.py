@@ -0,0 +1,104 @@
+from collections.abc import Callable
+
+from mediapipe.tasks.python.vision.pose_landmarker import (
+    PoseLandmarker,
+)
+from PySide6 import QtCore
+
+from ppe_client.application.cameras import Frame
+from ppe_client.application.poses import Pose
+
+from .inference_image import InferencePreprocessor
+from .mediapipe_detector_worker import (
+    DetectorWorker,
+    DetectorWorkerStats,
+    PoseCallback,
+)
+from .mediapipe_pose_detector import MediaPipePoseDetector
+
+
+class MediaPipeDetectorPool(QtCore.QObject):
+    """Fixed-size pool of detector threads shared by all cameras.
+
+    Each camera detector is pinned to one worker, which keeps its frames in
+    capture order. Workers share threads, not models: every camera gets its
+    own landmarker on its worker, so MediaPipe tracking state and
+    ``VIDEO``-mode timestamps stay per camera. New detectors go to an idle
+    worker while the pool can still grow, otherwise to the worker with the
+    fewest cameras. Workers are started on demand.
+    """
+
+    _landmarker_factory: Callable[[], PoseLandmarker]
+    _size: int
+    _max_pending_frames: int
+    _preprocessor_factory: Callable[[], InferencePreprocessor]
+    _workers: list[DetectorWorker]
+
+    def __init__(
+        self,
+        landmarker_factory: Callable[[], PoseLandmarker],
+        size: int,
+        max_pending_frames: int,
+        preprocessor_factory: Callable[[], InferencePreprocessor] = (
+            InferencePreprocessor
+        ),
+    ) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            landmarker_factory (Callable[[], PoseLandmarker]): Creates the
+                landmarker of a new camera.
+            size (int): Maximum number of workers.
+            max_pending_frames (int): Queue size of every camera.
+            preprocessor_factory (Callable[[], InferencePreprocessor]):
+                Creates the frame preprocessing of a new camera.
+        """
+        super().__init__()
+        if size < 1:
+            raise ValueError("Pool size must be positive.")
+        self._landmarker_factory = landmarker_factory
+        self._size = size
+        self._max_pending_frames = max_pending_frames
+        self._preprocessor_factory = preprocessor_factory
+        self._workers = []
+
+    def acquire(self) -> MediaPipePoseDetector:
+        """Create a detector for a new camera on the least loaded worker."""
+        return MediaPipePoseDetector(self._pick_worker())
+
+    def stats(self) -> list[DetectorWorkerStats]:
+        """Return a load snapshot of every started worker."""
+        return [worker.stats() for worker in self._workers]
+
+    def close(self) -> None:
+        """Stop all workers and release the models of their cameras."""
+        for worker in self._workers:
+            worker.stop()
+        for worker in self._workers:
+            worker.wait()
+        self._workers = []
+
+    def _pick_worker(self) -> DetectorWorker:
+        loads = [worker.source_count for worker in self._workers]
+        if len(self._workers) < self._size and (not loads or min(loads) > 0):
+            return self._start_worker()
+        return self._workers[loads.index(min(loads))]
+
+    def _start_worker(self) -> DetectorWorker:
+        worker = DetectorWorker(
+            len(self._workers),
+            self._landmarker_factory,
+            self._max_pending_frames,
+            self._preprocessor_factory,
+            self,
+        )
+        worker.pose_ready.connect(self._on_pose_ready)
+        worker.start()
+        self._workers.append(worker)
+        return worker
+
+    @QtCore.Slot(object, object, object)
+    def _on_pose_ready(
+        self, pose: Pose | None, frame: Frame, callback: PoseCallback
+    ) -> None:
+        callback(pose, frame)
@@ -0,0 +1,284 @@
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import mediapipe as mp
+from mediapipe.tasks.python.vision.pose_landmarker import (
+    PoseLandmarker,
+)
+from PySide6 import QtCore
+
+from ppe_client.application.cameras import Frame
+from ppe_client.application.poses import Landmark, Pose
+
+from ..cameras.frame_converter import FrameConverter
+from .inference_image import InferencePreprocessor
+
+# Called with the result once the frame went through inference. Frames
+# dropped from a full queue or pending when their camera is closed never reach
+# inference, and their callbacks are never invoked.
+type PoseCallback = Callable[[Pose | None, Frame], None]
+
+
+@dataclass(frozen=True, slots=True)
+class DetectorWorkerStats:
+    """Snapshot of a detector worker load.
+
+    Attributes:
+        worker (int): Worker index inside the pool.
+        sources (int): Number of cameras served by the worker.
+        processed_frames (int): Frames that went through inference.
+        dropped_frames (int): Frames replaced by newer ones before inference.
+        pending_frames (int): Frames waiting for inference.
+        pending_bytes (int): Image memory held by the waiting frames.
+        busy_seconds (float): Wall time spent in inference.
+        cpu_seconds (float): CPU time of the worker thread spent in inference;
+            MediaPipe helper threads are not included.
+    """
+
+    worker: int
+    sources: int
+    processed_frames: int
+    dropped_frames: int
+    pending_frames: int
+    pending_bytes: int
+    busy_seconds: float
+    cpu_seconds: float
+
+
+class _SourceQueue:
+    jobs: deque[tuple[Frame, PoseCallback]]
+    landmarker: PoseLandmarker
+    preprocessor: InferencePreprocessor
+    last_timestamp_ms: int
+    processed_frames: int
+    dropped_frames: int
+    closed: bool
+
+    def __init__(
+        self,
+        max_pending_frames: int,
+        landmarker: PoseLandmarker,
+        preprocessor: InferencePreprocessor,
+    ) -> None:
+        self.jobs = deque(maxlen=max_pending_frames)
+        self.landmarker = landmarker
+        self.preprocessor = preprocessor
+        self.last_timestamp_ms = -1
+        self.processed_frames = 0
+        self.dropped_frames = 0
+        self.closed = False
+
+
+class DetectorWorker(QtCore.QThread):
+    """Inference thread that serves several frame sources.
+
+    Every source has its own ``PoseLandmarker``, ``InferencePreprocessor``
+    and bounded latest-wins queue, so MediaPipe tracking state never mixes
+    between cameras; the worker shares only its thread. It takes frames
+    from the sources in round-robin order, so a busy camera cannot starve
+    the others. Frames of one source are processed in capture order, and
+    the timestamps passed to its ``detect_for_video`` are kept strictly
+    increasing.
+
+    Signals:
+        pose_ready: Emitted with the detected pose, its frame and the
+            callback submitted with the frame.
+    """
+
+    pose_ready = QtCore.Signal(object, object, object)
+
+    _index: int
+    _landmarker_factory: Callable[[], PoseLandmarker]
+    _max_pending_frames: int
+    _preprocessor_factory: Callable[[], InferencePreprocessor]
+    _lock: QtCore.QMutex
+    _frame_added: QtCore.QWaitCondition
+    _running: bool
+    _sources: dict[object, _SourceQueue]
+    _order: deque[object]
+    _active: _SourceQueue | None
+    _busy_seconds: float
+    _cpu_seconds: float
+
+    def __init__(
+        self,
+        index: int,
+        landmarker_factory: Callable[[], PoseLandmarker],
+        max_pending_frames: int,
+        preprocessor_factory: Callable[[], InferencePreprocessor] = (
+            InferencePreprocessor
+        ),
+        parent: QtCore.QObject | None = None,
+    ) -> None:
+        super().__init__(parent=parent)
+        if max_pending_frames < 1:
+            raise ValueError("max_pending_frames must be positive.")
+        self._index = index
+        self._landmarker_factory = landmarker_factory
+        self._max_pending_frames = max_pending_frames
+        self._preprocessor_factory = preprocessor_factory
+        self._lock = QtCore.QMutex()
+        self._frame_added = QtCore.QWaitCondition()
+        self._running = True
+        self._sources = {}
+        self._order = deque()
+        self._active = None
+        self._busy_seconds = 0.0
+        self._cpu_seconds = 0.0
+
+    @property
+    def source_count(self) -> int:
+        with QtCore.QMutexLocker(self._lock):
+            return len(self._sources)
+
+    def register(self, source: object) -> None:
+        """Add a frame source with its own landmarker."""
+        with QtCore.QMutexLocker(self._lock):
+            if source in self._sources:
+                return
+        # Loading a model is slow, so it happens without blocking inference
+        queue = _SourceQueue(
+            self._max_pending_frames,
+            self._landmarker_factory(),
+            self._preprocessor_factory(),
+        )
+        with QtCore.QMutexLocker(self._lock):
+            self._sources[source] = queue
+            self._order.append(source)
+
+    def unregister(self, source: object) -> None:
+        """Remove a frame source and release its landmarker.
+
+        Pending frames of the source are dropped without callbacks. If the
+        source frame is being processed, the landmarker is released by the
+        worker once the frame is done.
+        """
+        with QtCore.QMutexLocker(self._lock):
+            queue = self._sources.pop(source, None)
+            if queue is None:
+                return
+            self._order.remove(source)
+            queue.jobs.clear()
+            queue.closed = True
+            if queue is self._active:
+                return
+        queue.landmarker.close()
+
+    def add_frame(self, source: object, frame: Frame, callback: PoseCallback) -> None:
+        with QtCore.QMutexLocker(self._lock):
+            queue = self._sources.get(source)
+            if queue is None:
+                return
+            if len(queue.jobs) == queue.jobs.maxlen:
+                queue.dropped_frames += 1
+            queue.jobs.append((frame, callback))
+            self._frame_added.wakeOne()
+
+    def source_counters(self, source: object) -> tuple[int, int]:
+        """Return processed and dropped frame counts of a source."""
+        with QtCore.QMutexLocker(self._lock):
+            queue = self._sources.get(source)
+            if queue is None:
+                return 0, 0
+            return queue.processed_frames, queue.dropped_frames
+
+    def stats(self) -> DetectorWorkerStats:
+        with QtCore.QMutexLocker(self._lock):
+            queues = list(self._sources.values())
+            return DetectorWorkerStats(
+                worker=self._index,
+                sources=len(queues),
+                processed_frames=sum(q.processed_frames for q in queues),
+                dropped_frames=sum(q.dropped_frames for q in queues),
+                pending_frames=sum(len(q.jobs) for q in queues),
+                pending_bytes=sum(
+                    frame.raw.nbytes for q in queues for frame, _ in q.jobs
+                ),
+                busy_seconds=self._busy_seconds,
+                cpu_seconds=self._cpu_seconds,
+            )
+
+    @QtCore.Slot()
+    def run(self) -> None:
+        while True:
+            self._lock.lock()
+            job = self._next_job()
+            while self._running and job is None:
+                self._frame_added.wait(self._lock)
+                job = self._next_job()
+            if not self._running or job is None:
+                self._lock.unlock()
+                break
+            queue, frame, callback = job
+            timestamp_ms = max(frame.timestamp_ms, queue.last_timestamp_ms + 1)
+            queue.last_timestamp_ms = timestamp_ms
+            self._active = queue
+            self._lock.unlock()
+
+            started = time.perf_counter()
+            started_cpu = time.thread_time()
+            result = self._detect(queue, frame, timestamp_ms)
+
+            self._lock.lock()
+            self._busy_seconds += time.perf_counter() - started
+            self._cpu_seconds += time.thread_time() - started_cpu
+            queue.processed_frames += 1
+            self._active = None
+            closed = queue.closed
+            self._lock.unlock()
+            if closed:
+                queue.landmarker.close()
+                continue
+            self.pose_ready.emit(result, frame, callback)
+
+        with QtCore.QMutexLocker(self._lock):
+            queues = list(self._sources.values())
+            self._sources.clear()
+            self._order.clear()
+        for queue in queues:
+            queue.landmarker.close()
+
+    def stop(self) -> None:
+        with QtCore.QMutexLocker(self._lock):
+            self._running = False
+            for queue in self._sources.values():
+                queue.jobs.clear()
+            self._frame_added.wakeAll()
+
+    def _next_job(self) -> tuple[_SourceQueue, Frame, PoseCallback] | None:
+        for _ in range(len(self._order)):
+            source = self._order[0]
+            self._order.rotate(-1)
+            queue = self._sources[source]
+            if queue.jobs:
+                frame, callback = queue.jobs.popleft()
+                return queue, frame, callback
+        return None
+
+    def _detect(
+        self, queue: _SourceQueue, frame: Frame, timestamp_ms: int
+    ) -> Pose | None:
+        preprocessor = queue.preprocessor
+        image, region = preprocessor.prepare(FrameConverter.to_ndarray(frame))
+        mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=image)
+        result = queue.landmarker.detect_for_video(mp_image, timestamp_ms=timestamp_ms)
+        if len(result.pose_landmarks) == 0:
+            preprocessor.track(None)
+            return None
+        landmarks = [
+            region.to_frame(
+                Landmark(
+                    x=landmark.x,
+                    y=landmark.y,
+                    z=landmark.z,
+                    visibility=landmark.visibility,
+                    presence=landmark.presence,
+                )
+            )
+            for landmark in result.pose_landmarks[0]
+        ]
+        preprocessor.track(landmarks)
+
+        return Pose(landmarks, frame.timestamp_ms)
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 import requests
@@ -10,20 +11,44 @@ from mediapipe.tasks.python.vision.pose_landmarker import (
     PoseLandmarkerOptions,
 )
 
+from .inference_image import InferencePreprocessor
+from .mediapipe_detector_pool import MediaPipeDetectorPool
+from .mediapipe_detector_worker import DetectorWorkerStats
 from .mediapipe_pose_detector import MediaPipePoseDetector
+from .pose_detector_settings import PoseDetectorSettings
 
-_MODEL_ASSET_PATH = "assets/pose_landmarker.task"
-_MODEL_URL = "https://storage.googleapis.com/mediapipe-models/pose_landmarker/pose_landmarker_full/float16/latest/pose_landmarker_full.task"
+_MODEL_ASSET_PATH = "assets/pose_landmarker_{model}.task"
+_MODEL_URL = "https://storage.googleapis.com/mediapipe-models/pose_landmarker/pose_landmarker_{model}/float16/latest/pose_landmarker_{model}.task"
 
 
 class MediaPipePoseDetectorFactory:
+    _settings: PoseDetectorSettings
     _model_path: Path
+    _pool: MediaPipeDetectorPool | None
 
-    def __init__(self) -> None:
+    def __init__(self, settings: PoseDetectorSettings) -> None:
+        self._settings = settings
         project_root = Path(__file__).resolve().parents[4]
-        self._model_path = project_root / _MODEL_ASSET_PATH
+        self._model_path = project_root / _MODEL_ASSET_PATH.format(
+            model=settings.pose_model
+        )
+        self._pool = None
 
     def create(self) -> MediaPipePoseDetector:
+        if self._pool is None:
+            self._pool = MediaPipeDetectorPool(
+                self.create_landmarker,
+                self._pool_size(),
+                self._settings.max_pending_frames,
+                self.create_preprocessor,
+            )
+        return self._pool.acquire()
+
+    def create_landmarker(self) -> PoseLandmarker:
+        """Create a landmarker in ``VIDEO`` mode configured by the settings.
+
+        The model of the selected variant is downloaded on first use.
+        """
         if not self._is_model_loaded():
             self._load_model()
 
@@ -31,18 +56,42 @@ class MediaPipePoseDetectorFactory:
         options = PoseLandmarkerOptions(
             base_options=base_options,
             running_mode=VisionTaskRunningMode.VIDEO,
-            output_segmentation_masks=True,
+            min_pose_detection_confidence=self._settings.min_pose_detection_confidence,
+            min_pose_presence_confidence=self._settings.min_pose_presence_confidence,
+            min_tracking_confidence=self._settings.min_tracking_confidence,
+            output_segmentation_masks=self._settings.segmentation_masks,
+        )
+
+        return PoseLandmarker.create_from_options(options)
+
+    def create_preprocessor(self) -> InferencePreprocessor:
+        """Create the frame preprocessing of one camera."""
+        return InferencePreprocessor(
+            self._settings.inference_max_side, self._settings.roi_padding
         )
 
-        pose_landmarker = PoseLandmarker.create_from_options(options)
-        return MediaPipePoseDetector(pose_landmarker)
+    def stats(self) -> list[DetectorWorkerStats]:
+        return self._pool.stats() if self._pool is not None else []
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+    def _pool_size(self) -> int:
+        # Without an explicit setting every camera gets its own worker until
+        # the workers outnumber the CPU cores.
+        if self._settings.detector_workers is not None:
+            return self._settings.detector_workers
+        return os.cpu_count() or 1
 
     def _is_model_loaded(self) -> bool:
         return self._model_path.is_file() and self._model_path.stat().st_size > 0
 
     def _load_model(self) -> None:
         self._model_path.parent.mkdir(parents=True, exist_ok=True)
-        with requests.get(_MODEL_URL, timeout=20) as response:
+        url = _MODEL_URL.format(model=self._settings.pose_model)
+        with requests.get(url, timeout=20) as response:
             response.raise_for_status()
             with open(self._model_path, "wb") as model_file:
                 model_file.write(response.content)
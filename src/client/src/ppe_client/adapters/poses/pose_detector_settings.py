@@ -0,0 +1,19 @@
+from typing import Literal
+
+from pydantic.v1 import BaseSettings
+
+
+class PoseDetectorSettings(BaseSettings):
+    pose_model: Literal["lite", "full", "heavy"] = "full"
+    segmentation_masks: bool = False
+    inference_max_side: int | None = None
+    roi_padding: float | None = None
+    min_pose_detection_confidence: float = 0.5
+    min_pose_presence_confidence: float = 0.5
+    min_tracking_confidence: float = 0.5
+    # None: one worker per camera, at most one per CPU core
+    detector_workers: int | None = None
+    max_pending_frames: int = 1
+
+    class Config:
+        env_file = ".env"
@@ -10,9 +10,14 @@ class FrameOrigin(Enum):
 
 @dataclass(frozen=True, slots=True)
 class Frame:
-    """DTO that transfers raw data from camera."""
+    """DTO that transfers raw data from camera.
 
-    raw: bytes
+    ``raw`` is a read-only view of the captured image buffer, so capture,
+    detection and display share one buffer without copying it. Consumers that
+    need to modify the image must copy it first.
+    """
+
+    raw: memoryview
     shape: tuple[int, int, int]
     timestamp_ms: int
     origin: FrameOrigin
@@ -10,6 +10,12 @@ class PoseDetector(Protocol):
 
     def detect(
         self, frame: Frame, callback: Callable[[Pose | None, Frame], None]
-    ) -> None: ...
+    ) -> None:
+        """Queue a frame for detection.
+
+        The callback is invoked once the frame is processed. A detector may
+        drop frames it cannot keep up with; their callbacks are never invoked.
+        """
+        ...
 
     def close(self) -> None: ...
@@ -7,3 +7,5 @@ class PoseDetectorFactory(Protocol):
     """Port that creates a pose detector instance for worker runtime."""
 
     def create(self) -> PoseDetector: ...
+
+    def close(self) -> None: ...
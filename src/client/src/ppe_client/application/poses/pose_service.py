@@ -32,6 +32,12 @@ class PoseService:
             frame, lambda p, f: self._on_pose_detected(camera, p, f, callback)
         )
 
+    def close(self) -> None:
+        for detector in self._detectors.values():
+            detector.close()
+        self._detectors.clear()
+        self._detector_factory.close()
+
     def _get_detector_for(self, camera: CameraDescriptor) -> PoseDetector:
         if camera.identity not in self._detectors:
             self._detectors[camera.identity] = self._detector_factory.create()
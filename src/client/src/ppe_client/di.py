@@ -10,7 +10,10 @@ from ppe_client.adapters.cameras.open_cv import (
     OpenCVCameraSessionFactory,
 )
 from ppe_client.adapters.network import ExerciseSession, NetworkSettings
-from ppe_client.adapters.poses import MediaPipePoseDetectorFactory
+from ppe_client.adapters.poses import (
+    MediaPipePoseDetectorFactory,
+    PoseDetectorSettings,
+)
 from ppe_client.adapters.poses.restoration import PoseRestorer
 from ppe_client.adapters.sensors import (
     BleakSensorRegistry,
@@ -47,6 +50,7 @@ injectables = [
     injectable(RefCountedCameraSessionStorage, as_type=CameraSessionStorage),
     injectable(OpenCVCameraSessionFactory, as_type=CameraSessionFactory),
     injectable(CameraSessionService),
+    injectable(PoseDetectorSettings),
     injectable(MediaPipePoseDetectorFactory, as_type=PoseDetectorFactory),
     injectable(PoseRestorer),
     injectable(MeanSensorCalibrator, as_type=SensorCalibrator),
@@ -3,6 +3,7 @@ import asyncio
 from PySide6 import QtWidgets
 from qasync import QEventLoop
 
+from ppe_client.application.poses import PoseService
 from ppe_client.presentation import MainWindow
 
 from .di import create_container
@@ -22,6 +23,8 @@ def main() -> None:
         with loop:
             loop.run_forever()
 
+        scope.get(PoseService).close()
+
 
 if __name__ == "__main__":
     main()
@@ -129,11 +129,7 @@ class TrainingViewModel(ViewModel[TrainingPayload]):
             AsyncPoseReceiverWrapper(lambda p, _: synchronizer.append_pose(p))
         )
         try:
-            while True:
-                feedback = await self._exercise_session.receive_feedbacks(
-                    self._synchronizer.queue
-                )
-                self._on_feedback(feedback)
+            await self._exercise_session.stream_feedbacks(self._synchronizer.queue)
         finally:
             await self._synchronizer.stop()
             self._synchronizer = None
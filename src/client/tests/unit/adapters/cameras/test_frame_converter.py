@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+from PySide6 import QtWidgets
+
+from ppe_client.adapters.cameras.frame_converter import FrameConverter
+from ppe_client.application.cameras import FrameOrigin
+
+TIMESTAMP_MS = 10
+
+
+def make_image() -> np.ndarray:
+    return np.arange(4 * 6 * 3, dtype=np.uint8).reshape(4, 6, 3)
+
+
+def test_from_ndarray_should_share_image_buffer() -> None:
+    image = make_image()
+
+    frame = FrameConverter.from_ndarray(image, TIMESTAMP_MS, FrameOrigin.CV2)
+
+    assert np.shares_memory(FrameConverter.to_ndarray(frame), image)
+    assert frame.shape == image.shape
+    assert frame.timestamp_ms == TIMESTAMP_MS
+
+
+def test_frame_buffer_should_be_read_only() -> None:
+    frame = FrameConverter.from_ndarray(make_image(), TIMESTAMP_MS, FrameOrigin.CV2)
+    array = FrameConverter.to_ndarray(frame)
+
+    assert frame.raw.readonly
+    with pytest.raises(ValueError):
+        array[0, 0, 0] = 255
+
+
+def test_from_ndarray_should_copy_non_contiguous_image() -> None:
+    image = make_image()[:, ::2]
+
+    frame = FrameConverter.from_ndarray(image, TIMESTAMP_MS, FrameOrigin.CV2)
+
+    assert np.array_equal(FrameConverter.to_ndarray(frame), image)
+    assert frame.shape == (4, 3, 3)
+
+
+def test_to_pixel_map_should_read_frame_buffer(
+    qapp: QtWidgets.QApplication,
+) -> None:
+    frame = FrameConverter.from_ndarray(make_image(), TIMESTAMP_MS, FrameOrigin.CV2)
+
+    pixel_map = FrameConverter.to_pixel_map(frame)
+
+    assert (pixel_map.width(), pixel_map.height()) == (6, 4)
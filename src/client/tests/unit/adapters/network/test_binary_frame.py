@@ -0,0 +1,84 @@
+import numpy as np
+
+from ppe_client.adapters.network.binary_frame import (
+    FLAG_SEQUENCE,
+    FRAME_HEADER,
+    FRAME_SEQUENCE,
+    FRAME_VERSION,
+    LANDMARK_DTYPE,
+    ZONE_CODES,
+    encode_binary_frame,
+)
+from ppe_client.adapters.network.mappers import map_to_binary_frame
+from ppe_client.application.poses import Landmark, Pose
+from ppe_client.application.process_data import EmgReading, ProcessData
+from ppe_client.application.sensors.calibration.calibration_data import ValueZone
+
+LANDMARKS_COUNT = 33
+SEQ = 7
+
+# version 1, one landmark, one emg, seq flag | seq 7 | (0.5, -1.0, 2.0) | Red "bi"
+GOLDEN_FRAME = bytes.fromhex("01010101070000000000003f000080bf0000004002026269")
+
+
+def make_data(emgs: list[EmgReading]) -> ProcessData:
+    landmarks = [
+        Landmark(x=i / LANDMARKS_COUNT, y=1 - i / LANDMARKS_COUNT, z=-0.5 * i)
+        for i in range(LANDMARKS_COUNT)
+    ]
+    return ProcessData(pose=Pose(landmarks, 0), emgs=emgs)
+
+
+def test_encoder_should_produce_golden_bytes() -> None:
+    frame = encode_binary_frame(
+        np.array([[0.5, -1.0, 2.0]]), [("bi", ValueZone.RED.value)], seq=SEQ
+    )
+
+    assert frame == GOLDEN_FRAME
+
+
+def test_mapper_should_lay_out_landmarks_and_known_zone_emgs() -> None:
+    data = make_data(
+        [
+            EmgReading("biceps", ValueZone.GREEN),
+            EmgReading("трицепс", ValueZone.RED),
+            EmgReading("uncalibrated", ValueZone.UNKNOWN),
+        ]
+    )
+
+    frame = map_to_binary_frame(data, seq=SEQ)
+
+    version, landmarks_count, emgs_count, flags = FRAME_HEADER.unpack_from(frame)
+    assert (version, landmarks_count, emgs_count) == (FRAME_VERSION, LANDMARKS_COUNT, 2)
+    assert flags & FLAG_SEQUENCE
+    assert FRAME_SEQUENCE.unpack_from(frame, FRAME_HEADER.size) == (SEQ,)
+
+    offset = FRAME_HEADER.size + FRAME_SEQUENCE.size
+    points = np.frombuffer(
+        frame, dtype=LANDMARK_DTYPE, count=landmarks_count * 3, offset=offset
+    ).reshape(landmarks_count, 3)
+    expected = np.array(
+        [(lm.x, lm.y, lm.z) for lm in data.pose.landmarks], dtype=LANDMARK_DTYPE
+    )
+    np.testing.assert_array_equal(points, expected)
+
+    offset += points.nbytes
+    emgs = []
+    for _ in range(emgs_count):
+        zone, name_length = frame[offset], frame[offset + 1]
+        name = frame[offset + 2 : offset + 2 + name_length].decode("utf-8")
+        emgs.append((name, zone))
+        offset += 2 + name_length
+    assert emgs == [("biceps", ZONE_CODES["Green"]), ("трицепс", ZONE_CODES["Red"])]
+    assert offset == len(frame)
+
+
+def test_mapper_should_omit_seq_when_not_given() -> None:
+    frame = map_to_binary_frame(make_data([]))
+
+    _, landmarks_count, emgs_count, flags = FRAME_HEADER.unpack_from(frame)
+    assert flags & FLAG_SEQUENCE == 0
+    assert emgs_count == 0
+    assert (
+        len(frame) == FRAME_HEADER.size + landmarks_count * 3 * LANDMARK_DTYPE.itemsize
+    )
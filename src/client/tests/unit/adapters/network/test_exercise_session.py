@@ -0,0 +1,235 @@
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+from typing import Literal, cast
+
+import pytest
+from websockets.asyncio.client import ClientConnection
+
+from ppe_client.adapters.network.exersice_session import ExerciseSession
+from ppe_client.adapters.network.network_settings import NetworkSettings
+from ppe_client.application.feedback import Feedback
+from ppe_client.application.poses import Landmark, Pose
+from ppe_client.application.process_data import ProcessData
+
+LANDMARKS_COUNT = 33
+WINDOW = 2
+
+
+class FakeWebSocket:
+    """JSON connection that records sent frames and replays queued responses."""
+
+    subprotocol = None
+
+    def __init__(self) -> None:
+        self.sent: list[dict[str, object]] = []
+        self._responses: asyncio.Queue[str] = asyncio.Queue()
+
+    async def send(self, message: str) -> None:
+        self.sent.append(json.loads(message))
+
+    def respond(self, seq: int | None) -> None:
+        payload: dict[str, object] = {"feedbacks": []}
+        if seq is not None:
+            payload["seq"] = seq
+        self._responses.put_nowait(json.dumps(payload))
+
+    def fail(self, seq: int | None) -> None:
+        payload: dict[str, object] = {"error": "Invalid frame"}
+        if seq is not None:
+            payload["seq"] = seq
+        self._responses.put_nowait(json.dumps(payload))
+
+    def __aiter__(self) -> "FakeWebSocket":
+        return self
+
+    async def __anext__(self) -> str:
+        return await self._responses.get()
+
+    @property
+    def sent_seqs(self) -> list[object]:
+        return [message["seq"] for message in self.sent]
+
+    @property
+    def sent_frames(self) -> list[float]:
+        return [
+            cast(list[list[float]], message["landmarks"])[0][0] for message in self.sent
+        ]
+
+
+def make_data(frame: int) -> ProcessData:
+    landmarks = [Landmark(x=float(frame), y=0.0, z=0.0)] * LANDMARKS_COUNT
+    return ProcessData(pose=Pose(landmarks, frame), emgs=[])
+
+
+async def settle() -> None:
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+def run_streaming(
+    window: int,
+    drop_policy: Literal["drop_oldest", "block"],
+    scenario: Callable[
+        [ExerciseSession, FakeWebSocket, asyncio.Queue[ProcessData]], Awaitable[None]
+    ],
+    callback: Callable[[list[Feedback]], None] | None = None,
+) -> None:
+    async def main() -> None:
+        settings = NetworkSettings(pipeline_window=window, drop_policy=drop_policy)
+        session = ExerciseSession(settings)
+        websocket = FakeWebSocket()
+        session.websocket = cast(ClientConnection, websocket)
+        session._callback = callback
+        queue: asyncio.Queue[ProcessData] = asyncio.Queue()
+        stream = asyncio.create_task(session.stream_feedbacks(queue))
+        try:
+            await scenario(session, websocket, queue)
+        finally:
+            stream.cancel()
+            await asyncio.gather(stream, return_exceptions=True)
+
+    asyncio.run(main())
+
+
+def test_sender_should_stop_at_window_and_resume_on_cumulative_ack() -> None:
+    async def scenario(
+        session: ExerciseSession,
+        websocket: FakeWebSocket,
+        queue: asyncio.Queue[ProcessData],
+    ) -> None:
+        for frame in range(4):
+            queue.put_nowait(make_data(frame))
+        await settle()
+        assert websocket.sent_seqs == [0, 1]
+        assert session.in_flight == WINDOW
+
+        websocket.respond(1)
+        await settle()
+        assert websocket.sent_seqs == [0, 1, 2, 3]
+        assert session.in_flight == WINDOW
+
+        websocket.respond(3)
+        await settle()
+        assert session.in_flight == 0
+        assert session.dropped_frames == 0
+
+    run_streaming(WINDOW, "block", scenario)
+
+
+def test_response_without_known_seq_should_release_oldest_frame() -> None:
+    async def scenario(
+        session: ExerciseSession,
+        websocket: FakeWebSocket,
+        queue: asyncio.Queue[ProcessData],
+    ) -> None:
+        for frame in range(3):
+            queue.put_nowait(make_data(frame))
+        await settle()
+
+        websocket.respond(None)
+        websocket.respond(42)
+        await settle()
+
+        assert session.in_flight == 1
+
+    run_streaming(4, "block", scenario)
+
+
+def test_drop_oldest_should_send_only_latest_frame_when_window_opens() -> None:
+    async def scenario(
+        session: ExerciseSession,
+        websocket: FakeWebSocket,
+        queue: asyncio.Queue[ProcessData],
+    ) -> None:
+        stale, latest = (1, 2), 3
+        queue.put_nowait(make_data(0))
+        await settle()
+        for frame in (*stale, latest):
+            queue.put_nowait(make_data(frame))
+        await settle()
+        assert websocket.sent_frames == [0.0]
+
+        websocket.respond(0)
+        await settle()
+
+        assert websocket.sent_frames == [0.0, float(latest)]
+        assert websocket.sent_seqs == [0, 1]
+        assert session.dropped_frames == len(stale)
+
+    run_streaming(1, "drop_oldest", scenario)
+
+
+def test_block_policy_should_send_every_frame() -> None:
+    async def scenario(
+        session: ExerciseSession,
+        websocket: FakeWebSocket,
+        queue: asyncio.Queue[ProcessData],
+    ) -> None:
+        for frame in range(3):
+            queue.put_nowait(make_data(frame))
+        for seq in range(3):
+            await settle()
+            websocket.respond(seq)
+        await settle()
+
+        assert websocket.sent_frames == [0.0, 1.0, 2.0]
+        assert session.dropped_frames == 0
+
+    run_streaming(1, "block", scenario)
+
+
+def test_feedback_should_be_delivered_to_callback() -> None:
+    delivered: list[list[Feedback]] = []
+
+    async def scenario(
+        session: ExerciseSession,
+        websocket: FakeWebSocket,
+        queue: asyncio.Queue[ProcessData],
+    ) -> None:
+        queue.put_nowait(make_data(0))
+        await settle()
+        websocket.respond(0)
+        await settle()
+
+        assert delivered == [[]]
+
+    run_streaming(1, "block", scenario, delivered.append)
+
+
+def test_error_for_frame_should_release_it_and_keep_streaming() -> None:
+    delivered: list[list[Feedback]] = []
+
+    async def scenario(
+        session: ExerciseSession,
+        websocket: FakeWebSocket,
+        queue: asyncio.Queue[ProcessData],
+    ) -> None:
+        for frame in range(3):
+            queue.put_nowait(make_data(frame))
+        await settle()
+
+        websocket.fail(0)
+        await settle()
+        assert websocket.sent_seqs == [0, 1, 2]
+        assert session.rejected_frames == 1
+
+        websocket.respond(2)
+        await settle()
+        assert session.in_flight == 0
+        assert delivered == [[]]
+
+    run_streaming(WINDOW, "block", scenario, delivered.append)
+
+
+def test_error_without_seq_should_end_stream() -> None:
+    async def main() -> None:
+        session = ExerciseSession(NetworkSettings())
+        websocket = FakeWebSocket()
+        session.websocket = cast(ClientConnection, websocket)
+        websocket.fail(None)
+
+        with pytest.raises(RuntimeError, match="Invalid frame"):
+            await session.stream_feedbacks(asyncio.Queue())
+
+    asyncio.run(main())
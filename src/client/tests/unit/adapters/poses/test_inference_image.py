@@ -0,0 +1,133 @@
+import numpy as np
+import pytest
+
+from ppe_client.adapters.poses.inference_image import (
+    FULL_FRAME,
+    InferencePreprocessor,
+    Region,
+    downscale,
+)
+from ppe_client.application.poses import Landmark
+
+FRAME_HEIGHT = 200
+FRAME_WIDTH = 400
+INFERENCE_MAX_SIDE = 80
+VISIBILITY = 0.9
+PRESENCE = 0.8
+
+
+def make_image() -> np.ndarray:
+    return np.zeros((FRAME_HEIGHT, FRAME_WIDTH, 3), dtype=np.uint8)
+
+
+def landmarks_at(*points: tuple[float, float]) -> list[Landmark]:
+    return [Landmark(x=x, y=y, z=0.0) for x, y in points]
+
+
+def test_downscale_should_keep_small_image_unchanged() -> None:
+    image = make_image()
+
+    assert downscale(image, FRAME_WIDTH) is image
+    assert downscale(image, None) is image
+
+
+def test_downscale_should_limit_longer_side_and_keep_aspect_ratio() -> None:
+    resized = downscale(make_image(), 100)
+
+    assert resized.shape == (50, 100, 3)
+
+
+def test_to_frame_should_map_region_coordinates_into_frame() -> None:
+    region = Region(left=0.25, top=0.5, width=0.5, height=0.25)
+
+    mapped = region.to_frame(
+        Landmark(x=0.5, y=1.0, z=0.2, visibility=VISIBILITY, presence=PRESENCE)
+    )
+
+    assert mapped.x == pytest.approx(0.5)
+    assert mapped.y == pytest.approx(0.75)
+    assert mapped.z == pytest.approx(0.1)
+    assert mapped.visibility == VISIBILITY
+    assert mapped.presence == PRESENCE
+
+
+def test_to_frame_should_be_identity_for_full_frame() -> None:
+    landmark = Landmark(x=0.3, y=0.7, z=-0.1)
+
+    assert FULL_FRAME.to_frame(landmark) == landmark
+
+
+def test_prepare_should_use_full_frame_until_pose_is_tracked() -> None:
+    preprocessor = InferencePreprocessor(roi_padding=0.25)
+
+    image, region = preprocessor.prepare(make_image())
+
+    assert image.shape == (FRAME_HEIGHT, FRAME_WIDTH, 3)
+    assert region == FULL_FRAME
+
+
+def test_prepare_should_crop_to_padded_bounding_box_of_tracked_pose() -> None:
+    preprocessor = InferencePreprocessor(roi_padding=0.25)
+    preprocessor.track(landmarks_at((0.4, 0.2), (0.6, 0.6)))
+
+    image, region = preprocessor.prepare(make_image())
+
+    # padding = 0.25 * max(0.2, 0.4) = 0.1 on every side
+    assert region.left == pytest.approx(0.3)
+    assert region.top == pytest.approx(0.1)
+    assert region.width == pytest.approx(0.4)
+    assert region.height == pytest.approx(0.6)
+    assert image.shape == (120, 160, 3)
+    assert image.flags.c_contiguous
+
+
+def test_prepare_should_clamp_crop_to_frame_edges() -> None:
+    preprocessor = InferencePreprocessor(roi_padding=0.5)
+    preprocessor.track(landmarks_at((0.0, 0.1), (0.4, 0.9)))
+
+    image, region = preprocessor.prepare(make_image())
+
+    assert region.left == 0.0
+    assert region.top == 0.0
+    assert region.left + region.width == pytest.approx(0.8)
+    assert region.top + region.height == pytest.approx(1.0)
+    assert image.shape == (FRAME_HEIGHT, 320, 3)
+
+
+def test_prepare_should_return_to_full_frame_when_pose_is_lost() -> None:
+    preprocessor = InferencePreprocessor(roi_padding=0.25)
+    preprocessor.track(landmarks_at((0.4, 0.2), (0.6, 0.6)))
+
+    preprocessor.track(None)
+    _, region = preprocessor.prepare(make_image())
+
+    assert region == FULL_FRAME
+
+
+def test_prepare_should_not_crop_without_padding_setting() -> None:
+    preprocessor = InferencePreprocessor()
+    preprocessor.track(landmarks_at((0.4, 0.2), (0.6, 0.6)))
+
+    _, region = preprocessor.prepare(make_image())
+
+    assert region == FULL_FRAME
+
+
+def test_region_should_map_point_in_inference_image_back_to_frame() -> None:
+    preprocessor = InferencePreprocessor(max_side=INFERENCE_MAX_SIDE, roi_padding=0.25)
+    preprocessor.track(landmarks_at((0.4, 0.2), (0.6, 0.6)))
+    frame = make_image()
+    row, column = 90, 210
+    frame[row - 2 : row + 3, column - 2 : column + 3] = 255
+
+    image, region = preprocessor.prepare(frame)
+    rows, columns = np.nonzero(image[:, :, 0])
+    height, width = image.shape[:2]
+    in_region = Landmark(
+        x=(columns.mean() + 0.5) / width, y=(rows.mean() + 0.5) / height, z=0.0
+    )
+    in_frame = region.to_frame(in_region)
+
+    assert max(image.shape[:2]) == INFERENCE_MAX_SIDE
+    assert in_frame.x == pytest.approx((column + 0.5) / FRAME_WIDTH, abs=0.01)
+    assert in_frame.y == pytest.approx((row + 0.5) / FRAME_HEIGHT, abs=0.01)
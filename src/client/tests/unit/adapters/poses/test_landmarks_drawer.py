@@ -0,0 +1,26 @@
+import numpy as np
+
+from ppe_client.adapters.cameras.frame_converter import FrameConverter
+from ppe_client.adapters.poses.landmarks_drawer import LandmarksDrawer
+from ppe_client.application.cameras import FrameOrigin
+from ppe_client.application.poses import Landmark, Pose
+
+LANDMARKS_COUNT = 33
+
+
+def test_draw_should_leave_shared_frame_untouched() -> None:
+    image = np.zeros((64, 64, 3), dtype=np.uint8)
+    frame = FrameConverter.from_ndarray(image, 10, FrameOrigin.CV2)
+    pose = Pose(
+        [
+            Landmark(x=0.5, y=i / LANDMARKS_COUNT, z=0.0, visibility=1.0)
+            for i in range(LANDMARKS_COUNT)
+        ],
+        10,
+    )
+
+    drawn = LandmarksDrawer.draw(pose, frame)
+
+    assert not image.any()
+    assert FrameConverter.to_ndarray(drawn).any()
+    assert not np.shares_memory(FrameConverter.to_ndarray(drawn), image)
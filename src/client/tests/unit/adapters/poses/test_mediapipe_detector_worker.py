@@ -0,0 +1,165 @@
+import time
+from types import SimpleNamespace
+
+import mediapipe as mp
+import numpy as np
+from PySide6 import QtCore
+
+from ppe_client.adapters.cameras.frame_converter import FrameConverter
+from ppe_client.adapters.poses.mediapipe_detector_worker import (
+    DetectorWorker,
+    PoseCallback,
+)
+from ppe_client.application.cameras import Frame, FrameOrigin
+from ppe_client.application.poses import Pose
+
+
+class FakeLandmarker:
+    """Landmarker that finds no pose and records the timestamps it saw."""
+
+    def __init__(self) -> None:
+        self.timestamps: list[int] = []
+        self.closed = False
+
+    def detect_for_video(self, image: mp.Image, timestamp_ms: int) -> SimpleNamespace:
+        self.timestamps.append(timestamp_ms)
+        return SimpleNamespace(pose_landmarks=[])
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeLandmarkerFactory:
+    def __init__(self) -> None:
+        self.created: list[FakeLandmarker] = []
+
+    def __call__(self) -> FakeLandmarker:
+        landmarker = FakeLandmarker()
+        self.created.append(landmarker)
+        return landmarker
+
+
+def make_frame(timestamp_ms: int) -> Frame:
+    image = np.zeros((4, 4, 3), dtype=np.uint8)
+    return FrameConverter.from_ndarray(image, timestamp_ms, FrameOrigin.CV2)
+
+
+def make_worker(
+    factory: FakeLandmarkerFactory, max_pending_frames: int = 1
+) -> DetectorWorker:
+    return DetectorWorker(0, factory, max_pending_frames)
+
+
+def ignore_pose(*_: object) -> None:
+    pass
+
+
+def wait_processed(worker: DetectorWorker, source: object, count: int) -> None:
+    deadline = time.monotonic() + 5
+    while worker.source_counters(source)[0] < count:
+        assert time.monotonic() < deadline, "worker did not process the frames"
+        time.sleep(0.01)
+
+
+def test_every_source_gets_its_own_landmarker() -> None:
+    factory = FakeLandmarkerFactory()
+    worker = make_worker(factory)
+    first, second = object(), object()
+
+    worker.register(first)
+    worker.register(second)
+    worker.register(first)
+
+    assert [landmarker.closed for landmarker in factory.created] == [False, False]
+
+
+def test_unregister_releases_the_source_landmarker() -> None:
+    factory = FakeLandmarkerFactory()
+    worker = make_worker(factory)
+    first, second = object(), object()
+    worker.register(first)
+    worker.register(second)
+
+    worker.unregister(first)
+
+    assert [landmarker.closed for landmarker in factory.created] == [True, False]
+
+
+def test_next_job_serves_sources_round_robin() -> None:
+    worker = make_worker(FakeLandmarkerFactory(), max_pending_frames=3)
+    busy, quiet = object(), object()
+    worker.register(busy)
+    worker.register(quiet)
+    for timestamp in (1, 2, 3):
+        worker.add_frame(busy, make_frame(timestamp), ignore_pose)
+    worker.add_frame(quiet, make_frame(10), ignore_pose)
+
+    order = []
+    while (job := worker._next_job()) is not None:
+        order.append(job[1].timestamp_ms)
+
+    assert order == [1, 10, 2, 3]
+
+
+def test_timestamps_are_kept_increasing_per_source() -> None:
+    factory = FakeLandmarkerFactory()
+    worker = make_worker(factory)
+    first, second = object(), object()
+    worker.register(first)
+    worker.register(second)
+    worker.start()
+    try:
+        for count, timestamp in enumerate((100, 100, 90), start=1):
+            worker.add_frame(first, make_frame(timestamp), ignore_pose)
+            worker.add_frame(second, make_frame(timestamp), ignore_pose)
+            wait_processed(worker, first, count)
+            wait_processed(worker, second, count)
+    finally:
+        worker.stop()
+        worker.wait()
+
+    assert factory.created[0].timestamps == [100, 101, 102]
+    assert factory.created[1].timestamps == [100, 101, 102]
+    assert all(landmarker.closed for landmarker in factory.created)
+
+
+def test_full_queue_should_drop_oldest_frame() -> None:
+    worker = make_worker(FakeLandmarkerFactory(), max_pending_frames=2)
+    source = object()
+    worker.register(source)
+
+    for timestamp in (1, 2, 3, 4):
+        worker.add_frame(source, make_frame(timestamp), ignore_pose)
+
+    stats = worker.stats()
+    assert worker.source_counters(source) == (0, 2)
+    assert stats.pending_frames == worker._max_pending_frames
+    assert [job[1].timestamp_ms for job in iter(worker._next_job, None)] == [3, 4]
+
+
+def test_worker_should_process_latest_frame_with_its_own_callback() -> None:
+    worker = make_worker(FakeLandmarkerFactory())
+    source = object()
+    worker.register(source)
+    delivered: list[tuple[int, int]] = []
+
+    def deliver(pose: Pose | None, frame: Frame, callback: object) -> None:
+        assert callable(callback)
+        callback(pose, frame)
+
+    def callback_for(timestamp: int) -> PoseCallback:
+        return lambda _pose, frame: delivered.append((timestamp, frame.timestamp_ms))
+
+    worker.pose_ready.connect(deliver, QtCore.Qt.ConnectionType.DirectConnection)
+    for timestamp in (1, 2, 3):
+        worker.add_frame(source, make_frame(timestamp), callback_for(timestamp))
+    worker.start()
+    try:
+        wait_processed(worker, source, 1)
+        counters = worker.source_counters(source)
+    finally:
+        worker.stop()
+        worker.wait()
+
+    assert delivered == [(3, 3)]
+    assert counters == (1, 2)
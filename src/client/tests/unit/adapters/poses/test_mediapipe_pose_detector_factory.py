@@ -0,0 +1,26 @@
+import pytest
+
+from ppe_client.adapters.poses.mediapipe_pose_detector_factory import (
+    MediaPipePoseDetectorFactory,
+)
+from ppe_client.adapters.poses.pose_detector_settings import PoseDetectorSettings
+
+CPU_COUNT = 6
+DETECTOR_WORKERS = 2
+
+
+def test_pool_should_default_to_worker_per_cpu_core(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("os.cpu_count", lambda: CPU_COUNT)
+    factory = MediaPipePoseDetectorFactory(PoseDetectorSettings(detector_workers=None))
+
+    assert factory._pool_size() == CPU_COUNT
+
+
+def test_pool_should_use_configured_worker_count() -> None:
+    factory = MediaPipePoseDetectorFactory(
+        PoseDetectorSettings(detector_workers=DETECTOR_WORKERS)
+    )
+
+    assert factory._pool_size() == DETECTOR_WORKERS
@@ -0,0 +1,127 @@
+import asyncio
+import logging
+from concurrent.futures import Executor
+from dataclasses import dataclass
+
+from application.processor.evaluation_stage import EvaluationStage
+from application.processor.process_context import ProcessContext
+from application.processor.sensor_processor import SensorProcessor
+from domain.model.exercise_state import ExerciseState
+from domain.model.feedback import Feedback
+
+logger = logging.getLogger(__name__)
+
+type _Result = tuple[list[Feedback], ExerciseState]
+
+
+@dataclass(frozen=True)
+class _PendingFrame:
+    processor: SensorProcessor
+    context: ProcessContext
+    state: ExerciseState
+    future: asyncio.Future[_Result]
+
+
+class BatchingEvaluationStage(EvaluationStage):
+    """
+    Собирает кадры разных сессий, пришедшие за один проход цикла событий (или за окно
+    window секунд), и передает кадры каждого процессора одним вызовом
+    process_sessions. Вычисления выполняются в executor, если он задан, иначе прямо в
+    цикле событий.
+    """
+
+    def __init__(self, executor: Executor | None = None, window: float = 0.0) -> None:
+        self._executor = executor
+        self._window = window
+        self._pending: list[_PendingFrame] = []
+        self._flush_scheduled = False
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def process(
+        self, processor: SensorProcessor, context: ProcessContext, state: ExerciseState
+    ) -> tuple[list[Feedback], ExerciseState]:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[_Result] = loop.create_future()
+        self._pending.append(_PendingFrame(processor, context, state, future))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            if self._window > 0:
+                loop.call_later(self._window, self._flush)
+            else:
+                loop.call_soon(self._flush)
+        return await future
+
+    async def process_batch(
+        self,
+        processor: SensorProcessor,
+        contexts: list[ProcessContext],
+        state: ExerciseState,
+    ) -> tuple[list[list[Feedback]], ExerciseState]:
+        if self._executor is None:
+            return processor.process_batch(contexts, state)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, processor.process_batch, contexts, state
+        )
+
+    def _flush(self) -> None:
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, []
+        groups: dict[int, list[_PendingFrame]] = {}
+        for frame in pending:
+            groups.setdefault(id(frame.processor), []).append(frame)
+
+        for frames in groups.values():
+            if self._executor is None:
+                _resolve(frames, _evaluate_group(frames))
+                continue
+            task = asyncio.create_task(self._process_in_executor(frames))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _process_in_executor(self, frames: list[_PendingFrame]) -> None:
+        loop = asyncio.get_running_loop()
+        results = await loop.run_in_executor(self._executor, _evaluate_group, frames)
+        _resolve(frames, results)
+
+
+def _evaluate_group(frames: list[_PendingFrame]) -> list[_Result | Exception]:
+    # Непредвиденная ошибка передается всем кадрам группы, чтобы ни одна сессия не
+    # осталась ждать результата
+    try:
+        return _process_group(frames)
+    except Exception as e:
+        logger.exception("Evaluation of a group of %s frames failed", len(frames))
+        return [e] * len(frames)
+
+
+def _process_group(frames: list[_PendingFrame]) -> list[_Result | Exception]:
+    processor = frames[0].processor
+    items = [(frame.context, frame.state) for frame in frames]
+    try:
+        return list(processor.process_sessions(items))
+    except ValueError:
+        # Некорректный кадр одной сессии не должен ронять кадры остальных сессий
+        # пачки: пачка пересчитывается по кадрам, ошибка достается только его сессии
+        logger.warning(
+            "Batch evaluation of %s frames failed, evaluating frames one by one",
+            len(items),
+            exc_info=True,
+        )
+        results: list[_Result | Exception] = []
+        for context, state in items:
+            try:
+                results.append(processor.process(context, state))
+            except ValueError as e:
+                results.append(e)
+        return results
+
+
+def _resolve(frames: list[_PendingFrame], results: list[_Result | Exception]) -> None:
+    for frame, result in zip(frames, results, strict=True):
+        if frame.future.done():
+            continue
+        if isinstance(result, Exception):
+            frame.future.set_exception(result)
+        else:
+            frame.future.set_result(result)
@@ -4,6 +4,7 @@ from application.processor.process_context import ProcessContext
 from domain.model.exercise_state import ExerciseState
 from domain.service.exercise_state_machine import ExerciseStateMachine
 from application.processor.sensor_processor import SensorProcessor
+from application.tracing.stage_tracer import NULL_STAGE_TRACER, StageTracer
 from domain.model.feedback import Feedback, FeedbackType
 from domain.model.pose_match_result import PoseMatchResult
 from domain.model.pose_rule import PoseRule
@@ -17,16 +18,49 @@ class CameraPoseProcessor(SensorProcessor):
         pose_matcher: PoseMatcher,
         rule_validator: RuleValidator[PoseRule, PoseMatchResult],
         state_machine: ExerciseStateMachine,
+        tracer: StageTracer = NULL_STAGE_TRACER,
     ) -> None:
         self._pose_matcher = pose_matcher
         self._rule_validator = rule_validator
         self._state_machine = state_machine
+        self._tracer = tracer
         self._poses = self._pose_matcher.reference_poses
 
     def process(
         self, context: ProcessContext, state: ExerciseState
     ) -> Tuple[list[Feedback], ExerciseState]:
-        match_result = self._pose_matcher.match(context.pose)
+        with self._tracer.stage("pose_match"):
+            match_result = self._pose_matcher.match(context.pose)
+        return self._process_match(match_result, state)
+
+    def process_batch(
+        self, contexts: list[ProcessContext], state: ExerciseState
+    ) -> tuple[list[list[Feedback]], ExerciseState]:
+        with self._tracer.stage("pose_match"):
+            match_results = self._pose_matcher.match_batch(
+                [context.pose for context in contexts]
+            )
+        feedbacks: list[list[Feedback]] = []
+        for match_result in match_results:
+            frame_feedbacks, state = self._process_match(match_result, state)
+            feedbacks.append(frame_feedbacks)
+        return feedbacks, state
+
+    def process_sessions(
+        self, items: list[tuple[ProcessContext, ExerciseState]]
+    ) -> list[tuple[list[Feedback], ExerciseState]]:
+        with self._tracer.stage("pose_match"):
+            match_results = self._pose_matcher.match_batch(
+                [context.pose for context, _ in items]
+            )
+        return [
+            self._process_match(match_result, state)
+            for match_result, (_, state) in zip(match_results, items, strict=True)
+        ]
+
+    def _process_match(
+        self, match_result: PoseMatchResult, state: ExerciseState
+    ) -> tuple[list[Feedback], ExerciseState]:
         expected_pose = self._poses[state.current_pose_index]
         is_pose_matched = match_result.pose.id == expected_pose.id
         if not is_pose_matched:
@@ -39,7 +73,8 @@ class CameraPoseProcessor(SensorProcessor):
                     message=f"Сейчас нужно перейти в позу {expected_pose.name}",
                 )
             ], new_state
-        violations = self._rule_validator.validate(match_result)
+        with self._tracer.stage("rule_validation"):
+            violations = self._rule_validator.validate(match_result)
         is_pose_correct = len(violations) == 0
         new_state = self._state_machine.update(
             state, is_pose_matched=is_pose_matched, is_pose_correct=is_pose_correct
@@ -1,6 +1,16 @@
+import threading
+from collections.abc import Hashable, Iterator
+from contextlib import contextmanager
+
 from application.processor.camera.camera_pose_processor import CameraPoseProcessor
+from application.processor.processor_cache import (
+    ProcessorCache,
+    ProcessorCacheStats,
+)
 from application.processor.sensor_processor import SensorProcessorFactory
+from application.tracing.stage_tracer import NULL_STAGE_TRACER, StageTracer
 from domain.model.exercise_id import ExerciseId
+from domain.ports.errors import CatalogLoadError, RepositoryError
 from domain.ports.exercise_repository import ExerciseRepository
 from domain.ports.pose_repository import PoseRepository
 from domain.service.exercise_state_machine import ExerciseStateMachine
@@ -8,35 +18,158 @@ from domain.service.pose.pose_matcher.pose_matcher import PoseMatcher
 from domain.service.pose.pose_matcher.strategy.pose_matcher_strategy import (
     PoseMatcherStrategy,
 )
-from domain.service.rule.rule_validator import RuleValidator
-from domain.service.rule.strategy.pose_rule_strategy import PoseRuleStrategy
+from domain.service.rule.pose_rule_validator import PoseRuleValidator
 
 
 class CameraPoseProcessorFactory(SensorProcessorFactory):
+    """
+    Собирает и кэширует процессоры камеры для упражнений. Процессоры могут
+    собираться из нескольких потоков; процессор, собранный во время подмены
+    каталога, отбрасывается и собирается заново из новых данных.
+    """
+
     def __init__(
         self,
         exercise_repository: ExerciseRepository,
         pose_repository: PoseRepository,
         pose_matcher_strategy: PoseMatcherStrategy,
         frame_tolerance: int,
+        tracer: StageTracer = NULL_STAGE_TRACER,
     ):
         self._exercise_repository = exercise_repository
         self._pose_repository = pose_repository
         self._pose_matcher_strategy = pose_matcher_strategy
         self._frame_tolerance = frame_tolerance
+        self._tracer = tracer
+        self._cache: ProcessorCache[CameraPoseProcessor] = ProcessorCache()
+        self._lock = threading.Lock()
+
+    @property
+    def cache_stats(self) -> ProcessorCacheStats:
+        with self._lock:
+            return self._cache.stats
+
+    def invalidate(self, exercise_id: ExerciseId | None = None) -> None:
+        with self._lock:
+            self._cache.invalidate(exercise_id)
 
     def create(self, exercise_id: ExerciseId) -> CameraPoseProcessor:
-        exercise = self._exercise_repository.get_by_id(exercise_id)
-        poses = [self._pose_repository.get_by_id(pid) for pid in exercise.poses]
+        while True:
+            with self._lock:
+                version = self._catalog_version()
+                processor = self._cache.get(exercise_id, version)
+            if processor is not None:
+                return processor
+
+            try:
+                processor = self._build(
+                    exercise_id, self._exercise_repository, self._pose_repository
+                )
+            except RepositoryError:
+                # Данные могли смениться посреди сборки - тогда пробуем еще раз
+                if self._is_current(version):
+                    raise
+                continue
+
+            with self._lock:
+                if self._catalog_version() == version:
+                    self._cache.put(exercise_id, version, processor)
+                    return processor
+
+    def is_cached(self, exercise_id: ExerciseId) -> bool:
+        with self._lock:
+            return self._cache.contains(exercise_id, self._catalog_version())
+
+    def preload(self) -> None:
+        """
+        Собирает процессоры всех упражнений каталога, чтобы первый кадр сессии
+        не тратил время на чтение данных и компиляцию таблиц сопоставления.
+
+        Raises:
+            CatalogLoadError: если хотя бы одно упражнение не удалось собрать;
+                содержит ошибки по всем таким упражнениям
+        """
+        with self._lock:
+            version = self._catalog_version()
+        processors = self.build_all(self._exercise_repository, self._pose_repository)
+        with self._lock:
+            if self._catalog_version() == version:
+                self._cache.replace(version, processors)
+
+    def build_all(
+        self,
+        exercise_repository: ExerciseRepository,
+        pose_repository: PoseRepository,
+    ) -> dict[ExerciseId, CameraPoseProcessor]:
+        """
+        Собирает процессоры всех упражнений из переданных репозиториев, не трогая
+        кэш. Позволяет проверить новую версию каталога до ее подмены.
+
+        Args:
+            exercise_repository (ExerciseRepository): репозиторий упражнений
+            pose_repository (PoseRepository): репозиторий поз
+
+        Returns:
+            dict[ExerciseId, CameraPoseProcessor]: процессоры по упражнениям
+
+        Raises:
+            CatalogLoadError: если хотя бы одно упражнение не удалось собрать;
+                содержит ошибки по всем таким упражнениям
+        """
+        processors: dict[ExerciseId, CameraPoseProcessor] = {}
+        errors: list[str] = []
+        for exercise in exercise_repository.get_all():
+            try:
+                processors[exercise.id] = self._build(
+                    exercise.id, exercise_repository, pose_repository
+                )
+            except (RepositoryError, ValueError) as e:
+                errors.append(f"Exercise '{exercise.id}': {e}")
+        if errors:
+            raise CatalogLoadError(errors)
+        return processors
+
+    @contextmanager
+    def swapping(
+        self, processors: dict[ExerciseId, CameraPoseProcessor]
+    ) -> Iterator[None]:
+        """
+        Подменяет каталог одним шагом: внутри блока вызывающий подменяет данные
+        репозиториев, а по выходе из блока кэш заполняется процессорами новой
+        версии. Пока блок выполняется, процессоры не выдаются и не собираются,
+        поэтому ни один процессор не видит смесь старых и новых данных.
+
+        Args:
+            processors (dict[ExerciseId, CameraPoseProcessor]): процессоры,
+                собранные build_all из новых данных
+        """
+        with self._lock:
+            yield
+            self._cache.replace(self._catalog_version(), processors)
+
+    def _catalog_version(self) -> Hashable:
+        return (self._exercise_repository.version, self._pose_repository.version)
+
+    def _is_current(self, version: Hashable) -> bool:
+        with self._lock:
+            return self._catalog_version() == version
+
+    def _build(
+        self,
+        exercise_id: ExerciseId,
+        exercise_repository: ExerciseRepository,
+        pose_repository: PoseRepository,
+    ) -> CameraPoseProcessor:
+        exercise = exercise_repository.get_by_id(exercise_id)
+        poses = [pose_repository.get_by_id(pid) for pid in exercise.poses]
         pose_matcher = PoseMatcher(
             reference_poses=poses, strategy=self._pose_matcher_strategy
         )
-        rule_validator = RuleValidator(
-            rules=exercise.pose_rules, strategy=PoseRuleStrategy()
-        )
+        rule_validator = PoseRuleValidator(rules=exercise.pose_rules)
         state_machine = ExerciseStateMachine(len(poses), self._frame_tolerance)
         return CameraPoseProcessor(
             pose_matcher=pose_matcher,
             rule_validator=rule_validator,
             state_machine=state_machine,
+            tracer=self._tracer,
         )
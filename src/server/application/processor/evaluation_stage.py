@@ -0,0 +1,96 @@
+import asyncio
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor
+
+from application.processor.process_context import ProcessContext
+from application.processor.sensor_processor import SensorProcessor
+from domain.model.exercise_state import ExerciseState
+from domain.model.feedback import Feedback
+
+
+class EvaluationStage(ABC):
+    """
+    Этап, на котором процессоры выполняют вычисления над кадрами. Определяет, где
+    идут вычисления: прямо в цикле событий, в пуле потоков или пачками по нескольким
+    сессиям сразу.
+    """
+
+    @abstractmethod
+    async def process(
+        self, processor: SensorProcessor, context: ProcessContext, state: ExerciseState
+    ) -> tuple[list[Feedback], ExerciseState]:
+        """
+        Args:
+            processor (SensorProcessor): процессор упражнения сессии
+            context (ProcessContext): данные кадра
+            state (ExerciseState): состояние упражнения до кадра
+
+        Returns:
+            tuple[list[Feedback], ExerciseState]: обратная связь и новое состояние
+        """
+
+    @abstractmethod
+    async def process_batch(
+        self,
+        processor: SensorProcessor,
+        contexts: list[ProcessContext],
+        state: ExerciseState,
+    ) -> tuple[list[list[Feedback]], ExerciseState]:
+        """
+        Обрабатывает несколько кадров одной сессии по порядку.
+
+        Returns:
+            tuple[list[list[Feedback]], ExerciseState]: обратная связь по каждому кадру
+                и состояние после последнего кадра
+        """
+
+
+class InlineEvaluationStage(EvaluationStage):
+    """
+    Выполняет процессоры прямо в цикле событий.
+    """
+
+    async def process(
+        self, processor: SensorProcessor, context: ProcessContext, state: ExerciseState
+    ) -> tuple[list[Feedback], ExerciseState]:
+        return processor.process(context, state)
+
+    async def process_batch(
+        self,
+        processor: SensorProcessor,
+        contexts: list[ProcessContext],
+        state: ExerciseState,
+    ) -> tuple[list[list[Feedback]], ExerciseState]:
+        return processor.process_batch(contexts, state)
+
+
+INLINE_EVALUATION_STAGE = InlineEvaluationStage()
+
+
+class ExecutorEvaluationStage(EvaluationStage):
+    """
+    Выполняет процессоры в пуле executor, чтобы тяжелые кадры одной сессии не задерживали
+    чтение сокетов и запросы к Redis остальных сессий.
+    """
+
+    def __init__(self, executor: Executor) -> None:
+        self._executor = executor
+
+    async def process(
+        self, processor: SensorProcessor, context: ProcessContext, state: ExerciseState
+    ) -> tuple[list[Feedback], ExerciseState]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, processor.process, context, state
+        )
+
+    async def process_batch(
+        self,
+        processor: SensorProcessor,
+        contexts: list[ProcessContext],
+        state: ExerciseState,
+    ) -> tuple[list[list[Feedback]], ExerciseState]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, processor.process_batch, contexts, state
+        )
@@ -1,10 +1,10 @@
 from dataclasses import dataclass
 
 from domain.model.emg import EmgReading
-from domain.model.pose import Pose
+from domain.model.frame_pose import FramePose
 
 
 @dataclass(frozen=True)
 class ProcessContext:
-    pose: Pose
+    pose: FramePose
     emgs: list[EmgReading]
@@ -0,0 +1,77 @@
+from collections.abc import Hashable
+from dataclasses import dataclass
+
+from domain.model.exercise_id import ExerciseId
+
+
+@dataclass(frozen=True)
+class ProcessorCacheStats:
+    hits: int
+    misses: int
+    invalidations: int
+    size: int
+
+
+class ProcessorCache[P]:
+    """
+    Кэш скомпилированных процессоров, ключом которого является идентификатор упражнения.
+    Вместе с процессором хранится версия данных, из которых он был собран: если версия
+    изменилась (например, репозитории перечитали файлы), процессор собирается заново.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[ExerciseId, tuple[Hashable, P]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def get(self, exercise_id: ExerciseId, version: Hashable) -> P | None:
+        """
+        Возвращает процессор упражнения, собранный из данных указанной версии.
+
+        Returns:
+            P | None: процессор или None, если его нет или он собран из другой версии
+        """
+        entry = self._entries.get(exercise_id)
+        if entry is not None:
+            cached_version, processor = entry
+            if cached_version == version:
+                self._hits += 1
+                return processor
+            self._invalidations += 1
+            del self._entries[exercise_id]
+        self._misses += 1
+        return None
+
+    def contains(self, exercise_id: ExerciseId, version: Hashable) -> bool:
+        entry = self._entries.get(exercise_id)
+        return entry is not None and entry[0] == version
+
+    def put(self, exercise_id: ExerciseId, version: Hashable, processor: P) -> None:
+        self._entries[exercise_id] = (version, processor)
+
+    def replace(self, version: Hashable, processors: dict[ExerciseId, P]) -> None:
+        """
+        Заменяет содержимое кэша процессорами новой версии данных.
+        """
+        self._invalidations += len(self._entries)
+        self._entries = {
+            exercise_id: (version, processor)
+            for exercise_id, processor in processors.items()
+        }
+
+    def invalidate(self, exercise_id: ExerciseId | None = None) -> None:
+        if exercise_id is None:
+            self._invalidations += len(self._entries)
+            self._entries.clear()
+        elif self._entries.pop(exercise_id, None) is not None:
+            self._invalidations += 1
+
+    @property
+    def stats(self) -> ProcessorCacheStats:
+        return ProcessorCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            invalidations=self._invalidations,
+            size=len(self._entries),
+        )
@@ -14,8 +14,55 @@ class SensorProcessor(ABC):
     ) -> Tuple[list[Feedback], ExerciseState]:
         pass
 
+    def process_batch(
+        self, contexts: list[ProcessContext], state: ExerciseState
+    ) -> tuple[list[list[Feedback]], ExerciseState]:
+        """
+        Обрабатывает кадры по порядку, передавая состояние от кадра к кадру.
+
+        Returns:
+            Tuple[list[list[Feedback]], ExerciseState]: обратная связь по каждому кадру
+                и состояние после последнего кадра
+        """
+        feedbacks: list[list[Feedback]] = []
+        for context in contexts:
+            frame_feedbacks, state = self.process(context, state)
+            feedbacks.append(frame_feedbacks)
+        return feedbacks, state
+
+    def process_sessions(
+        self, items: list[tuple[ProcessContext, ExerciseState]]
+    ) -> list[tuple[list[Feedback], ExerciseState]]:
+        """
+        Обрабатывает по одному кадру нескольких независимых сессий одного упражнения.
+        По умолчанию вызывает process для каждого кадра; процессоры могут переопределить
+        метод, чтобы обработать кадры всех сессий одним векторизованным вызовом.
+
+        Args:
+            items (list[Tuple[ProcessContext, ExerciseState]]): кадр и состояние
+                упражнения каждой сессии
+
+        Returns:
+            list[Tuple[list[Feedback], ExerciseState]]: обратная связь и новое
+                состояние каждой сессии в том же порядке
+        """
+        return [self.process(context, state) for context, state in items]
+
 
 class SensorProcessorFactory(ABC):
     @abstractmethod
     def create(self, exercise_id: ExerciseId) -> SensorProcessor:
         pass
+
+    def is_cached(self, exercise_id: ExerciseId) -> bool:
+        """
+        Проверяет, выдаст ли create процессор без обращения к хранилищу данных.
+        По умолчанию фабрика не читает данные, и метод возвращает True.
+
+        Args:
+            exercise_id (ExerciseId): идентификатор упражнения
+
+        Returns:
+            bool: True, если create можно вызвать в цикле событий
+        """
+        return True
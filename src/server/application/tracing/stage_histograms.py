@@ -0,0 +1,116 @@
+import bisect
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager
+from dataclasses import dataclass
+
+from application.tracing.stage_tracer import StageTracer
+
+# Верхние границы корзин гистограммы, в секундах
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+)
+
+
+@dataclass(frozen=True)
+class LatencyHistogramSnapshot:
+    """
+    Fields:
+        buckets (tuple[float, ...]): верхние границы корзин
+        counts (tuple[int, ...]): накопленное число замеров не больше каждой границы
+        count (int): общее число замеров
+        total (float): сумма замеров, в секундах
+    """
+
+    buckets: tuple[float, ...]
+    counts: tuple[int, ...]
+    count: int
+    total: float
+
+
+class LatencyHistogram:
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self._buckets = buckets
+        self._counts = [0] * len(buckets)
+        self._count = 0
+        self._total = 0.0
+
+    def observe(self, seconds: float) -> None:
+        index = bisect.bisect_left(self._buckets, seconds)
+        if index < len(self._counts):
+            self._counts[index] += 1
+        self._count += 1
+        self._total += seconds
+
+    @property
+    def snapshot(self) -> LatencyHistogramSnapshot:
+        cumulative: list[int] = []
+        running = 0
+        for count in self._counts:
+            running += count
+            cumulative.append(running)
+        return LatencyHistogramSnapshot(
+            buckets=self._buckets,
+            counts=tuple(cumulative),
+            count=self._count,
+            total=self._total,
+        )
+
+
+class StageHistograms:
+    """
+    Гистограммы длительности этапов обработки, по одной на этап.
+    """
+
+    def __init__(self) -> None:
+        self._histograms: dict[str, LatencyHistogram] = {}
+        # Этапы процессоров могут замеряться из потоков пула вычислений
+        self._lock = threading.Lock()
+
+    def observe(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self._histograms.get(stage)
+            if histogram is None:
+                histogram = self._histograms[stage] = LatencyHistogram()
+            histogram.observe(seconds)
+
+    @property
+    def snapshot(self) -> dict[str, LatencyHistogramSnapshot]:
+        with self._lock:
+            return {
+                stage: histogram.snapshot
+                for stage, histogram in sorted(self._histograms.items())
+            }
+
+
+class HistogramStageTracer(StageTracer):
+    """
+    Записывает длительность этапов в StageHistograms.
+    """
+
+    def __init__(self, histograms: StageHistograms) -> None:
+        self._histograms = histograms
+
+    def stage(self, name: str) -> AbstractContextManager[None]:
+        return self._measure(name)
+
+    @contextmanager
+    def _measure(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._histograms.observe(name, time.perf_counter() - started)
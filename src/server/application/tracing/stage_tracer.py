@@ -0,0 +1,53 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, ExitStack, contextmanager, nullcontext
+
+_NO_TRACE: AbstractContextManager[None] = nullcontext()
+
+
+class StageTracer(ABC):
+    """
+    Замеряет длительность этапов обработки кадра (разбор запроса, загрузка сессии,
+    сопоставление поз и т.д.).
+    """
+
+    @abstractmethod
+    def stage(self, name: str) -> AbstractContextManager[None]:
+        """
+        Args:
+            name (str): название этапа
+
+        Returns:
+            AbstractContextManager[None]: контекст, на время которого замеряется этап
+        """
+
+
+class NullStageTracer(StageTracer):
+    """
+    Трассировщик, который ничего не замеряет: используется, когда трассировка выключена.
+    """
+
+    def stage(self, name: str) -> AbstractContextManager[None]:
+        return _NO_TRACE
+
+
+NULL_STAGE_TRACER = NullStageTracer()
+
+
+class CompositeStageTracer(StageTracer):
+    """
+    Передаёт каждый этап сразу нескольким трассировщикам.
+    """
+
+    def __init__(self, tracers: list[StageTracer]) -> None:
+        self._tracers = tracers
+
+    def stage(self, name: str) -> AbstractContextManager[None]:
+        return self._enter_all(name)
+
+    @contextmanager
+    def _enter_all(self, name: str) -> Iterator[None]:
+        with ExitStack() as stack:
+            for tracer in self._tracers:
+                stack.enter_context(tracer.stage(name))
+            yield
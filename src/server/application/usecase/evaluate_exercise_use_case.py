@@ -1,6 +1,17 @@
+import asyncio
+
 from application.dto.feedback import FeedbackItemDto, FeedbackResponseDto
+from application.processor.evaluation_stage import (
+    INLINE_EVALUATION_STAGE,
+    EvaluationStage,
+)
 from application.processor.process_context import ProcessContext
-from application.processor.sensor_processor import SensorProcessorFactory
+from application.processor.sensor_processor import (
+    SensorProcessor,
+    SensorProcessorFactory,
+)
+from application.tracing.stage_tracer import NULL_STAGE_TRACER, StageTracer
+from domain.model.exercise_id import ExerciseId
 from domain.model.feedback import Feedback
 from domain.model.session_id import SessionId
 from domain.ports.session_repository import SessionRepository
@@ -11,27 +22,111 @@ class EvaluateExerciseUseCase:
         self,
         session_repository: SessionRepository,
         processor_factories: list[SensorProcessorFactory],
+        tracer: StageTracer = NULL_STAGE_TRACER,
+        evaluation_stage: EvaluationStage = INLINE_EVALUATION_STAGE,
     ):
         self._session_repository = session_repository
         self._processor_factories = processor_factories
+        self._tracer = tracer
+        self._evaluation_stage = evaluation_stage
+
+    def with_session_repository(
+        self, session_repository: SessionRepository
+    ) -> "EvaluateExerciseUseCase":
+        """
+        Возвращает копию сценария, работающую с другим репозиторием сессий,
+        например с привязанным к конкретному соединению.
+        """
+        return EvaluateExerciseUseCase(
+            session_repository=session_repository,
+            processor_factories=self._processor_factories,
+            tracer=self._tracer,
+            evaluation_stage=self._evaluation_stage,
+        )
+
+    async def prepare(self, session_id: SessionId) -> None:
+        """
+        Заранее собирает процессоры упражнения сессии в пуле потоков. Если данные
+        упражнения еще не прочитаны с диска, чтение не блокирует цикл событий, а
+        последующие кадры получают процессоры из кэша фабрик.
+        """
+        session = await self._session_repository.get(session_id)
+        for factory in self._processor_factories:
+            await asyncio.to_thread(factory.create, session.exercise_id)
 
     async def execute(
         self, session_id: SessionId, data: ProcessContext
     ) -> FeedbackResponseDto:
-        session = await self._session_repository.get(session_id)
+        with self._tracer.stage("session_get"):
+            session = await self._session_repository.get(session_id)
         feedbacks: list[Feedback] = []
         current_state = session.exercise_state
         for factory in self._processor_factories:
-            processor = factory.create(session.exercise_id)
-            feedback, current_state = processor.process(data, current_state)
+            with self._tracer.stage("processor_create"):
+                processor = await _create_processor(factory, session.exercise_id)
+            feedback, current_state = await self._evaluation_stage.process(
+                processor, data, current_state
+            )
             feedbacks.extend(feedback)
 
         session = session.update(new_state=current_state)
 
-        await self._session_repository.update(session)
+        with self._tracer.stage("session_update"):
+            await self._session_repository.update(session)
 
-        return FeedbackResponseDto(
-            feedbacks=[
-                FeedbackItemDto(type=f.type.value, message=f.message) for f in feedbacks
-            ]
-        )
+        return _to_response(feedbacks)
+
+    async def execute_batch(
+        self, session_id: SessionId, data: list[ProcessContext]
+    ) -> list[FeedbackResponseDto]:
+        """
+        Обрабатывает несколько кадров подряд: сессия загружается и сохраняется один раз,
+        а каждый процессор получает все кадры сразу. Процессоры выполняются по очереди,
+        каждый над всеми кадрами, поэтому процессор видит состояние, полученное
+        предыдущими процессорами после всех кадров пачки.
+
+        Returns:
+            list[FeedbackResponseDto]: обратная связь по каждому кадру в порядке кадров
+        """
+        if not data:
+            return []
+
+        with self._tracer.stage("session_get"):
+            session = await self._session_repository.get(session_id)
+        feedbacks: list[list[Feedback]] = [[] for _ in data]
+        current_state = session.exercise_state
+        for factory in self._processor_factories:
+            with self._tracer.stage("processor_create"):
+                processor = await _create_processor(factory, session.exercise_id)
+            batch_feedbacks, current_state = await self._evaluation_stage.process_batch(
+                processor, data, current_state
+            )
+            for frame_feedbacks, feedback in zip(
+                feedbacks, batch_feedbacks, strict=True
+            ):
+                frame_feedbacks.extend(feedback)
+
+        session = session.update(new_state=current_state)
+
+        with self._tracer.stage("session_update"):
+            await self._session_repository.update(session)
+
+        return [_to_response(frame_feedbacks) for frame_feedbacks in feedbacks]
+
+
+async def _create_processor(
+    factory: SensorProcessorFactory, exercise_id: ExerciseId
+) -> SensorProcessor:
+    # Промах кэша (например, после перезагрузки каталога) читает данные с диска,
+    # поэтому сборка уходит в пул потоков, а не блокирует цикл событий
+    if factory.is_cached(exercise_id):
+        return factory.create(exercise_id)
+    return await asyncio.to_thread(factory.create, exercise_id)
+
+
+def _to_response(feedbacks: list[Feedback]) -> FeedbackResponseDto:
+    return FeedbackResponseDto(
+        feedbacks=[
+            FeedbackItemDto(type=f.type.value, message=f.message) for f in feedbacks
+        ]
+    )
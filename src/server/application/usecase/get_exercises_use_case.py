@@ -1,15 +1,29 @@
+import asyncio
+
 from domain.ports.exercise_repository import ExerciseRepository
 from application.dto.exercises import ExercisesResponseDto, ExerciseItemDto
 
 
 class GetExercisesUseCase:
+    """
+    Возвращает список упражнений. Ответ строится один раз для каждой версии данных
+    репозитория и затем отдается из памяти.
+    """
+
     def __init__(self, exercise_repository: ExerciseRepository):
         self.exercise_repository = exercise_repository
+        self._cached: tuple[int, ExercisesResponseDto] | None = None
+
+    async def execute(self) -> ExercisesResponseDto:
+        version = self.exercise_repository.version
+        if self._cached is not None and self._cached[0] == version:
+            return self._cached[1]
 
-    def execute(self) -> ExercisesResponseDto:
-        exercises = self.exercise_repository.get_all()
-        return ExercisesResponseDto(
+        exercises = await asyncio.to_thread(self.exercise_repository.get_all)
+        response = ExercisesResponseDto(
             exercises=[
                 ExerciseItemDto(exercise_id=str(e.id), name=e.name) for e in exercises
             ]
         )
+        self._cached = (version, response)
+        return response
@@ -0,0 +1,41 @@
+import asyncio
+
+from application.processor.camera.camera_pose_processor_factory import (
+    CameraPoseProcessorFactory,
+)
+from domain.ports.exercise_repository import ExerciseRepository
+from domain.ports.pose_repository import PoseRepository
+
+
+class ReloadCatalogUseCase:
+    """
+    Перечитывает каталог поз и упражнений без перезапуска сервера. Позы и упражнения
+    читаются в новые объекты и проверяются вместе сборкой процессоров всех упражнений;
+    чтение и сборка выполняются в пуле потоков, и пока они идут, активные сессии
+    работают на прежних данных. Затем новая версия подменяет старую целиком одним
+    шагом. Если новые данные содержат ошибки, каталог не меняется.
+    """
+
+    def __init__(
+        self,
+        exercise_repository: ExerciseRepository,
+        pose_repository: PoseRepository,
+        processor_factory: CameraPoseProcessorFactory,
+    ):
+        self.exercise_repository = exercise_repository
+        self.pose_repository = pose_repository
+        self.processor_factory = processor_factory
+
+    async def execute(self) -> None:
+        """
+        Raises:
+            CatalogLoadError: если новые данные каталога содержат ошибки
+        """
+        staged_poses = await asyncio.to_thread(self.pose_repository.stage)
+        staged_exercises = await asyncio.to_thread(self.exercise_repository.stage)
+        processors = await asyncio.to_thread(
+            self.processor_factory.build_all, staged_exercises, staged_poses
+        )
+        with self.processor_factory.swapping(processors):
+            self.pose_repository.swap(staged_poses)
+            self.exercise_repository.swap(staged_exercises)
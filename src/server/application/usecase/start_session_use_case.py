@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 
 from application.dto.session import StartSessionResponseDto
@@ -21,7 +22,7 @@ class StartSessionUseCase:
 
     async def execute(self, exercise_id: ExerciseId) -> StartSessionResponseDto:
         try:
-            self.exercise_repository.get_by_id(exercise_id)
+            await asyncio.to_thread(self.exercise_repository.get_by_id, exercise_id)
         except EntityNotFoundError:
             raise EntityNotFoundError("exercise", exercise_id.id)
         session_id = str(uuid.uuid4())
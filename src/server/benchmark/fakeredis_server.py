@@ -0,0 +1,27 @@
+"""
+Запуск приложения с хранилищем сессий в fakeredis - для нагрузочного теста без Redis.
+
+Запуск: uv run python -m benchmark.fakeredis_server --port 8000
+"""
+
+import argparse
+
+import fakeredis
+import redis.asyncio as redis
+import uvicorn
+
+from composition.main import app, container
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+
+    container.override.set(redis.Redis, fakeredis.FakeAsyncRedis())
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
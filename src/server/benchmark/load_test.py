@@ -0,0 +1,313 @@
+"""
+Нагрузочный тест конвейера /start + /analyze: N симулированных сессий открывают
+WebSocket и отправляют кадры с заданной частотой, а тест измеряет задержку обратной
+связи (от отправки кадра до ответа с его seq), пропускную способность и долю ошибок.
+
+Запуск против работающего сервера (с локальным Redis):
+    uv run python -m benchmark.load_test --url http://localhost:8000 --sessions 50
+Запуск со встроенным сервером на fakeredis:
+    uv run python -m benchmark.load_test --fakeredis --sessions 50 --fps 30
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import httpx
+import numpy as np
+import numpy.typing as npt
+from websockets.asyncio.client import ClientConnection, connect
+from websockets.exceptions import WebSocketException
+from websockets.typing import Subprotocol
+
+from presentation.schemas.binary_frame import FRAME_SUBPROTOCOL, encode_binary_frame
+
+LANDMARKS_COUNT = 33
+SYNTHETIC_FRAMES = 120
+RESPONSE_GRACE_SECONDS = 2.0
+# Ошибки, при которых сессия считается неудачной, а тест продолжается: отказ HTTP или
+# WebSocket, сетевая ошибка, некорректный ответ /start
+SESSION_ERRORS = (httpx.HTTPError, WebSocketException, OSError, ValueError, KeyError)
+SERVER_STARTUP_SECONDS = 20.0
+
+
+@dataclass(frozen=True)
+class LoadTestConfig:
+    url: str
+    sessions: int
+    fps: float
+    duration: float
+    exercise_id: str
+    binary: bool
+
+
+@dataclass
+class SessionStats:
+    sent: int = 0
+    answered: int = 0
+    errors: int = 0
+    latencies: list[float] = field(default_factory=list)
+    failed: bool = False
+
+
+@dataclass(frozen=True)
+class LoadTestReport:
+    sessions: int
+    failed_sessions: int
+    duration_seconds: float
+    frames_sent: int
+    frames_answered: int
+    frames_unanswered: int
+    errors: int
+    throughput_fps: float
+    error_rate: float
+    latency_p50_ms: float
+    latency_p95_ms: float
+    latency_p99_ms: float
+    latency_max_ms: float
+
+    @classmethod
+    def from_stats(cls, stats: list[SessionStats], duration: float) -> "LoadTestReport":
+        sent = sum(s.sent for s in stats)
+        answered = sum(s.answered for s in stats)
+        errors = sum(s.errors for s in stats)
+        latencies = np.array(
+            [latency for s in stats for latency in s.latencies], dtype=np.float64
+        )
+        p50, p95, p99, p_max = (
+            np.percentile(latencies, [50, 95, 99, 100]) * 1000
+            if latencies.size
+            else (float("nan"),) * 4
+        )
+        return cls(
+            sessions=len(stats),
+            failed_sessions=sum(s.failed for s in stats),
+            duration_seconds=duration,
+            frames_sent=sent,
+            frames_answered=answered,
+            frames_unanswered=sent - answered - errors,
+            errors=errors,
+            throughput_fps=answered / duration if duration else 0.0,
+            error_rate=errors / sent if sent else 0.0,
+            latency_p50_ms=float(p50),
+            latency_p95_ms=float(p95),
+            latency_p99_ms=float(p99),
+            latency_max_ms=float(p_max),
+        )
+
+    def format(self) -> str:
+        return "\n".join(
+            [
+                f"sessions:          {self.sessions} ({self.failed_sessions} failed)",
+                f"duration:          {self.duration_seconds:.1f} s",
+                f"frames sent:       {self.frames_sent}",
+                (
+                    f"frames answered:   {self.frames_answered}"
+                    f" ({self.frames_unanswered} coalesced or lost)"
+                ),
+                f"errors:            {self.errors} ({self.error_rate:.2%})",
+                f"throughput:        {self.throughput_fps:.1f} frames/s",
+                (
+                    f"latency p50/p95/p99/max: {self.latency_p50_ms:.1f} /"
+                    f" {self.latency_p95_ms:.1f} / {self.latency_p99_ms:.1f} /"
+                    f" {self.latency_max_ms:.1f} ms"
+                ),
+            ]
+        )
+
+
+def synthetic_frames(
+    count: int = SYNTHETIC_FRAMES, seed: int = 0
+) -> list[npt.NDArray[np.float32]]:
+    """
+    Генерирует последовательность скелетов: случайная базовая поза с небольшим
+    дрожанием точек от кадра к кадру.
+    """
+    rng = np.random.default_rng(seed)
+    base = rng.random((LANDMARKS_COUNT, 3))
+    return [
+        (base + rng.normal(scale=0.01, size=base.shape)).astype(np.float32)
+        for _ in range(count)
+    ]
+
+
+def load_frames(path: Path) -> list[npt.NDArray[np.float32]]:
+    """
+    Загружает записанные кадры: JSON-список матриц landmarks формы (33, 3).
+    """
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return [np.asarray(frame, dtype=np.float32) for frame in data]
+
+
+def _encode(landmarks: npt.NDArray[np.float32], seq: int, binary: bool) -> str | bytes:
+    if binary:
+        return encode_binary_frame(landmarks, [], seq=seq)
+    return json.dumps({"landmarks": landmarks.tolist(), "emgs": [], "seq": seq})
+
+
+async def _send_frames(
+    websocket: ClientConnection,
+    config: LoadTestConfig,
+    frames: list[npt.NDArray[np.float32]],
+    stats: SessionStats,
+    sent_at: dict[int, float],
+    offset: float,
+) -> None:
+    interval = 1.0 / config.fps
+    started = time.perf_counter() + offset
+    seq = 0
+    while True:
+        scheduled = started + seq * interval
+        if scheduled - started >= config.duration:
+            return
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        message = _encode(frames[seq % len(frames)], seq, config.binary)
+        sent_at[seq] = time.perf_counter()
+        await websocket.send(message)
+        stats.sent += 1
+        seq += 1
+
+
+async def _receive_feedbacks(
+    websocket: ClientConnection, stats: SessionStats, sent_at: dict[int, float]
+) -> None:
+    async for message in websocket:
+        received_at = time.perf_counter()
+        payload = json.loads(message)
+        if "error" in payload:
+            stats.errors += 1
+            continue
+        seq = payload.get("seq")
+        sent = sent_at.pop(seq, None) if seq is not None else None
+        if sent is not None:
+            stats.answered += 1
+            stats.latencies.append(received_at - sent)
+            # Более ранние кадры без ответа сервер уже вытеснил более новыми
+            for stale in [s for s in sent_at if s < seq]:
+                del sent_at[stale]
+
+
+async def run_session(
+    client: httpx.AsyncClient,
+    config: LoadTestConfig,
+    frames: list[npt.NDArray[np.float32]],
+    offset: float,
+) -> SessionStats:
+    stats = SessionStats()
+    try:
+        response = await client.post("/start", json={"exercise_id": config.exercise_id})
+        response.raise_for_status()
+        session_id = response.json()["session_id"]
+
+        ws_url = config.url.replace("http", "ws", 1) + f"/analyze/{session_id}"
+        subprotocols = [Subprotocol(FRAME_SUBPROTOCOL)] if config.binary else None
+        async with connect(ws_url, subprotocols=subprotocols) as websocket:
+            sent_at: dict[int, float] = {}
+            receiver = asyncio.create_task(
+                _receive_feedbacks(websocket, stats, sent_at)
+            )
+            try:
+                await _send_frames(websocket, config, frames, stats, sent_at, offset)
+                deadline = time.perf_counter() + RESPONSE_GRACE_SECONDS
+                while sent_at and time.perf_counter() < deadline:
+                    await asyncio.sleep(0.01)
+            finally:
+                receiver.cancel()
+                await asyncio.gather(receiver, return_exceptions=True)
+    except SESSION_ERRORS as exc:
+        print(f"session failed: {exc!r}", file=sys.stderr)
+        stats.failed = True
+    return stats
+
+
+async def run_load_test(
+    config: LoadTestConfig, frames: list[npt.NDArray[np.float32]]
+) -> LoadTestReport:
+    limits = httpx.Limits(max_connections=config.sessions)
+    async with httpx.AsyncClient(base_url=config.url, limits=limits) as client:
+        started = time.perf_counter()
+        # Старты сессий разнесены внутри одного периода кадров,
+        # чтобы все сессии не отправляли кадры в один и тот же момент
+        stats = await asyncio.gather(
+            *(
+                run_session(client, config, frames, i / config.sessions / config.fps)
+                for i in range(config.sessions)
+            )
+        )
+        duration = time.perf_counter() - started
+    return LoadTestReport.from_stats(list(stats), duration)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port: int = sock.getsockname()[1]
+        return port
+
+
+def _start_fakeredis_server() -> tuple[subprocess.Popen[bytes], str]:
+    port = _free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "benchmark.fakeredis_server", "--port", str(port)]
+    )
+    url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + SERVER_STARTUP_SECONDS
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f"{url}/exercises").raise_for_status()
+            return process, url
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("fakeredis server did not start")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--fakeredis", action="store_true")
+    parser.add_argument("--sessions", type=int, default=10)
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--exercise-id", default="exercise_1")
+    parser.add_argument("--json-frames", action="store_true")
+    parser.add_argument("--frames", type=Path, help="JSON file with recorded frames")
+    parser.add_argument("--output", type=Path, help="write the report as JSON")
+    args = parser.parse_args()
+
+    process: subprocess.Popen[bytes] | None = None
+    url = args.url
+    if args.fakeredis:
+        process, url = _start_fakeredis_server()
+
+    config = LoadTestConfig(
+        url=url.rstrip("/"),
+        sessions=args.sessions,
+        fps=args.fps,
+        duration=args.duration,
+        exercise_id=args.exercise_id,
+        binary=not args.json_frames,
+    )
+    frames = load_frames(args.frames) if args.frames else synthetic_frames()
+    try:
+        report = asyncio.run(run_load_test(config, frames))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    print(report.format())
+    if args.output:
+        args.output.write_text(json.dumps(asdict(report), indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
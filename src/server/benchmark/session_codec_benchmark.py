@@ -0,0 +1,51 @@
+"""
+Микробенчмарк кодеков сессии: время кодирования/декодирования и размер записи в Redis.
+
+Запуск: uv run python -m benchmark.session_codec_benchmark
+"""
+
+import timeit
+import uuid
+from collections.abc import Callable
+from functools import partial
+
+from domain.model.exercise_id import ExerciseId
+from domain.model.exercise_state import ExerciseState
+from domain.model.session import Session
+from domain.model.session_id import SessionId
+from infrastructure.persistence.redis.codec.binary_session_codec import (
+    BinarySessionCodec,
+)
+from infrastructure.persistence.redis.codec.json_session_codec import JsonSessionCodec
+from infrastructure.persistence.redis.codec.session_codec import SessionCodec
+
+ITERATIONS = 100_000
+REPEATS = 5
+
+
+def _measure_us(statement: Callable[[], object]) -> float:
+    timings = timeit.repeat(statement, number=ITERATIONS, repeat=REPEATS)
+    return min(timings) / ITERATIONS * 1_000_000
+
+
+def main() -> None:
+    session = Session(
+        session_id=SessionId(str(uuid.uuid4())),
+        exercise_id=ExerciseId("exercise_1"),
+        exercise_state=ExerciseState(current_pose_index=1, frame_tolerance_counter=2),
+    )
+    codecs: dict[str, SessionCodec] = {
+        "json": JsonSessionCodec(),
+        "binary": BinarySessionCodec(),
+    }
+
+    print(f"{'codec':<8}{'encode, us':>12}{'decode, us':>12}{'bytes':>8}")
+    for name, codec in codecs.items():
+        encoded = codec.encode(session)
+        encode_us = _measure_us(partial(codec.encode, session))
+        decode_us = _measure_us(partial(codec.decode, encoded))
+        print(f"{name:<8}{encode_us:>12.2f}{decode_us:>12.2f}{len(encoded):>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+Бенчмарк масштабирования многопроцессного режима (composition.serve): для каждого
+числа рабочих процессов запускает сервер, прогоняет нагрузочный тест /start + /analyze
+и сравнивает пропускную способность с однопроцессным запуском.
+
+Сессии хранятся в Redis, общем для всех рабочих процессов. По умолчанию поднимается
+fakeredis с TCP-интерфейсом внутри процесса бенчмарка; для точных замеров лучше
+указать настоящий Redis через --redis-host/--redis-port.
+
+Запуск:
+    uv run python -m benchmark.worker_scaling --workers 1 2 4 --sessions 64 --fps 60
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import httpx
+from fakeredis import TcpFakeServer
+
+from benchmark.load_test import (
+    SERVER_STARTUP_SECONDS,
+    LoadTestConfig,
+    LoadTestReport,
+    _free_port,
+    run_load_test,
+    synthetic_frames,
+)
+
+
+@dataclass(frozen=True)
+class ScalingPoint:
+    workers: int
+    speedup: float
+    report: LoadTestReport
+
+
+def _start_fake_redis() -> tuple[TcpFakeServer, int]:
+    port = _free_port()
+    server = TcpFakeServer(("127.0.0.1", port))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, port
+
+
+def _start_server(
+    workers: int, redis_host: str, redis_port: int
+) -> tuple[subprocess.Popen[bytes], str]:
+    port = _free_port()
+    env = {
+        **os.environ,
+        "REDIS_HOST": redis_host,
+        "REDIS_PORT": str(redis_port),
+        "CATALOG_RELOAD_INTERVAL_SECONDS": "0",
+    }
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "composition.serve",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + SERVER_STARTUP_SECONDS
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f"{url}/exercises").raise_for_status()
+            return process, url
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError(f"server with {workers} workers did not start")
+
+
+def run_scaling(
+    worker_counts: list[int],
+    redis_host: str,
+    redis_port: int,
+    sessions: int,
+    fps: float,
+    duration: float,
+) -> list[ScalingPoint]:
+    frames = synthetic_frames()
+    points: list[ScalingPoint] = []
+    baseline: float | None = None
+    for workers in worker_counts:
+        process, url = _start_server(workers, redis_host, redis_port)
+        try:
+            config = LoadTestConfig(
+                url=url,
+                sessions=sessions,
+                fps=fps,
+                duration=duration,
+                exercise_id="exercise_1",
+                binary=True,
+            )
+            report = asyncio.run(run_load_test(config, frames))
+        finally:
+            process.terminate()
+            process.wait()
+
+        if baseline is None:
+            baseline = report.throughput_fps
+        speedup = report.throughput_fps / baseline if baseline else 0.0
+        points.append(ScalingPoint(workers=workers, speedup=speedup, report=report))
+        print(
+            f"workers={workers:<3} throughput={report.throughput_fps:8.1f} frames/s"
+            f"  speedup={speedup:4.2f}x  p95={report.latency_p95_ms:7.1f} ms"
+            f"  errors={report.error_rate:.2%}",
+            flush=True,
+        )
+    return points
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=[1, 2, os.cpu_count() or 1]
+    )
+    parser.add_argument("--redis-host")
+    parser.add_argument("--redis-port", type=int, default=6379)
+    parser.add_argument("--sessions", type=int, default=64)
+    parser.add_argument("--fps", type=float, default=60.0)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--output", type=Path, help="write the results as JSON")
+    args = parser.parse_args()
+
+    fake_redis: TcpFakeServer | None = None
+    redis_host, redis_port = args.redis_host, args.redis_port
+    if redis_host is None:
+        fake_redis, redis_port = _start_fake_redis()
+        redis_host = "127.0.0.1"
+
+    print(f"cpu cores: {os.cpu_count()}")
+    try:
+        points = run_scaling(
+            sorted(set(args.workers)),
+            redis_host,
+            redis_port,
+            args.sessions,
+            args.fps,
+            args.duration,
+        )
+    finally:
+        if fake_redis is not None:
+            fake_redis.shutdown()
+
+    if args.output:
+        args.output.write_text(
+            json.dumps([asdict(point) for point in points], indent=2),
+            encoding="utf-8",
+        )
+
+
+if __name__ == "__main__":
+    main()
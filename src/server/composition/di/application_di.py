@@ -1,3 +1,5 @@
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Annotated
 
 from wireup import Inject, injectable
@@ -6,9 +8,15 @@ from wireup import Inject, injectable
 from application.processor.camera.camera_pose_processor_factory import (
     CameraPoseProcessorFactory,
 )
+from application.processor.batching_evaluation_stage import BatchingEvaluationStage
 from application.processor.emg.emg_sensor_processor_factory import (
     EmgSensorProcessorFactory,
 )
+from application.processor.evaluation_stage import (
+    INLINE_EVALUATION_STAGE,
+    EvaluationStage,
+    ExecutorEvaluationStage,
+)
 from domain.model.emg import EmgReading
 from domain.model.emg_rule import EmgRule
 from domain.model.zone import Zone
@@ -20,6 +28,7 @@ from domain.service.pose.pose_matcher.strategy.pose_matcher_strategy import (
 )
 
 from application.processor.sensor_processor import SensorProcessorFactory
+from application.tracing.stage_tracer import StageTracer
 from domain.service.rule.rule_validator import RuleValidator
 from domain.service.rule.strategy.emg_rule_strategy import EmgRuleStrategy
 
@@ -30,12 +39,14 @@ def make_camera_pose_processor_factory(
     pose_repository: PoseRepository,
     pose_matcher_strategy: PoseMatcherStrategy,
     frame_tolerance: int,
+    tracer: StageTracer,
 ) -> CameraPoseProcessorFactory:
     return CameraPoseProcessorFactory(
         exercise_repository=exercise_repository,
         pose_repository=pose_repository,
         pose_matcher_strategy=pose_matcher_strategy,
         frame_tolerance=frame_tolerance,
+        tracer=tracer,
     )
 
 
@@ -85,3 +96,32 @@ def make_processor_factories(
         camera_pose_processor_factory,
         emg_sensor_processor_factory,
     ]
+
+
+@injectable
+def make_evaluation_stage(
+    evaluation_executor: Annotated[str, Inject(config="evaluation_executor")],
+    evaluation_threads: Annotated[int, Inject(config="evaluation_threads")],
+    evaluation_batching: Annotated[bool, Inject(config="evaluation_batching")],
+    batch_window: Annotated[float, Inject(config="evaluation_batch_window_seconds")],
+) -> Iterator[EvaluationStage]:
+    # Пул потоков закрывается вместе с контейнером при остановке приложения.
+    # Стадия создается при первом запросе, то есть уже в рабочем процессе,
+    # поэтому пул не наследуется через fork
+    executor = (
+        ThreadPoolExecutor(
+            max_workers=evaluation_threads, thread_name_prefix="evaluation"
+        )
+        if evaluation_executor == "thread"
+        else None
+    )
+    try:
+        if evaluation_batching:
+            yield BatchingEvaluationStage(executor=executor, window=batch_window)
+        elif executor is not None:
+            yield ExecutorEvaluationStage(executor)
+        else:
+            yield INLINE_EVALUATION_STAGE
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False)
@@ -2,8 +2,10 @@ from wireup import AsyncContainer, create_async_container, injectable
 
 from application.usecase.evaluate_exercise_use_case import EvaluateExerciseUseCase
 from application.usecase.get_exercises_use_case import GetExercisesUseCase
+from application.usecase.reload_catalog_use_case import ReloadCatalogUseCase
 from application.usecase.start_session_use_case import StartSessionUseCase
 from config import settings
+from presentation.stream.frame_stream_metrics import FrameStreamMetrics
 from composition.di import (
     application_di,
     infrastructure_di,
@@ -14,6 +16,8 @@ injectables = [
     injectable(GetExercisesUseCase),
     injectable(StartSessionUseCase),
     injectable(EvaluateExerciseUseCase),
+    injectable(ReloadCatalogUseCase),
+    injectable(FrameStreamMetrics),
     application_di,
     infrastructure_di,
 ]
@@ -3,6 +3,15 @@ from typing import Annotated
 from wireup import Inject, injectable
 import redis.asyncio as redis
 
+from application.tracing.stage_histograms import (
+    HistogramStageTracer,
+    StageHistograms,
+)
+from application.tracing.stage_tracer import (
+    CompositeStageTracer,
+    NullStageTracer,
+    StageTracer,
+)
 from domain.ports.exercise_repository import ExerciseRepository
 from domain.ports.pose_repository import PoseRepository
 from domain.ports.session_repository import SessionRepository
@@ -12,9 +21,15 @@ from infrastructure.persistence.json.repository.json_exercise_repository import
 from infrastructure.persistence.json.repository.json_pose_repository import (
     JsonPoseRepository,
 )
+from infrastructure.persistence.redis.codec.binary_session_codec import (
+    BinarySessionCodec,
+)
+from infrastructure.persistence.redis.codec.json_session_codec import JsonSessionCodec
+from infrastructure.persistence.redis.codec.session_codec import SessionCodec
 from infrastructure.persistence.redis.repository.redis_session_repository import (
     RedisSessionRepository,
 )
+from infrastructure.tracing.opentelemetry_stage_tracer import OpenTelemetryStageTracer
 
 
 @injectable
@@ -25,23 +40,64 @@ def make_redis(
     return redis.Redis(host=host, port=port)
 
 
+@injectable
+def make_session_codec(
+    session_codec: Annotated[str, Inject(config="session_codec")],
+) -> SessionCodec:
+    if session_codec == "json":
+        return JsonSessionCodec()
+    return BinarySessionCodec()
+
+
 @injectable
 def make_session_repository(
     redis_client: redis.Redis,
     session_ttl: Annotated[int, Inject(config="session_timeout_seconds")],
+    session_codec: SessionCodec,
 ) -> SessionRepository:
-    return RedisSessionRepository(redis_client=redis_client, ttl=session_ttl)
+    return RedisSessionRepository(
+        redis_client=redis_client, ttl=session_ttl, codec=session_codec
+    )
 
 
 @injectable
 def make_exercise_repository(
     exercise_data_path: Annotated[str, Inject(config="exercise_data_path")],
+    catalog_preload: Annotated[bool, Inject(config="catalog_preload")],
 ) -> ExerciseRepository:
-    return JsonExerciseRepository(directory_path=exercise_data_path)
+    return JsonExerciseRepository(
+        directory_path=exercise_data_path, preload=catalog_preload
+    )
 
 
 @injectable
 def make_pose_repository(
     pose_data_path: Annotated[str, Inject(config="pose_data_path")],
+    catalog_preload: Annotated[bool, Inject(config="catalog_preload")],
 ) -> PoseRepository:
-    return JsonPoseRepository(directory_path=pose_data_path)
+    return JsonPoseRepository(directory_path=pose_data_path, preload=catalog_preload)
+
+
+@injectable
+def make_stage_histograms() -> StageHistograms:
+    return StageHistograms()
+
+
+@injectable
+def make_stage_tracer(
+    tracing_enabled: Annotated[bool, Inject(config="tracing_enabled")],
+    otel_endpoint: Annotated[str, Inject(config="otel_endpoint")],
+    histograms: StageHistograms,
+) -> StageTracer:
+    # Трассировка включается только флагом tracing_enabled; otel_endpoint лишь
+    # добавляет экспорт спанов к уже включенной трассировке
+    if not tracing_enabled:
+        return NullStageTracer()
+
+    tracers: list[StageTracer] = [HistogramStageTracer(histograms)]
+    if otel_endpoint:
+        tracers.append(OpenTelemetryStageTracer(endpoint=otel_endpoint))
+
+    if len(tracers) == 1:
+        return tracers[0]
+    return CompositeStageTracer(tracers)
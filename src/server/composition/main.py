@@ -1,16 +1,56 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
 import wireup
 import wireup.integration.fastapi
 
+from application.processor.camera.camera_pose_processor_factory import (
+    CameraPoseProcessorFactory,
+)
+from application.usecase.reload_catalog_use_case import ReloadCatalogUseCase
+from config import settings
 from composition.di.container import create_container
+from infrastructure.persistence.json.catalog_watcher import JsonCatalogWatcher
 from presentation.routes.session import router as session_router
 from presentation.routes.exercise import router as exercise_router
 from presentation.routes.evaluate import router as evaluate_router
+from presentation.routes.metrics import router as metrics_router
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Каталог упражнений и поз читается и компилируется до приема запросов,
+    # чтобы ошибки в данных останавливали запуск, а не первую сессию
+    if settings.catalog_preload:
+        processor_factory = await container.get(CameraPoseProcessorFactory)
+        processor_factory.preload()
+
+    watcher_task: asyncio.Task[None] | None = None
+    if settings.catalog_reload_interval_seconds > 0:
+        reload_catalog = await container.get(ReloadCatalogUseCase)
+        watcher = JsonCatalogWatcher(
+            directories=[settings.exercise_data_path, settings.pose_data_path],
+            on_change=reload_catalog.execute,
+            interval=settings.catalog_reload_interval_seconds,
+        )
+        watcher_task = asyncio.create_task(watcher.run())
+
+    try:
+        yield
+    finally:
+        if watcher_task is not None:
+            watcher_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await watcher_task
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 app.include_router(session_router)
 app.include_router(exercise_router)
 app.include_router(evaluate_router)
+app.include_router(metrics_router)
 
 container = create_container()
 
@@ -0,0 +1,229 @@
+"""
+Многопроцессный запуск сервера. Каталог упражнений и поз читается и компилируется
+один раз в родительском процессе, затем процесс форкается на settings.workers рабочих
+процессов. Рабочие процессы принимают соединения с общего сокета и получают
+скомпилированный каталог через copy-on-write, а состояние сессий хранится в Redis,
+поэтому кадры одной сессии может обслуживать любой процесс.
+
+Упавший рабочий процесс (ненулевой код выхода или завершение по сигналу)
+перезапускается с экспоненциальной задержкой; если за CRASH_WINDOW_SECONDS процессы
+падают больше MAX_CRASHES раз, родитель останавливает остальные и завершается
+с ненулевым кодом, а не форкает их в цикле. Процесс, завершившийся с кодом 0,
+не перезапускается.
+
+Каждый рабочий процесс независим от остальных:
+- запускает собственный наблюдатель каталога, поэтому изменения каталога
+  применяются в процессах не одновременно, а в пределах интервала опроса;
+- отдает собственные /metrics: счетчики относятся к процессу, который принял запрос,
+  и для полной картины их нужно собирать с каждого процесса отдельно.
+
+Сокет открывается только для IPv4 (AF_INET): адреса вида "::" не поддерживаются.
+
+Запуск: uv run python -m composition.serve --host 0.0.0.0 --port 8000 --workers 4
+"""
+
+import argparse
+import asyncio
+import gc
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+from collections import deque
+from types import FrameType
+
+import uvicorn
+
+from application.processor.camera.camera_pose_processor_factory import (
+    CameraPoseProcessorFactory,
+)
+from composition.main import app, container
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+RESTART_BACKOFF_SECONDS = 0.5
+MAX_RESTART_BACKOFF_SECONDS = 30.0
+MAX_CRASHES = 10
+CRASH_WINDOW_SECONDS = 60.0
+STOP_POLL_SECONDS = 0.1
+
+
+def preload_catalog() -> None:
+    """
+    Читает каталог и собирает процессоры всех упражнений в синглтонах контейнера,
+    чтобы рабочие процессы унаследовали их после форка.
+    """
+
+    async def _preload() -> None:
+        processor_factory = await container.get(CameraPoseProcessorFactory)
+        processor_factory.preload()
+
+    asyncio.run(_preload())
+
+
+def bind_socket(host: str, port: int) -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(socket.SOMAXCONN)
+    sock.set_inheritable(True)
+    return sock
+
+
+def run_worker(sock: socket.socket) -> None:
+    server = uvicorn.Server(uvicorn.Config(app, log_level="info"))
+    server.run(sockets=[sock])
+
+
+class WorkerSupervisor:
+    """
+    Родительский процесс: форкает рабочие процессы, перезапускает упавшие и
+    пересылает им сигнал остановки.
+
+    Падением считается ненулевой код выхода или завершение по сигналу. Перед каждым
+    перезапуском выдерживается задержка, которая удваивается с каждым падением
+    в пределах окна crash_window и ограничена max_backoff. Если в окне набирается
+    больше max_crashes падений, перезапуски прекращаются. Штатное завершение
+    с кодом 0 вне остановки сервера только логируется: процесс не перезапускается
+    и падением не считается.
+    """
+
+    def __init__(
+        self,
+        sock: socket.socket,
+        workers: int,
+        backoff: float = RESTART_BACKOFF_SECONDS,
+        max_backoff: float = MAX_RESTART_BACKOFF_SECONDS,
+        max_crashes: int = MAX_CRASHES,
+        crash_window: float = CRASH_WINDOW_SECONDS,
+    ) -> None:
+        self._sock = sock
+        self._workers = workers
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+        self._max_crashes = max_crashes
+        self._crash_window = crash_window
+        self._crashes: deque[float] = deque()
+        self._pids: set[int] = set()
+        self._stopping = False
+        self._failed = False
+
+    def run(self) -> int:
+        """
+        Запускает рабочие процессы и ждет их завершения.
+
+        Returns:
+            int: код выхода родительского процесса; 1, если перезапуски прекращены
+                из-за слишком частых падений
+        """
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+        for _ in range(self._workers):
+            self._spawn()
+
+        while self._pids:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            except InterruptedError:
+                continue
+            self._pids.discard(pid)
+            if self._stopping:
+                continue
+            if os.waitstatus_to_exitcode(status) == 0:
+                logger.warning("Worker %s exited cleanly, not restarting", pid)
+            else:
+                self._restart(pid, status)
+        return 1 if self._failed else 0
+
+    def _restart(self, pid: int, status: int) -> None:
+        now = time.monotonic()
+        self._crashes.append(now)
+        while self._crashes[0] < now - self._crash_window:
+            self._crashes.popleft()
+
+        if len(self._crashes) > self._max_crashes:
+            logger.error(
+                "Worker %s exited with status %s; %s crashes in %.0f s, giving up",
+                pid,
+                status,
+                len(self._crashes),
+                self._crash_window,
+            )
+            self._failed = True
+            self._terminate()
+            return
+
+        delay = min(self._max_backoff, self._backoff * 2 ** (len(self._crashes) - 1))
+        logger.warning(
+            "Worker %s exited with status %s, restarting in %.1f s", pid, status, delay
+        )
+        self._sleep(delay)
+        if not self._stopping:
+            self._spawn()
+
+    def _sleep(self, seconds: float) -> None:
+        # Ожидание прерывается сигналом остановки, чтобы задержка перезапуска
+        # не откладывала завершение сервера
+        deadline = time.monotonic() + seconds
+        while not self._stopping:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(remaining, STOP_POLL_SECONDS))
+
+    def _spawn(self) -> None:
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            code = 0
+            try:
+                run_worker(self._sock)
+            except BaseException:
+                logger.exception("Worker %s crashed", os.getpid())
+                code = 1
+            finally:
+                os._exit(code)
+        self._pids.add(pid)
+
+    def _stop(self, signum: int, frame: FrameType | None) -> None:
+        self._terminate()
+
+    def _terminate(self) -> None:
+        self._stopping = True
+        for pid in self._pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=settings.workers)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    if settings.catalog_preload:
+        preload_catalog()
+    sock = bind_socket(args.host, args.port)
+
+    if args.workers <= 1 or not hasattr(os, "fork"):
+        run_worker(sock)
+        return
+
+    # Объекты, созданные до форка, переносятся в постоянное поколение сборщика мусора,
+    # чтобы сборки в рабочих процессах не трогали их страницы памяти
+    gc.freeze()
+    sys.exit(WorkerSupervisor(sock, args.workers).run())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,29 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
     redis_host: str = "localhost"
     redis_port: int = 6379
+    workers: int = 1
     session_timeout_seconds: int = 60
     exercise_data_path: str = "infrastructure/data/json/exercise"
     pose_data_path: str = "infrastructure/data/json/pose"
+    catalog_preload: bool = True
+    catalog_reload_interval_seconds: float = 2.0
     frame_tolerance: int = 3
+    session_state_mode: Literal["strict", "affinity"] = "strict"
+    session_flush_interval_seconds: float = 1.0
+    session_codec: Literal["json", "binary"] = "binary"
+    frame_buffer_size: int = 1
+    max_frames_per_second: float = 0.0
+    evaluation_executor: Literal["inline", "thread"] = "inline"
+    evaluation_threads: int = 1
+    evaluation_batching: bool = False
+    evaluation_batch_window_seconds: float = 0.0
+    tracing_enabled: bool = False
+    otel_endpoint: str = ""
 
     class Config:
         env_file = ".env"
@@ -56,3 +56,20 @@ class Angle(Enum):
     @classmethod
     def get_all_field_names(cls) -> list[str]:
         return [member.name.lower() for member in cls]
+
+    @classmethod
+    def from_feature(cls, feature: "Angle | str") -> "Angle":
+        """
+        Находит угол по признаку правила: самому углу, его имени (LEFT_SHOULDER_ANGLE),
+        имени поля (left_shoulder_angle) или имени без суффикса (LEFT_SHOULDER).
+
+        Raises:
+            ValueError: если признак не соответствует ни одному углу
+        """
+        if isinstance(feature, cls):
+            return feature
+        name = str(feature).upper()
+        for candidate in (name, f"{name}_ANGLE"):
+            if candidate in cls.__members__:
+                return cls.__members__[candidate]
+        raise ValueError(f"Unknown angle feature: {feature}")
@@ -0,0 +1,71 @@
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+from domain.model.angle import Angle
+from domain.model.pose import Pose
+
+_ANGLES = tuple(Angle)
+_ANGLE_POSITIONS = {angle: position for position, angle in enumerate(_ANGLES)}
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class FramePose:
+    """
+    Поза, измеренная на одном кадре. В отличие от эталонной Pose не имеет
+    идентификатора, имени и порога, а углы хранит в массиве в порядке перечисления
+    Angle, чтобы сопоставление с эталонами обходилось без построения словарей.
+
+    Fields:
+        angles (NDArray[float64]): углы в градусах формы (N_angles,) только для чтения
+    """
+
+    angles: npt.NDArray[np.float64]
+
+    def __post_init__(self) -> None:
+        if self.angles.shape != (len(_ANGLES),):
+            raise ValueError(
+                f"angles must have shape ({len(_ANGLES)},), got {self.angles.shape}"
+            )
+        self.angles.flags.writeable = False
+
+    @classmethod
+    def from_angles(cls, angles: npt.ArrayLike) -> "FramePose":
+        """
+        Args:
+            angles (ArrayLike): углы в градусах в порядке перечисления Angle
+
+        Returns:
+            FramePose: измеренная поза
+        """
+        return cls(np.array(angles, dtype=np.float64))
+
+    @classmethod
+    def from_pose(cls, pose: Pose) -> "FramePose":
+        """
+        Args:
+            pose (Pose): поза с углами в полях
+
+        Returns:
+            FramePose: измеренная поза с теми же углами
+        """
+        return cls.from_angles(pose.get_angles_list())
+
+    def __getitem__(self, angle: Angle) -> float:
+        return float(self.angles[_ANGLE_POSITIONS[angle]])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FramePose):
+            return NotImplemented
+        return bool(np.array_equal(self.angles, other.angles))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def get_angles_list(self) -> list[float]:
+        """
+        Returns:
+            list[float]: углы в порядке перечисления Angle
+        """
+        angles: list[float] = self.angles.tolist()
+        return angles
@@ -11,8 +11,20 @@ OPERATORS = {"<": operator.lt, ">": operator.gt}
 
 @dataclass
 class PoseRule(Rule):
+    """
+    Правило позы.
+
+    Fields:
+        id (PoseId): поза, к которой относится правило
+        feature (Angle | str): угол или его имя из каталога (LEFT_SHOULDER); имя
+            приводится к углу через Angle.from_feature при проверке правила
+        operator (str): оператор сравнения отклонения с порогом (ключ OPERATORS)
+        value (float): порог отклонения угла
+        message (str): сообщение пользователю при срабатывании правила
+    """
+
     id: PoseId
-    feature: Angle
+    feature: Angle | str
     operator: str
     value: float
     message: str
@@ -10,3 +10,10 @@ class EntityNotFoundError(RepositoryError):
 class DuplicateSessionError(RepositoryError):
     def __init__(self, session_id: str):
         super().__init__(f"Session with id '{session_id}' already exists")
+
+
+class CatalogLoadError(RepositoryError):
+    def __init__(self, errors: list[str]):
+        self.errors = errors
+        details = "\n".join(f"  - {error}" for error in errors)
+        super().__init__(f"Catalog failed to load ({len(errors)} errors):\n{details}")
@@ -27,3 +27,38 @@ class ExerciseRepository(ABC):
             list[Exercise]: список всех упражнений
         """
         pass
+
+    @property
+    def version(self) -> int:
+        """
+        Версия данных репозитория. Меняется каждый раз, когда данные упражнений перечитываются,
+        поэтому позволяет инвалидировать построенные на их основе кэши.
+
+        Returns:
+            int: номер текущей версии данных
+        """
+        return 0
+
+    def stage(self) -> "ExerciseRepository":
+        """
+        Читает данные упражнений из источника в новый объект репозитория, не меняя
+        текущие данные. Вместе со swap позволяет подготовить новую версию каталога
+        заранее и подменить ее одним шагом. По умолчанию возвращает сам репозиторий.
+
+        Returns:
+            ExerciseRepository: репозиторий с новыми данными
+
+        Raises:
+            CatalogLoadError: если данные в источнике содержат ошибки
+        """
+        return self
+
+    def swap(self, staged: "ExerciseRepository") -> None:
+        """
+        Подменяет данные репозитория данными, подготовленными методом stage,
+        и увеличивает версию данных. По умолчанию ничего не делает.
+
+        Args:
+            staged (ExerciseRepository): результат вызова stage этого репозитория
+        """
+        pass
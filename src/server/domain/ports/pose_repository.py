@@ -17,3 +17,38 @@ class PoseRepository(ABC):
             Pose: объект позы, соответствующий заданному идентификатору
         """
         pass
+
+    @property
+    def version(self) -> int:
+        """
+        Версия данных репозитория. Меняется каждый раз, когда данные поз перечитываются,
+        поэтому позволяет инвалидировать построенные на их основе кэши.
+
+        Returns:
+            int: номер текущей версии данных
+        """
+        return 0
+
+    def stage(self) -> "PoseRepository":
+        """
+        Читает данные поз из источника в новый объект репозитория, не меняя
+        текущие данные. Вместе со swap позволяет подготовить новую версию каталога
+        заранее и подменить ее одним шагом. По умолчанию возвращает сам репозиторий.
+
+        Returns:
+            PoseRepository: репозиторий с новыми данными
+
+        Raises:
+            CatalogLoadError: если данные в источнике содержат ошибки
+        """
+        return self
+
+    def swap(self, staged: "PoseRepository") -> None:
+        """
+        Подменяет данные репозитория данными, подготовленными методом stage,
+        и увеличивает версию данных. По умолчанию ничего не делает.
+
+        Args:
+            staged (PoseRepository): результат вызова stage этого репозитория
+        """
+        pass
@@ -0,0 +1,51 @@
+import numpy as np
+import numpy.typing as npt
+
+from domain.model.angle import Angle
+
+# Матрица индексов точек скелета размера (N_angles, 3): строки идут в порядке
+# перечисления Angle, столбцы - (side_a, vertex, side_b)
+ANGLE_INDICES: npt.NDArray[np.intp] = np.array(
+    [(angle.side_a.index, angle.vertex.index, angle.side_b.index) for angle in Angle],
+    dtype=np.intp,
+)
+
+_MIN_VECTOR_LENGTH = 1e-6
+
+
+def calculate_angles_xy(skeletons: npt.ArrayLike) -> npt.NDArray[np.float64]:
+    """
+    Вычисляет все углы из Angle В ПЛОСКОСТИ XY (Z игнорируется) за один векторизованный проход
+
+    Args:
+        skeletons (ArrayLike): точки одного скелета формы (33, 3) или пачки скелетов формы (F, 33, 3)
+
+    Returns:
+        NDArray[float64]: углы в градусах (0-180) формы (N_angles,) или (F, N_angles)
+            в порядке перечисления Angle
+    """
+    points = np.asarray(skeletons, dtype=np.float64)
+    if points.ndim not in (2, 3) or points.shape[-1] < 2:
+        raise ValueError(
+            f"skeletons must have shape (N, 3) or (F, N, 3), got {points.shape}"
+        )
+
+    xy = points[..., :2]
+    side_a = xy[..., ANGLE_INDICES[:, 0], :]
+    vertex = xy[..., ANGLE_INDICES[:, 1], :]
+    side_b = xy[..., ANGLE_INDICES[:, 2], :]
+
+    v1 = side_a - vertex
+    v2 = side_b - vertex
+
+    angle1 = np.arctan2(v1[..., 1], v1[..., 0])
+    angle2 = np.arctan2(v2[..., 1], v2[..., 0])
+
+    angle_diff = np.abs(angle1 - angle2)
+    angle_diff = np.where(angle_diff > np.pi, 2 * np.pi - angle_diff, angle_diff)
+
+    degenerate = (np.hypot(v1[..., 0], v1[..., 1]) < _MIN_VECTOR_LENGTH) | (
+        np.hypot(v2[..., 0], v2[..., 1]) < _MIN_VECTOR_LENGTH
+    )
+
+    return np.where(degenerate, 0.0, np.degrees(angle_diff))
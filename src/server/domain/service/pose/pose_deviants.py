@@ -1,14 +1,15 @@
+from domain.model.frame_pose import FramePose
 from domain.model.pose import Pose
 from domain.model.angle import Angle
 
 
 def calculate_deviations(
-    current_pose: Pose, reference_pose: Pose
+    current_pose: FramePose, reference_pose: Pose
 ) -> dict[Angle, float]:
     """
     Вычисляет отклонения между текущей позой и эталонной позой.
     Args:
-        current_pose (Pose): текущая поза
+        current_pose (FramePose): текущая поза
         reference_pose (Pose): эталонная поза
     Returns:
         Dict[Angle, float]: словарь, где ключ - угол, значение - отклонение
@@ -24,12 +25,12 @@ def calculate_deviations(
 
 
 def calculate_deviations_with_threshold(
-    current_pose: Pose, reference_pose: Pose
+    current_pose: FramePose, reference_pose: Pose
 ) -> dict[Angle, float]:
     """
     Вычисляет отклонения между текущей позой и эталонной позой с учетом порога допустимых отклонений.
     Args:
-        current_pose (Pose): текущая поза
+        current_pose (FramePose): текущая поза
         reference_pose (Pose): эталонная поза
     Returns:
         Dict[Angle, float]: словарь, где ключ - угол, значение - отклонение с учетом порога
@@ -1,6 +1,10 @@
 from domain.service.pose.pose_matcher.strategy.pose_matcher_strategy import (
     PoseMatcherStrategy,
 )
+from domain.service.pose.pose_matcher.reference_pose_matrix import (
+    ReferencePoseMatrix,
+)
+from domain.model.frame_pose import FramePose
 from domain.model.pose import Pose
 from domain.model.pose_match_result import PoseMatchResult
 
@@ -16,15 +20,28 @@ class PoseMatcher:
         """
         self.reference_poses = reference_poses
         self.strategy = strategy
+        self._reference_matrix = ReferencePoseMatrix.from_poses(reference_poses)
 
-    def match(self, current_pose: Pose) -> PoseMatchResult:
+    def match(self, current_pose: FramePose) -> PoseMatchResult:
         """
         Находит ближайшую эталонную позу для заданной текущей позы с учетом отклонений.
 
         Args:
-            current_pose (Pose): текущая поза
+            current_pose (FramePose): текущая поза
 
         Returns:
             PoseMatchResult: результат соответствия поз
         """
-        return self.strategy.match(current_pose, self.reference_poses)
+        return self.strategy.match(current_pose, self._reference_matrix)
+
+    def match_batch(self, current_poses: list[FramePose]) -> list[PoseMatchResult]:
+        """
+        Находит ближайшие эталонные позы для пачки текущих поз.
+
+        Args:
+            current_poses (list[FramePose]): текущие позы в порядке кадров
+
+        Returns:
+            list[PoseMatchResult]: результаты соответствия поз в порядке кадров
+        """
+        return self.strategy.match_batch(current_poses, self._reference_matrix)
@@ -0,0 +1,70 @@
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+from domain.model.angle import Angle
+from domain.model.pose import Pose
+
+
+@dataclass(frozen=True)
+class ReferencePoseMatrix:
+    """
+    Скомпилированный набор эталонных поз. Границы допустимых диапазонов углов всех поз
+    хранятся в непрерывных массивах, чтобы сравнивать текущую позу со всеми эталонами
+    одной операцией над массивами.
+
+    Fields:
+        poses (list[Pose]): эталонные позы в исходном порядке
+        lower (NDArray[float64]): нижние границы углов формы (N_poses, N_angles)
+        upper (NDArray[float64]): верхние границы углов формы (N_poses, N_angles)
+    """
+
+    poses: list[Pose]
+    lower: npt.NDArray[np.float64]
+    upper: npt.NDArray[np.float64]
+
+    @classmethod
+    def from_poses(cls, poses: list[Pose]) -> "ReferencePoseMatrix":
+        """
+        Компилирует список эталонных поз в матрицы границ.
+
+        Args:
+            poses (list[Pose]): список эталонных поз
+
+        Returns:
+            ReferencePoseMatrix: скомпилированный набор эталонных поз
+        """
+        angles = np.array(
+            [pose.get_angles_list() for pose in poses], dtype=np.float64
+        ).reshape(len(poses), len(Angle))
+        thresholds = np.array(
+            [pose.threshold for pose in poses], dtype=np.float64
+        ).reshape(-1, 1)
+
+        lower = angles - thresholds
+        upper = angles + thresholds
+        lower.flags.writeable = False
+        upper.flags.writeable = False
+
+        return cls(poses=list(poses), lower=lower, upper=upper)
+
+    def __len__(self) -> int:
+        return len(self.poses)
+
+    def deviations(self, angles: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """
+        Вычисляет отклонения углов текущей позы от диапазонов всех эталонных поз.
+
+        Args:
+            angles (ArrayLike): углы текущей позы формы (N_angles,) или пачки поз
+                формы (F, N_angles) в порядке перечисления Angle
+
+        Returns:
+            NDArray[float64]: отклонения формы (N_poses, N_angles) или
+                (F, N_poses, N_angles); внутри диапазона - 0
+        """
+        current = np.asarray(angles, dtype=np.float64)[..., np.newaxis, :]
+        return np.maximum(self.lower - current, 0.0) + np.maximum(
+            current - self.upper, 0.0
+        )
@@ -1,27 +1,81 @@
+import numpy as np
+import numpy.typing as npt
+
+from domain.service.pose.pose_matcher.reference_pose_matrix import (
+    ReferencePoseMatrix,
+)
 from domain.service.pose.pose_matcher.strategy.pose_matcher_strategy import (
     PoseMatcherStrategy,
 )
-from domain.model.pose import Pose
+from domain.model.angle import Angle
+from domain.model.frame_pose import FramePose
 from domain.model.pose_match_result import PoseMatchResult
-from domain.service.pose.pose_deviants import calculate_deviations_with_threshold
 
 
 class PenaltyStrategy(PoseMatcherStrategy):
-    def match(self, current_pose: Pose, reference_poses: list[Pose]) -> PoseMatchResult:
-        best_match = None
-        min_penalty = float("inf")
+    def match(
+        self, current_pose: FramePose, reference_poses: ReferencePoseMatrix
+    ) -> PoseMatchResult:
+        if len(reference_poses) == 0:
+            raise ValueError("No best match found")
 
-        for reference_pose in reference_poses:
-            deviations = calculate_deviations_with_threshold(
-                current_pose, reference_pose
+        deviations = reference_poses.deviations(current_pose.angles)
+        best_index = int(self._best_indices(deviations.sum(axis=1)))
+        return self._to_result(reference_poses, best_index, deviations[best_index])
+
+    def match_batch(
+        self, current_poses: list[FramePose], reference_poses: ReferencePoseMatrix
+    ) -> list[PoseMatchResult]:
+        if len(reference_poses) == 0:
+            raise ValueError("No best match found")
+        if not current_poses:
+            return []
+
+        angles = np.stack([pose.angles for pose in current_poses])
+        deviations = reference_poses.deviations(angles)
+        best_indices = self._best_indices(deviations.sum(axis=2))
+        frames = np.arange(len(current_poses))
+
+        return [
+            self._to_result(reference_poses, best_index, best_deviations)
+            for best_index, best_deviations in zip(
+                best_indices.tolist(), deviations[frames, best_indices], strict=True
             )
-            penalty = sum(deviations.values())
+        ]
+
+    @staticmethod
+    def _best_indices(penalties: npt.NDArray[np.float64]) -> npt.NDArray[np.intp]:
+        """
+        Выбирает эталон с наименьшим штрафом по последней оси. Эталоны с нечисловым
+        штрафом (NaN, inf) не участвуют в выборе.
+
+        Args:
+            penalties (NDArray[float64]): штрафы формы (N_poses,) или (F, N_poses)
 
-            if penalty < min_penalty:
-                min_penalty = penalty
-                best_match = PoseMatchResult(pose=reference_pose, deviations=deviations)
+        Returns:
+            NDArray[intp]: индексы лучших эталонов
 
-        if best_match is None:
+        Raises:
+            ValueError: если для какого-либо кадра все штрафы нечисловые
+        """
+        finite = np.isfinite(penalties)
+        if not np.all(finite.any(axis=-1)):
             raise ValueError("No best match found")
+        return np.argmin(np.where(finite, penalties, np.inf), axis=-1)
 
-        return best_match
+    @staticmethod
+    def _to_result(
+        reference_poses: ReferencePoseMatrix,
+        best_index: int,
+        best_deviations: npt.NDArray[np.float64],
+    ) -> PoseMatchResult:
+        return PoseMatchResult(
+            pose=reference_poses.poses[best_index],
+            deviations={
+                angle: deviation
+                for angle, deviation in zip(
+                    Angle, best_deviations.tolist(), strict=True
+                )
+                if deviation > 0
+            },
+        )
@@ -1,20 +1,41 @@
 from abc import ABC, abstractmethod
 
-from domain.model.pose import Pose
+from domain.model.frame_pose import FramePose
 from domain.model.pose_match_result import PoseMatchResult
+from domain.service.pose.pose_matcher.reference_pose_matrix import (
+    ReferencePoseMatrix,
+)
 
 
 class PoseMatcherStrategy(ABC):
     @abstractmethod
-    def match(self, current_pose: Pose, reference_poses: list[Pose]) -> PoseMatchResult:
+    def match(
+        self, current_pose: FramePose, reference_poses: ReferencePoseMatrix
+    ) -> PoseMatchResult:
         """
         Абстрактный метод для сравнения текущей позы с эталонной позой и получения результата соответствия.
 
         Args:
-            current_pose (Pose): текущая поза
-            reference_poses (list[Pose]): список эталонных поз
+            current_pose (FramePose): текущая поза
+            reference_poses (ReferencePoseMatrix): скомпилированный набор эталонных поз
 
         Returns:
             PoseMatchResult: результат соответствия поз
         """
         pass
+
+    def match_batch(
+        self, current_poses: list[FramePose], reference_poses: ReferencePoseMatrix
+    ) -> list[PoseMatchResult]:
+        """
+        Сравнивает пачку поз с эталонными. По умолчанию вызывает match для каждой позы;
+        стратегии могут переопределить метод для векторизованного сравнения.
+
+        Args:
+            current_poses (list[FramePose]): текущие позы в порядке кадров
+            reference_poses (ReferencePoseMatrix): скомпилированный набор эталонных поз
+
+        Returns:
+            list[PoseMatchResult]: результаты соответствия в порядке кадров
+        """
+        return [self.match(pose, reference_poses) for pose in current_poses]
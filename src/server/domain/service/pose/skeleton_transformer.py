@@ -1,8 +1,12 @@
 import math
 from typing import List
-from domain.model.pose import Pose
+
+import numpy as np
+import numpy.typing as npt
+
 from domain.model.angle import Angle
-from domain.model.pose_id import PoseId
+from domain.model.frame_pose import FramePose
+from domain.service.pose.angle_engine import calculate_angles_xy
 
 
 def calculate_angle_xy(skeleton: List[List[float]], angle: Angle) -> float:
@@ -44,26 +48,31 @@ def calculate_angle_xy(skeleton: List[List[float]], angle: Angle) -> float:
     return math.degrees(angle_diff)
 
 
-def landmarks_to_pose(skeleton: List[List[float]]) -> Pose:
+def landmarks_to_pose(skeleton: npt.ArrayLike) -> FramePose:
     """
-    Переводит точки цифрового скелета в объект Pose
+    Переводит точки цифрового скелета в измеренную позу FramePose
 
     Args:
-        skeleton (List[List[float]]): матрица точек цифрового скелета. Каждый элемент внешнего списка представляет собой набор координат [x, y, z]
+        skeleton (ArrayLike): матрица точек цифрового скелета формы (33, 3). Каждая строка представляет собой набор координат [x, y, z]
+
+    Returns:
+        FramePose: поза с вычисленными углами
+    """
+    return FramePose(calculate_angles_xy(skeleton))
+
+
+def landmarks_to_poses(skeletons: npt.ArrayLike) -> list[FramePose]:
+    """
+    Переводит пачку цифровых скелетов в позы FramePose за один векторизованный проход.
+    Позы ссылаются на строки общего массива углов без копирования
+
+    Args:
+        skeletons (ArrayLike): массив точек цифровых скелетов формы (F, 33, 3)
 
     Returns:
-        Pose: объект позы с вычисленными углами, пустым именем и нулевым порогом
+        list[FramePose]: список поз в порядке кадров
     """
-    return Pose(
-        id=PoseId(""),
-        name="",
-        threshold=0.0,
-        left_shoulder_angle=calculate_angle_xy(skeleton, Angle.LEFT_SHOULDER_ANGLE),
-        right_shoulder_angle=calculate_angle_xy(skeleton, Angle.RIGHT_SHOULDER_ANGLE),
-        left_elbow_angle=calculate_angle_xy(skeleton, Angle.LEFT_ELBOW_ANGLE),
-        right_elbow_angle=calculate_angle_xy(skeleton, Angle.RIGHT_ELBOW_ANGLE),
-        left_knee_angle=calculate_angle_xy(skeleton, Angle.LEFT_KNEE_ANGLE),
-        right_knee_angle=calculate_angle_xy(skeleton, Angle.RIGHT_KNEE_ANGLE),
-        left_hip_angle=calculate_angle_xy(skeleton, Angle.LEFT_HIP_ANGLE),
-        right_hip_angle=calculate_angle_xy(skeleton, Angle.RIGHT_HIP_ANGLE),
-    )
+    points = np.asarray(skeletons, dtype=np.float64)
+    if points.ndim != 3:
+        raise ValueError(f"skeletons must have shape (F, N, 3), got {points.shape}")
+    return [FramePose(row) for row in calculate_angles_xy(points)]
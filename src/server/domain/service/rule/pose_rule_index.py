@@ -0,0 +1,84 @@
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+from domain.model.angle import Angle
+from domain.model.pose_id import PoseId
+from domain.model.pose_match_result import PoseMatchResult
+from domain.model.pose_rule import OPERATORS, PoseRule
+
+_ANGLE_POSITIONS = {angle: position for position, angle in enumerate(Angle)}
+
+
+@dataclass(frozen=True)
+class CompiledPoseRules:
+    """
+    Правила одной позы, скомпилированные в массивы для векторизованной проверки.
+
+    Fields:
+        rules (list[PoseRule]): правила в исходном порядке
+        angle_indices (NDArray[intp]): позиция угла каждого правила в перечислении Angle
+        signs (NDArray[float64]): +1 для оператора ">", -1 для "<"; правило нарушено,
+            если sign * (deviation - value) > 0
+        values (NDArray[float64]): пороговые значения правил
+    """
+
+    rules: list[PoseRule]
+    angle_indices: npt.NDArray[np.intp]
+    signs: npt.NDArray[np.float64]
+    values: npt.NDArray[np.float64]
+
+    @classmethod
+    def from_rules(cls, rules: list[PoseRule]) -> "CompiledPoseRules":
+        for rule in rules:
+            if rule.operator not in OPERATORS:
+                raise ValueError(f"Unknown rule operator: {rule.operator}")
+        return cls(
+            rules=list(rules),
+            angle_indices=np.array(
+                [_ANGLE_POSITIONS[Angle.from_feature(rule.feature)] for rule in rules],
+                dtype=np.intp,
+            ),
+            signs=np.array(
+                [1.0 if rule.operator == ">" else -1.0 for rule in rules],
+                dtype=np.float64,
+            ),
+            values=np.array([rule.value for rule in rules], dtype=np.float64),
+        )
+
+    def violations(self, deviations: npt.NDArray[np.float64]) -> list[PoseRule]:
+        """
+        Args:
+            deviations (NDArray[float64]): отклонения углов в порядке перечисления Angle
+
+        Returns:
+            list[PoseRule]: нарушенные правила в исходном порядке
+        """
+        violated = self.signs * (deviations[self.angle_indices] - self.values) > 0
+        return [self.rules[i] for i in np.flatnonzero(violated).tolist()]
+
+
+class PoseRuleIndex:
+    """
+    Индекс правил упражнения по идентификатору позы: при проверке кадра затрагиваются
+    только правила сопоставленной позы, и они проверяются одним сравнением массивов.
+    """
+
+    def __init__(self, rules: list[PoseRule]) -> None:
+        grouped: dict[PoseId, list[PoseRule]] = {}
+        for rule in rules:
+            grouped.setdefault(rule.id, []).append(rule)
+        self._index = {
+            pose_id: CompiledPoseRules.from_rules(pose_rules)
+            for pose_id, pose_rules in grouped.items()
+        }
+
+    def validate(self, match_result: PoseMatchResult) -> list[PoseRule]:
+        compiled = self._index.get(match_result.pose.id)
+        if compiled is None:
+            return []
+        deviations = np.zeros(len(_ANGLE_POSITIONS), dtype=np.float64)
+        for angle, deviation in match_result.deviations.items():
+            deviations[_ANGLE_POSITIONS[angle]] = deviation
+        return compiled.violations(deviations)
@@ -0,0 +1,20 @@
+from domain.model.pose_match_result import PoseMatchResult
+from domain.model.pose_rule import PoseRule
+from domain.service.rule.pose_rule_index import PoseRuleIndex
+from domain.service.rule.rule_validator import RuleValidator
+
+
+class PoseRuleValidator(RuleValidator[PoseRule, PoseMatchResult]):
+    """
+    Валидатор правил позы, который при создании строит индекс правил по позам
+    (PoseRuleIndex) и проверяет только правила сопоставленной позы. Результат
+    совпадает с проверкой каждого правила через PoseRuleStrategy, но сама стратегия
+    валидатору не нужна, поэтому конструктор базового класса не вызывается.
+    """
+
+    def __init__(self, rules: list[PoseRule]) -> None:
+        self._rules = rules
+        self._index = PoseRuleIndex(rules)
+
+    def validate(self, data: PoseMatchResult) -> list[PoseRule]:
+        return self._index.validate(data)
@@ -0,0 +1,81 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+type CatalogSnapshot = dict[Path, tuple[int, int]]
+
+
+def take_snapshot(directories: list[Path]) -> CatalogSnapshot:
+    """
+    Снимает состояние JSON-файлов каталога: время изменения и размер каждого файла.
+
+    Args:
+        directories (list[Path]): каталоги с JSON-файлами
+
+    Returns:
+        CatalogSnapshot: словарь путь -> (mtime_ns, size)
+    """
+    snapshot: CatalogSnapshot = {}
+    for directory in directories:
+        for file in directory.glob("*.json"):
+            try:
+                stat = file.stat()
+            except FileNotFoundError:
+                continue
+            snapshot[file] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+class JsonCatalogWatcher:
+    """
+    Следит за JSON-файлами каталога опросом времени изменения и при добавлении,
+    удалении или изменении файлов вызывает перезагрузку каталога. Опрос диска
+    выполняется в пуле потоков, чтобы не задерживать обработку кадров.
+    """
+
+    def __init__(
+        self,
+        directories: list[str],
+        on_change: Callable[[], Awaitable[None]],
+        interval: float,
+    ) -> None:
+        self._directories = [Path(directory) for directory in directories]
+        self._on_change = on_change
+        self._interval = interval
+        self._snapshot: CatalogSnapshot | None = None
+
+    async def check(self) -> bool:
+        """
+        Сравнивает текущее состояние файлов с предыдущим и при изменениях вызывает
+        перезагрузку. Первый вызов только запоминает состояние. Состояние
+        запоминается только после успешной перезагрузки, поэтому неудачная
+        перезагрузка повторяется при следующей проверке.
+
+        Returns:
+            bool: True, если была вызвана перезагрузка
+        """
+        snapshot = await asyncio.to_thread(take_snapshot, self._directories)
+        previous = self._snapshot
+        if previous is None:
+            self._snapshot = snapshot
+            return False
+        if previous == snapshot:
+            return False
+
+        await self._on_change()
+        self._snapshot = snapshot
+        return True
+
+    async def run(self) -> None:
+        """
+        Опрашивает файлы каталога с заданным интервалом до отмены задачи.
+        """
+        while True:
+            try:
+                await self.check()
+            except Exception:
+                logger.exception("Failed to reload catalog")
+            await asyncio.sleep(self._interval)
@@ -4,27 +4,95 @@ from domain.model.exercise import Exercise
 from domain.model.exercise_id import ExerciseId
 from domain.model.pose_id import PoseId
 from domain.model.pose_rule import PoseRule
-from domain.ports.errors import EntityNotFoundError
+from domain.ports.errors import CatalogLoadError, EntityNotFoundError
 from domain.ports.exercise_repository import ExerciseRepository
 import json
 from infrastructure.persistence.json.errors import (
     InvalidDirectoryError,
     JsonParseError,
     JsonReadError,
+    JsonRepositoryError,
 )
 
 
 class JsonExerciseRepository(ExerciseRepository):
-    def __init__(self, directory_path: str) -> None:
+    """
+    Репозиторий упражнений в JSON-файлах. По умолчанию файлы читаются лениво при
+    первом обращении. В режиме preload все файлы читаются и проверяются при создании
+    репозитория, а дальнейшие обращения обслуживаются из памяти без доступа к диску.
+    """
+
+    def __init__(self, directory_path: str, preload: bool = False) -> None:
         self._directory_path = Path(directory_path)
         if not self._directory_path.is_dir():
             raise InvalidDirectoryError(directory_path)
+        self._preload = preload
         self._cache: dict[ExerciseId, Exercise] = {}
+        self._all: list[Exercise] | None = None
+        self._version = 0
+        if preload:
+            self._load_all()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def stage(self) -> "JsonExerciseRepository":
+        """
+        Читает и проверяет все файлы каталога в новый репозиторий; текущие данные
+        не меняются.
+        """
+        return JsonExerciseRepository(str(self._directory_path), preload=True)
+
+    def swap(self, staged: ExerciseRepository) -> None:
+        if not isinstance(staged, JsonExerciseRepository):
+            raise TypeError(f"Cannot swap in {type(staged).__name__}")
+        self._cache = dict(staged._cache)
+        self._all = list(staged._all) if staged._all is not None else None
+        self._version += 1
 
     def get_by_id(self, exercise_id: ExerciseId) -> Exercise:
         if exercise_id in self._cache:
             return self._cache[exercise_id]
+        if self._preload:
+            raise EntityNotFoundError("Exercise", exercise_id.id)
 
+        exercise = self._read(exercise_id)
+        self._cache[exercise_id] = exercise
+        return exercise
+
+    def get_all(self) -> list[Exercise]:
+        if self._all is not None:
+            return list(self._all)
+
+        exercises = []
+        for file in self._directory_path.glob("*.json"):
+            try:
+                exercise_id = ExerciseId(file.stem)
+                exercise = self.get_by_id(exercise_id)
+                exercises.append(exercise)
+            except json.JSONDecodeError as e:
+                raise JsonReadError(str(file), e)
+            except (KeyError, TypeError, ValueError) as e:
+                raise JsonParseError(str(file), e)
+        return exercises
+
+    def _load_all(self) -> None:
+        exercises: dict[ExerciseId, Exercise] = {}
+        errors: list[str] = []
+        for file in sorted(self._directory_path.glob("*.json")):
+            try:
+                exercise_id = ExerciseId(file.stem)
+                exercises[exercise_id] = self._read(exercise_id)
+            except JsonRepositoryError as e:
+                errors.append(str(e))
+        if errors:
+            raise CatalogLoadError(errors)
+
+        self._cache = exercises
+        self._all = list(exercises.values())
+
+    def _read(self, exercise_id: ExerciseId) -> Exercise:
         exercise_path = self._directory_path / f"{exercise_id}.json"
 
         try:
@@ -36,7 +104,7 @@ class JsonExerciseRepository(ExerciseRepository):
             raise JsonReadError(str(exercise_path), e)
 
         try:
-            exercise = Exercise(
+            return Exercise(
                 id=ExerciseId(serialized_exercise["id"]),
                 name=serialized_exercise["name"],
                 poses=[PoseId(p) for p in serialized_exercise["poses"]],
@@ -51,20 +119,5 @@ class JsonExerciseRepository(ExerciseRepository):
                     for r in serialized_exercise.get("pose_rules", [])
                 ],
             )
-            self._cache[exercise_id] = exercise
-            return exercise
         except (KeyError, TypeError, ValueError) as e:
             raise JsonParseError(str(exercise_path), e)
-
-    def get_all(self) -> list[Exercise]:
-        exercises = []
-        for file in self._directory_path.glob("*.json"):
-            try:
-                exercise_id = ExerciseId(file.stem)
-                exercise = self.get_by_id(exercise_id)
-                exercises.append(exercise)
-            except json.JSONDecodeError as e:
-                raise JsonReadError(str(file), e)
-            except (KeyError, TypeError, ValueError) as e:
-                raise JsonParseError(str(file), e)
-        return exercises
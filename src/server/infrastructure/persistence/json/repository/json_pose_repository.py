@@ -3,26 +3,74 @@ from pathlib import Path
 
 from domain.model.pose import Pose
 from domain.model.pose_id import PoseId
-from domain.ports.errors import EntityNotFoundError
+from domain.ports.errors import CatalogLoadError, EntityNotFoundError
 from domain.ports.pose_repository import PoseRepository
 from infrastructure.persistence.json.errors import (
     InvalidDirectoryError,
     JsonParseError,
     JsonReadError,
+    JsonRepositoryError,
 )
 
 
 class JsonPoseRepository(PoseRepository):
-    def __init__(self, directory_path: str) -> None:
+    """
+    Репозиторий эталонных поз в JSON-файлах. По умолчанию файлы читаются лениво при
+    первом обращении; в режиме preload все позы читаются и проверяются при создании.
+    """
+
+    def __init__(self, directory_path: str, preload: bool = False) -> None:
         self._directory_path = Path(directory_path)
         if not self._directory_path.is_dir():
             raise InvalidDirectoryError(directory_path)
+        self._preload = preload
         self._cache: dict[PoseId, Pose] = {}
+        self._version = 0
+        if preload:
+            self._load_all()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def stage(self) -> "JsonPoseRepository":
+        """
+        Читает и проверяет все файлы каталога в новый репозиторий; текущие данные
+        не меняются.
+        """
+        return JsonPoseRepository(str(self._directory_path), preload=True)
+
+    def swap(self, staged: PoseRepository) -> None:
+        if not isinstance(staged, JsonPoseRepository):
+            raise TypeError(f"Cannot swap in {type(staged).__name__}")
+        self._cache = dict(staged._cache)
+        self._version += 1
 
     def get_by_id(self, pose_id: PoseId) -> Pose:
         if pose_id in self._cache:
             return self._cache[pose_id]
+        if self._preload:
+            raise EntityNotFoundError("Pose", pose_id.id)
+
+        pose = self._read(pose_id)
+        self._cache[pose_id] = pose
+        return pose
+
+    def _load_all(self) -> None:
+        poses: dict[PoseId, Pose] = {}
+        errors: list[str] = []
+        for file in sorted(self._directory_path.glob("*.json")):
+            try:
+                pose_id = PoseId(file.stem)
+                poses[pose_id] = self._read(pose_id)
+            except JsonRepositoryError as e:
+                errors.append(str(e))
+        if errors:
+            raise CatalogLoadError(errors)
+
+        self._cache = poses
 
+    def _read(self, pose_id: PoseId) -> Pose:
         pose_path = self._directory_path / f"{pose_id}.json"
 
         try:
@@ -35,8 +83,6 @@ class JsonPoseRepository(PoseRepository):
 
         try:
             serialized_pose["id"] = PoseId(serialized_pose["id"])
-            pose = Pose(**serialized_pose)
-            self._cache[pose_id] = pose
-            return pose
+            return Pose(**serialized_pose)
         except (KeyError, TypeError, ValueError) as e:
             raise JsonParseError(str(pose_path), e)
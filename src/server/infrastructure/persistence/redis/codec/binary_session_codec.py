@@ -0,0 +1,58 @@
+import struct
+
+from domain.model.exercise_id import ExerciseId
+from domain.model.exercise_state import ExerciseState
+from domain.model.session import Session
+from domain.model.session_id import SessionId
+from infrastructure.persistence.redis.codec.json_session_codec import JsonSessionCodec
+from infrastructure.persistence.redis.codec.session_codec import SessionCodec
+
+BINARY_FORMAT_VERSION = 1
+
+# version, current_pose_index, frame_tolerance_counter, len(exercise_id)
+_HEADER = struct.Struct("!BIIH")
+_JSON_PREFIX = b"{"
+
+
+class BinarySessionCodec(SessionCodec):
+    """
+    Компактное двоичное представление сессии: заголовок фиксированного размера с тегом
+    версии формата и счетчиками состояния, за которым следуют идентификаторы упражнения
+    и сессии в UTF-8. Записи в старом JSON-формате по-прежнему декодируются.
+    """
+
+    def __init__(self) -> None:
+        self._json_codec = JsonSessionCodec()
+
+    def encode(self, session: Session) -> bytes:
+        exercise_id = session.exercise_id.id.encode("utf-8")
+        state = session.exercise_state
+        return (
+            _HEADER.pack(
+                BINARY_FORMAT_VERSION,
+                state.current_pose_index,
+                state.frame_tolerance_counter,
+                len(exercise_id),
+            )
+            + exercise_id
+            + session.session_id.id.encode("utf-8")
+        )
+
+    def decode(self, data: bytes) -> Session:
+        if data.startswith(_JSON_PREFIX):
+            return self._json_codec.decode(data)
+
+        version, pose_index, counter, exercise_id_length = _HEADER.unpack_from(data)
+        if version != BINARY_FORMAT_VERSION:
+            raise ValueError(f"Unsupported session format version: {version}")
+
+        exercise_id_end = _HEADER.size + exercise_id_length
+        return Session(
+            session_id=SessionId(data[exercise_id_end:].decode("utf-8")),
+            exercise_id=ExerciseId(
+                data[_HEADER.size : exercise_id_end].decode("utf-8")
+            ),
+            exercise_state=ExerciseState(
+                current_pose_index=pose_index, frame_tolerance_counter=counter
+            ),
+        )
@@ -0,0 +1,12 @@
+from domain.model.session import Session
+from infrastructure.persistence.redis.codec.session_codec import SessionCodec
+from infrastructure.persistence.redis.mapper.session_mapper import SessionMapper
+from infrastructure.persistence.redis.model.session import RedisSession
+
+
+class JsonSessionCodec(SessionCodec):
+    def encode(self, session: Session) -> bytes:
+        return SessionMapper.map_to(session).model_dump_json().encode("utf-8")
+
+    def decode(self, data: bytes) -> Session:
+        return SessionMapper.map_from(RedisSession.model_validate_json(data))
@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+
+from domain.model.session import Session
+
+
+class SessionCodec(ABC):
+    @abstractmethod
+    def encode(self, session: Session) -> bytes:
+        """
+        Кодирует сессию в значение, которое сохраняется в Redis.
+
+        Args:
+            session (Session): сессия
+
+        Returns:
+            bytes: закодированная сессия
+        """
+        pass
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Session:
+        """
+        Восстанавливает сессию из значения, прочитанного из Redis.
+
+        Args:
+            data (bytes): закодированная сессия
+
+        Returns:
+            Session: сессия
+        """
+        pass
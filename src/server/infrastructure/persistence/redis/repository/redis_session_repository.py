@@ -10,37 +10,47 @@ from infrastructure.persistence.redis.errors import (
     RedisConnectionError,
     RedisOperationError,
 )
-from infrastructure.persistence.redis.mapper.session_mapper import SessionMapper
-from infrastructure.persistence.redis.model.session import RedisSession
+from infrastructure.persistence.redis.codec.binary_session_codec import (
+    BinarySessionCodec,
+)
+from infrastructure.persistence.redis.codec.session_codec import SessionCodec
 
 
 class RedisSessionRepository(SessionRepository):
-    def __init__(self, redis_client: redis.Redis, ttl: int):
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        ttl: int,
+        codec: SessionCodec | None = None,
+    ):
         self._redis_client = redis_client
         self._ttl = ttl
+        self._codec = codec or BinarySessionCodec()
 
     async def create(self, session: Session) -> SessionId:
-        key = self._key(session.session_id)
-
-        exists = await self._exists(key, "create session")
-
-        if exists:
+        created = await self._set(
+            self._key(session.session_id),
+            self._codec.encode(session),
+            "create session",
+            nx=True,
+        )
+
+        if not created:
             raise DuplicateSessionError(session.session_id.id)
 
-        data_to_save = SessionMapper.map_to(session)
-        await self._set(key, data_to_save.model_dump_json(), "create session")
         return session.session_id
 
     async def update(self, session: Session) -> SessionId:
-        key = self._key(session.session_id)
-
-        exists = await self._exists(key, "update session")
-
-        if not exists:
+        updated = await self._set(
+            self._key(session.session_id),
+            self._codec.encode(session),
+            "update session",
+            xx=True,
+        )
+
+        if not updated:
             raise EntityNotFoundError("Session", session.session_id.id)
 
-        data_to_update = SessionMapper.map_to(session)
-        await self._set(key, data_to_update.model_dump_json(), "update session")
         return session.session_id
 
     async def get(self, session_id: SessionId) -> Session:
@@ -54,10 +64,70 @@ class RedisSessionRepository(SessionRepository):
         if not session:
             raise EntityNotFoundError("Session", session_id.id)
 
+        return self._decode(session, "get session")
+
+    async def get_many(self, session_ids: list[SessionId]) -> dict[SessionId, Session]:
+        """
+        Читает несколько сессий за один запрос к Redis.
+
+        Args:
+            session_ids (list[SessionId]): идентификаторы сессий
+
+        Returns:
+            dict[SessionId, Session]: найденные сессии; отсутствующие пропускаются
+        """
+        if not session_ids:
+            return {}
+
         try:
-            return SessionMapper.map_from(RedisSession.model_validate_json(session))
+            values = await self._redis_client.mget(
+                [self._key(session_id) for session_id in session_ids]
+            )
+        except (RedisConnectionException, RedisTimeoutException) as exc:
+            raise RedisConnectionError(exc) from exc
         except Exception as exc:
-            raise RedisOperationError("get session", exc) from exc
+            raise RedisOperationError("get sessions", exc) from exc
+
+        return {
+            session_id: self._decode(value, "get sessions")
+            for session_id, value in zip(session_ids, values, strict=True)
+            if value
+        }
+
+    async def update_many(self, sessions: list[Session]) -> list[SessionId]:
+        """
+        Обновляет несколько существующих сессий за один запрос к Redis.
+        Каждая сессия записывается атомарно и только если она уже существует.
+
+        Args:
+            sessions (list[Session]): сессии для обновления
+
+        Returns:
+            list[SessionId]: идентификаторы обновленных сессий; несуществующие пропускаются
+        """
+        if not sessions:
+            return []
+
+        try:
+            async with self._redis_client.pipeline(transaction=False) as pipe:
+                for session in sessions:
+                    pipe.set(
+                        self._key(session.session_id),
+                        self._codec.encode(session),
+                        ex=self._ttl,
+                        xx=True,
+                    )
+                results = await pipe.execute()
+        except (RedisConnectionException, RedisTimeoutException) as exc:
+            raise RedisConnectionError(exc) from exc
+        except Exception as exc:
+            raise RedisOperationError("update sessions", exc) from exc
+
+        return [
+            session.session_id
+            for session, updated in zip(sessions, results, strict=True)
+            if updated
+        ]
 
     async def delete(self, session_id: SessionId) -> None:
         try:
@@ -70,18 +140,28 @@ class RedisSessionRepository(SessionRepository):
     def _key(self, session_id: SessionId) -> str:
         return f"session:{session_id.id}"
 
-    async def _exists(self, key: str, operation: str) -> bool:
+    async def _set(
+        self,
+        key: str,
+        value: bytes,
+        operation: str,
+        nx: bool = False,
+        xx: bool = False,
+    ) -> bool:
         try:
-            return bool(await self._redis_client.exists(key))
+            result = await self._redis_client.set(
+                key, value, ex=self._ttl, nx=nx, xx=xx
+            )
         except (RedisConnectionException, RedisTimeoutException) as exc:
             raise RedisConnectionError(exc) from exc
         except Exception as exc:
             raise RedisOperationError(operation, exc) from exc
+        return bool(result)
 
-    async def _set(self, key: str, value: str, operation: str) -> None:
+    def _decode(self, value: bytes | str, operation: str) -> Session:
+        if isinstance(value, str):
+            value = value.encode("utf-8")
         try:
-            await self._redis_client.set(key, value, ex=self._ttl)
-        except (RedisConnectionException, RedisTimeoutException) as exc:
-            raise RedisConnectionError(exc) from exc
+            return self._codec.decode(value)
         except Exception as exc:
             raise RedisOperationError(operation, exc) from exc
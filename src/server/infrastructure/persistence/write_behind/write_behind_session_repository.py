@@ -0,0 +1,83 @@
+import time
+from collections.abc import Callable
+
+from domain.model.session import Session
+from domain.model.session_id import SessionId
+from domain.ports.session_repository import SessionRepository
+
+
+class WriteBehindSessionRepository(SessionRepository):
+    """
+    Репозиторий сессии, привязанный к одному WebSocket-соединению. Состояние сессии
+    хранится в памяти соединения, а в основное хранилище записывается отложенно:
+    по истечении интервала сброса, при смене текущей позы и при явном вызове flush().
+    По истечении интервала состояние записывается, даже если оно не изменилось: запись
+    продлевает время жизни сессии в основном хранилище.
+
+    Интервал проверяется только в update(), поэтому, пока кадры не приходят, изменения
+    записывает владелец репозитория, периодически вызывая flush().
+    """
+
+    def __init__(
+        self,
+        backing_repository: SessionRepository,
+        flush_interval: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._backing_repository = backing_repository
+        self._flush_interval = flush_interval
+        self._clock = clock
+        self._session: Session | None = None
+        self._flushed_session: Session | None = None
+        self._last_flush_at = 0.0
+
+    async def create(self, session: Session) -> SessionId:
+        return await self._backing_repository.create(session)
+
+    async def update(self, session: Session) -> SessionId:
+        self._session = session
+        if self._should_flush(session):
+            await self._write(session)
+        return session.session_id
+
+    async def get(self, session_id: SessionId) -> Session:
+        if self._session is not None and self._session.session_id == session_id:
+            return self._session
+
+        session = await self._backing_repository.get(session_id)
+        self._session = session
+        self._flushed_session = session
+        self._last_flush_at = self._clock()
+        return session
+
+    async def delete(self, session_id: SessionId) -> None:
+        if self._session is not None and self._session.session_id == session_id:
+            self._session = None
+            self._flushed_session = None
+        await self._backing_repository.delete(session_id)
+
+    async def flush(self) -> None:
+        """
+        Записывает текущее состояние сессии в основное хранилище, если оно изменилось
+        с момента последней записи.
+        """
+        session = self._session
+        if session is None or session == self._flushed_session:
+            return
+        await self._write(session)
+
+    async def _write(self, session: Session) -> None:
+        await self._backing_repository.update(session)
+        self._flushed_session = session
+        self._last_flush_at = self._clock()
+
+    def _should_flush(self, session: Session) -> bool:
+        flushed = self._flushed_session
+        if flushed is None or flushed.session_id != session.session_id:
+            return True
+        if (
+            session.exercise_state.current_pose_index
+            != flushed.exercise_state.current_pose_index
+        ):
+            return True
+        return self._clock() - self._last_flush_at >= self._flush_interval
@@ -0,0 +1,37 @@
+from contextlib import AbstractContextManager
+from typing import Any
+
+from application.tracing.stage_tracer import StageTracer
+
+
+class OpenTelemetryStageTracer(StageTracer):
+    """
+    Отправляет этапы обработки как спаны OpenTelemetry в OTLP-коллектор.
+    Требует установленных пакетов opentelemetry-sdk и opentelemetry-exporter-otlp.
+    """
+
+    def __init__(self, endpoint: str, service_name: str = "ppe-server") -> None:
+        try:
+            from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
+                OTLPSpanExporter,
+            )
+            from opentelemetry.sdk.resources import Resource
+            from opentelemetry.sdk.trace import TracerProvider
+            from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        except ImportError as exc:
+            raise RuntimeError(
+                "OpenTelemetry tracing requires the opentelemetry-sdk and "
+                "opentelemetry-exporter-otlp packages"
+            ) from exc
+
+        provider = TracerProvider(
+            resource=Resource.create({"service.name": service_name})
+        )
+        provider.add_span_processor(
+            BatchSpanProcessor(OTLPSpanExporter(endpoint=endpoint, insecure=True))
+        )
+        self._tracer: Any = provider.get_tracer(__name__)
+
+    def stage(self, name: str) -> AbstractContextManager[None]:
+        span: AbstractContextManager[None] = self._tracer.start_as_current_span(name)
+        return span
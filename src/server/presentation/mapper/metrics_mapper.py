@@ -0,0 +1,68 @@
+from application.processor.processor_cache import ProcessorCacheStats
+from application.tracing.stage_histograms import LatencyHistogramSnapshot
+from presentation.stream.frame_stream_metrics import FrameStreamStats
+
+
+def map_to_prometheus(
+    stage_histograms: dict[str, LatencyHistogramSnapshot],
+    frame_stats: FrameStreamStats,
+    cache_stats: ProcessorCacheStats,
+) -> str:
+    """
+    Формирует текст метрик в формате экспозиции Prometheus.
+    """
+    lines = [
+        "# HELP ppe_stage_duration_seconds Duration of frame evaluation stages.",
+        "# TYPE ppe_stage_duration_seconds histogram",
+    ]
+    for stage, histogram in stage_histograms.items():
+        for bound, count in zip(histogram.buckets, histogram.counts, strict=True):
+            lines.append(
+                f'ppe_stage_duration_seconds_bucket{{stage="{stage}",le="{bound}"}} '
+                f"{count}"
+            )
+        lines.append(
+            f'ppe_stage_duration_seconds_bucket{{stage="{stage}",le="+Inf"}} '
+            f"{histogram.count}"
+        )
+        lines.append(
+            f'ppe_stage_duration_seconds_sum{{stage="{stage}"}} {histogram.total}'
+        )
+        lines.append(
+            f'ppe_stage_duration_seconds_count{{stage="{stage}"}} {histogram.count}'
+        )
+
+    counters = {
+        "ppe_frames_received_total": ("Frames received.", frame_stats.received),
+        "ppe_frames_processed_total": ("Frames evaluated.", frame_stats.processed),
+        "ppe_frames_coalesced_total": (
+            "Frames replaced by newer ones before evaluation.",
+            frame_stats.coalesced,
+        ),
+        "ppe_frames_rejected_total": ("Malformed frames.", frame_stats.rejected),
+        "ppe_processor_cache_hits_total": ("Processor cache hits.", cache_stats.hits),
+        "ppe_processor_cache_misses_total": (
+            "Processor cache misses.",
+            cache_stats.misses,
+        ),
+        "ppe_processor_cache_invalidations_total": (
+            "Processors rebuilt after a data version change.",
+            cache_stats.invalidations,
+        ),
+    }
+    for name, (description, value) in counters.items():
+        lines.extend(
+            [
+                f"# HELP {name} {description}",
+                f"# TYPE {name} counter",
+                f"{name} {value}",
+            ]
+        )
+    lines.extend(
+        [
+            "# HELP ppe_processor_cache_size Cached processors.",
+            "# TYPE ppe_processor_cache_size gauge",
+            f"ppe_processor_cache_size {cache_stats.size}",
+        ]
+    )
+    return "\n".join(lines) + "\n"
@@ -1,8 +1,14 @@
+import numpy as np
+
 from domain.model.emg import EmgReading
 from domain.model.zone import Zone
 from application.processor.process_context import ProcessContext
-from presentation.schemas.process import ProcessRequest
-from domain.service.pose.skeleton_transformer import landmarks_to_pose
+from presentation.schemas.binary_frame import BinaryFrame
+from presentation.schemas.process import ProcessBatchRequest, ProcessRequest
+from domain.service.pose.skeleton_transformer import (
+    landmarks_to_pose,
+    landmarks_to_poses,
+)
 
 
 def map_to_context(request: ProcessRequest) -> ProcessContext:
@@ -12,3 +18,39 @@ def map_to_context(request: ProcessRequest) -> ProcessContext:
         for emg in request.emgs
     ]
     return ProcessContext(pose=pose, emgs=emgs)
+
+
+def map_frame_to_context(frame: BinaryFrame) -> ProcessContext:
+    pose = landmarks_to_pose(frame.landmarks)
+    emgs = [
+        EmgReading(sensor_id=emg.sensor_name, zone=Zone(emg.zone)) for emg in frame.emgs
+    ]
+    return ProcessContext(pose=pose, emgs=emgs)
+
+
+def map_batch_to_contexts(request: ProcessBatchRequest) -> list[ProcessContext]:
+    poses = landmarks_to_poses([frame.landmarks for frame in request.frames])
+    return [
+        ProcessContext(
+            pose=pose,
+            emgs=[
+                EmgReading(sensor_id=emg.sensor_name, zone=Zone(emg.zone))
+                for emg in frame.emgs
+            ],
+        )
+        for pose, frame in zip(poses, request.frames, strict=True)
+    ]
+
+
+def map_frames_to_contexts(frames: list[BinaryFrame]) -> list[ProcessContext]:
+    poses = landmarks_to_poses(np.stack([frame.landmarks for frame in frames]))
+    return [
+        ProcessContext(
+            pose=pose,
+            emgs=[
+                EmgReading(sensor_id=emg.sensor_name, zone=Zone(emg.zone))
+                for emg in frame.emgs
+            ],
+        )
+        for pose, frame in zip(poses, frames, strict=True)
+    ]
@@ -1,59 +1,121 @@
 import asyncio
+import json
+from dataclasses import dataclass
 from venv import logger
 
 from fastapi import APIRouter, WebSocket
+from pydantic import BaseModel
 from pydantic_core import ValidationError
 from wireup import Injected
 
+from application.processor.process_context import ProcessContext
+from application.tracing.stage_tracer import StageTracer
 from application.usecase.evaluate_exercise_use_case import EvaluateExerciseUseCase
 from domain.model.session_id import SessionId
+from domain.ports.errors import RepositoryError
+from domain.ports.session_repository import SessionRepository
+from infrastructure.persistence.write_behind.write_behind_session_repository import (
+    WriteBehindSessionRepository,
+)
 
 from presentation.schemas.error import ErrorResponse
-from presentation.schemas.feedback import FeedbackItem, FeedbackResponse
+from application.dto.feedback import FeedbackResponseDto
+from presentation.schemas.feedback import (
+    FeedbackBatchResponse,
+    FeedbackItem,
+    FeedbackResponse,
+)
 from config import settings
-from presentation.schemas.process import ProcessRequest
-from presentation.mapper.process_request_mapper import map_to_context
+from presentation.schemas.binary_frame import (
+    FRAME_SUBPROTOCOL,
+    BinaryFrame,
+    BinaryFrameError,
+    decode_binary_frames,
+)
+from presentation.schemas.process import ProcessBatchRequest, ProcessRequest
+from presentation.mapper.process_request_mapper import (
+    map_batch_to_contexts,
+    map_frame_to_context,
+    map_frames_to_contexts,
+    map_to_context,
+)
+from presentation.stream.frame_stream_metrics import FrameStreamMetrics
+from presentation.stream.latest_frame_buffer import LatestFrameBuffer
 
 
 router = APIRouter(tags=["evaluate"])
 
 
+@dataclass(frozen=True)
+class _PendingFrames:
+    """
+    Кадры одного входящего сообщения, подготовленные к обработке.
+
+    Fields:
+        seqs (list[int | None]): номера кадров из запроса
+        contexts (list[ProcessContext]): контексты обработки в порядке кадров
+        batched (bool): пришли ли кадры пачкой и требуют ли пакетного ответа
+    """
+
+    seqs: list[int | None]
+    contexts: list[ProcessContext]
+    batched: bool
+
+
 @router.websocket("/analyze/{session_id}")
 async def analyze(
-    websocket: WebSocket, session_id: str, use_case: Injected[EvaluateExerciseUseCase]
+    websocket: WebSocket,
+    session_id: str,
+    use_case: Injected[EvaluateExerciseUseCase],
+    session_repository: Injected[SessionRepository],
+    metrics: Injected[FrameStreamMetrics],
+    tracer: Injected[StageTracer],
 ) -> None:
-    await websocket.accept()
-    try:
-        while True:
-            try:
-                data = await asyncio.wait_for(
-                    websocket.receive_json(), timeout=settings.session_timeout_seconds
-                )
-            except asyncio.TimeoutError:
-                logger.info("Session %s timed out", session_id)
-                await websocket.close(code=1001)
-                break
-            try:
-                request = ProcessRequest(**data)
-            except ValidationError as e:
-                logger.warning("Validation error for session %s: %s", session_id, e)
-                await websocket.send_json(
-                    ErrorResponse(error="Invalid landmarks format").model_dump()
-                )
-                continue
-
-            feedback_response = await use_case.execute(
-                session_id=SessionId(session_id),
-                data=map_to_context(request),
-            )
-            feedback_items = [
-                FeedbackItem(message=feedback.message, type=feedback.type)
-                for feedback in feedback_response.feedbacks
-            ]
+    connection_repository: WriteBehindSessionRepository | None = None
+    if settings.session_state_mode == "affinity":
+        connection_repository = WriteBehindSessionRepository(
+            backing_repository=session_repository,
+            flush_interval=settings.session_flush_interval_seconds,
+        )
+        use_case = use_case.with_session_repository(connection_repository)
 
-            await websocket.send_json(
-                FeedbackResponse(feedbacks=feedback_items).model_dump()
+    subprotocol = (
+        FRAME_SUBPROTOCOL
+        if FRAME_SUBPROTOCOL in websocket.scope.get("subprotocols", [])
+        else None
+    )
+    await websocket.accept(subprotocol=subprotocol)
+    buffer: LatestFrameBuffer[_PendingFrames] = LatestFrameBuffer(
+        settings.frame_buffer_size
+    )
+    send_lock = asyncio.Lock()
+    tasks = {
+        asyncio.create_task(
+            _receive_frames(websocket, session_id, buffer, metrics, tracer, send_lock)
+        ),
+        asyncio.create_task(
+            _process_frames(
+                websocket, session_id, use_case, buffer, metrics, tracer, send_lock
             )
+        ),
+    }
+    if (
+        connection_repository is not None
+        and settings.session_flush_interval_seconds > 0
+    ):
+        tasks.add(
+            asyncio.create_task(_flush_periodically(connection_repository, session_id))
+        )
+    try:
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            buffer.close()
+            for task in tasks:
+                task.cancel()
+        await asyncio.wait(tasks)
+        for task in done:
+            task.result()
 
         logger.info("WebSocket disconnected for session %s", session_id)
     except (TypeError, ValueError, KeyError) as exc:
@@ -70,3 +132,206 @@ async def analyze(
         except Exception:
             pass
         await websocket.close(code=1011)
+    finally:
+        if connection_repository is not None:
+            await _flush_session(connection_repository, session_id)
+
+
+async def _flush_session(
+    repository: WriteBehindSessionRepository, session_id: str
+) -> None:
+    try:
+        await repository.flush()
+    except RepositoryError:
+        logger.exception("Failed to flush state of session %s", session_id)
+
+
+async def _flush_periodically(
+    repository: WriteBehindSessionRepository, session_id: str
+) -> None:
+    """
+    Раз в settings.session_flush_interval_seconds записывает изменения сессии
+    в основное хранилище, чтобы состояние не устаревало, пока клиент подключен,
+    но не присылает кадров. Работает до отмены задачи.
+    """
+    while True:
+        await asyncio.sleep(settings.session_flush_interval_seconds)
+        await _flush_session(repository, session_id)
+
+
+async def _receive_frames(
+    websocket: WebSocket,
+    session_id: str,
+    buffer: LatestFrameBuffer[_PendingFrames],
+    metrics: FrameStreamMetrics,
+    tracer: StageTracer,
+    send_lock: asyncio.Lock,
+) -> None:
+    """
+    Принимает кадры из сокета и складывает их в буфер, не дожидаясь обработки.
+    Завершается при отключении клиента или по таймауту сессии.
+    """
+    while True:
+        try:
+            message = await asyncio.wait_for(
+                websocket.receive(), timeout=settings.session_timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            logger.info("Session %s timed out", session_id)
+            await websocket.close(code=1001)
+            return
+        if message["type"] == "websocket.disconnect":
+            return
+
+        if message.get("bytes") is not None:
+            try:
+                with tracer.stage("decode"):
+                    frames = decode_binary_frames(message["bytes"])
+            except BinaryFrameError as e:
+                logger.warning("Invalid frame for session %s: %s", session_id, e)
+                metrics.record_rejected()
+                await _send(
+                    websocket,
+                    send_lock,
+                    ErrorResponse(error="Invalid landmarks format", seq=e.seq),
+                )
+                continue
+            with tracer.stage("map_to_context"):
+                pending = _pending_from_binary(frames)
+        else:
+            data = None
+            try:
+                with tracer.stage("decode"):
+                    data = json.loads(message["text"])
+                    request: ProcessRequest | ProcessBatchRequest = (
+                        ProcessBatchRequest(**data)
+                        if "frames" in data
+                        else ProcessRequest(**data)
+                    )
+            except ValidationError as e:
+                logger.warning("Validation error for session %s: %s", session_id, e)
+                metrics.record_rejected()
+                await _send(
+                    websocket,
+                    send_lock,
+                    ErrorResponse(error="Invalid landmarks format", seq=_seq_of(data)),
+                )
+                continue
+            with tracer.stage("map_to_context"):
+                pending = _pending_from_request(request)
+
+        metrics.record_received(len(pending.contexts))
+        evicted = buffer.put(pending)
+        if evicted is not None:
+            metrics.record_coalesced(len(evicted.contexts))
+
+
+def _seq_of(data: object) -> int | None:
+    seq = data.get("seq") if isinstance(data, dict) else None
+    return seq if isinstance(seq, int) else None
+
+
+def _pending_from_binary(frames: list[BinaryFrame]) -> _PendingFrames:
+    if len(frames) == 1:
+        return _PendingFrames(
+            seqs=[frames[0].seq],
+            contexts=[map_frame_to_context(frames[0])],
+            batched=False,
+        )
+    return _PendingFrames(
+        seqs=[frame.seq for frame in frames],
+        contexts=map_frames_to_contexts(frames),
+        batched=True,
+    )
+
+
+def _pending_from_request(
+    request: ProcessRequest | ProcessBatchRequest,
+) -> _PendingFrames:
+    if isinstance(request, ProcessBatchRequest):
+        return _PendingFrames(
+            seqs=[frame.seq for frame in request.frames],
+            contexts=map_batch_to_contexts(request),
+            batched=True,
+        )
+    return _PendingFrames(
+        seqs=[request.seq], contexts=[map_to_context(request)], batched=False
+    )
+
+
+async def _process_frames(
+    websocket: WebSocket,
+    session_id: str,
+    use_case: EvaluateExerciseUseCase,
+    buffer: LatestFrameBuffer[_PendingFrames],
+    metrics: FrameStreamMetrics,
+    tracer: StageTracer,
+    send_lock: asyncio.Lock,
+) -> None:
+    """
+    Оценивает кадры из буфера не чаще settings.max_frames_per_second раз в секунду.
+    Кадры, пришедшие во время ожидания, вытесняют друг друга в буфере.
+    """
+    # Процессоры упражнения собираются до первого кадра и вне цикла событий
+    await use_case.prepare(SessionId(session_id))
+
+    loop = asyncio.get_running_loop()
+    max_rate = settings.max_frames_per_second
+    interval = 1.0 / max_rate if max_rate > 0 else 0.0
+    next_slot = 0.0
+    while True:
+        delay = next_slot - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        pending = await buffer.get()
+        if pending is None:
+            return
+        next_slot = loop.time() + interval
+
+        with tracer.stage("evaluate"):
+            if pending.batched:
+                responses = await use_case.execute_batch(
+                    session_id=SessionId(session_id),
+                    data=pending.contexts,
+                )
+            else:
+                responses = [
+                    await use_case.execute(
+                        session_id=SessionId(session_id),
+                        data=pending.contexts[0],
+                    )
+                ]
+        metrics.record_processed(len(responses))
+
+        results = [
+            _to_feedback_response(response, seq)
+            for response, seq in zip(responses, pending.seqs, strict=True)
+        ]
+        with tracer.stage("send"):
+            await _send(
+                websocket,
+                send_lock,
+                FeedbackBatchResponse(results=results)
+                if pending.batched
+                else results[0],
+            )
+
+
+def _to_feedback_response(
+    response: FeedbackResponseDto, seq: int | None
+) -> FeedbackResponse:
+    return FeedbackResponse(
+        feedbacks=[
+            FeedbackItem(message=feedback.message, type=feedback.type)
+            for feedback in response.feedbacks
+        ],
+        seq=seq,
+    )
+
+
+async def _send(
+    websocket: WebSocket, send_lock: asyncio.Lock, response: BaseModel
+) -> None:
+    async with send_lock:
+        await websocket.send_json(response.model_dump(exclude_none=True))
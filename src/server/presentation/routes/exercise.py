@@ -14,7 +14,7 @@ async def get_exercises(
     use_case: Injected[GetExercisesUseCase],
 ) -> ExercisesResponse:
     try:
-        result = use_case.execute()
+        result = await use_case.execute()
     except EntityNotFoundError as exc:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -0,0 +1,28 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from wireup import Injected
+
+from application.processor.camera.camera_pose_processor_factory import (
+    CameraPoseProcessorFactory,
+)
+from application.tracing.stage_histograms import StageHistograms
+from presentation.mapper.metrics_mapper import map_to_prometheus
+from presentation.stream.frame_stream_metrics import FrameStreamMetrics
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics(
+    stage_histograms: Injected[StageHistograms],
+    frame_metrics: Injected[FrameStreamMetrics],
+    processor_factory: Injected[CameraPoseProcessorFactory],
+) -> PlainTextResponse:
+    return PlainTextResponse(
+        map_to_prometheus(
+            stage_histograms=stage_histograms.snapshot,
+            frame_stats=frame_metrics.stats,
+            cache_stats=processor_factory.cache_stats,
+        ),
+        media_type="text/plain; version=0.0.4",
+    )
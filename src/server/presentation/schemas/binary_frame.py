@@ -0,0 +1,154 @@
+import struct
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+from domain.model.landmark import Landmark
+
+FRAME_SUBPROTOCOL = "ppe.frame.v1"
+FRAME_VERSION = 1
+
+# version, landmarks count, emg readings count, flags
+FRAME_HEADER = struct.Struct("<BBBB")
+FRAME_SEQUENCE = struct.Struct("<I")
+FLAG_SEQUENCE = 0x01
+LANDMARK_DTYPE = np.dtype("<f4")
+LANDMARK_DIMENSIONS = 3
+LANDMARKS_COUNT = len(Landmark)
+
+ZONE_CODES: dict[int, str] = {0: "Green", 1: "Yellow", 2: "Red"}
+
+
+class BinaryFrameError(ValueError):
+    """
+    Ошибка разбора бинарного кадра.
+
+    Fields:
+        seq (int | None): номер кадра, если его удалось прочитать до ошибки
+    """
+
+    def __init__(self, message: str, seq: int | None = None) -> None:
+        super().__init__(message)
+        self.seq = seq
+
+
+@dataclass(frozen=True)
+class BinaryEmgReading:
+    sensor_name: str
+    zone: str
+
+
+@dataclass(frozen=True)
+class BinaryFrame:
+    """
+    Кадр бинарного протокола /analyze.
+
+    Формат (little-endian):
+        заголовок: version (u8), landmarks_count (u8), emgs_count (u8), flags (u8)
+        seq: номер кадра (u32), присутствует, если в flags выставлен FLAG_SEQUENCE
+        landmarks: landmarks_count * 3 значений float32 (x, y, z);
+            landmarks_count всегда равен числу точек скелета (33)
+        emgs: для каждого показания - zone (u8), длина имени (u8), имя датчика в UTF-8
+    """
+
+    landmarks: npt.NDArray[np.float32]
+    emgs: list[BinaryEmgReading]
+    seq: int | None = None
+
+
+def decode_binary_frame(payload: bytes) -> BinaryFrame:
+    frame, offset = _decode_frame_at(payload, 0)
+    if offset != len(payload):
+        raise BinaryFrameError("Binary frame has trailing bytes", frame.seq)
+    return frame
+
+
+def decode_binary_frames(payload: bytes) -> list[BinaryFrame]:
+    """
+    Декодирует сообщение из одного или нескольких кадров, записанных подряд.
+    """
+    frames: list[BinaryFrame] = []
+    offset = 0
+    while offset < len(payload) or not frames:
+        frame, offset = _decode_frame_at(payload, offset)
+        frames.append(frame)
+    return frames
+
+
+def _decode_frame_at(payload: bytes, offset: int) -> tuple[BinaryFrame, int]:
+    if len(payload) < offset + FRAME_HEADER.size:
+        raise BinaryFrameError("Binary frame is shorter than its header")
+
+    version, landmarks_count, emgs_count, flags = FRAME_HEADER.unpack_from(
+        payload, offset
+    )
+    if version != FRAME_VERSION:
+        raise BinaryFrameError(f"Unsupported binary frame version: {version}")
+
+    offset += FRAME_HEADER.size
+    seq: int | None = None
+    if flags & FLAG_SEQUENCE:
+        if len(payload) < offset + FRAME_SEQUENCE.size:
+            raise BinaryFrameError("Binary frame is truncated in sequence section")
+        (seq,) = FRAME_SEQUENCE.unpack_from(payload, offset)
+        offset += FRAME_SEQUENCE.size
+    if landmarks_count != LANDMARKS_COUNT:
+        raise BinaryFrameError(
+            f"Binary frame has {landmarks_count} landmarks, expected {LANDMARKS_COUNT}",
+            seq,
+        )
+    landmarks_size = landmarks_count * LANDMARK_DIMENSIONS * LANDMARK_DTYPE.itemsize
+    if len(payload) < offset + landmarks_size:
+        raise BinaryFrameError("Binary frame is truncated in landmarks section", seq)
+    landmarks = np.frombuffer(
+        payload,
+        dtype=LANDMARK_DTYPE,
+        count=landmarks_count * LANDMARK_DIMENSIONS,
+        offset=offset,
+    ).reshape(landmarks_count, LANDMARK_DIMENSIONS)
+    offset += landmarks_size
+
+    emgs: list[BinaryEmgReading] = []
+    for _ in range(emgs_count):
+        if len(payload) < offset + 2:
+            raise BinaryFrameError("Binary frame is truncated in emg section", seq)
+        zone_code, name_length = payload[offset], payload[offset + 1]
+        offset += 2
+        name = payload[offset : offset + name_length]
+        if len(name) != name_length:
+            raise BinaryFrameError("Binary frame is truncated in emg section", seq)
+        offset += name_length
+        if zone_code not in ZONE_CODES:
+            raise BinaryFrameError(f"Unknown emg zone code: {zone_code}", seq)
+        try:
+            sensor_name = name.decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise BinaryFrameError("Emg sensor name is not valid UTF-8", seq) from e
+        emgs.append(
+            BinaryEmgReading(sensor_name=sensor_name, zone=ZONE_CODES[zone_code])
+        )
+
+    return BinaryFrame(landmarks=landmarks, emgs=emgs, seq=seq), offset
+
+
+def encode_binary_frame(
+    landmarks: npt.ArrayLike,
+    emgs: list[BinaryEmgReading],
+    seq: int | None = None,
+) -> bytes:
+    points = np.ascontiguousarray(landmarks, dtype=LANDMARK_DTYPE)
+    if points.ndim != 2 or points.shape[1] != LANDMARK_DIMENSIONS:
+        raise ValueError(f"landmarks must have shape (N, 3), got {points.shape}")
+
+    zone_codes = {zone: code for code, zone in ZONE_CODES.items()}
+    flags = FLAG_SEQUENCE if seq is not None else 0
+    parts = [FRAME_HEADER.pack(FRAME_VERSION, points.shape[0], len(emgs), flags)]
+    if seq is not None:
+        parts.append(FRAME_SEQUENCE.pack(seq))
+    parts.append(points.tobytes())
+    for emg in emgs:
+        name = emg.sensor_name.encode("utf-8")
+        parts.append(bytes((zone_codes[emg.zone], len(name))))
+        parts.append(name)
+    return b"".join(parts)
@@ -3,3 +3,4 @@ from pydantic import BaseModel
 
 class ErrorResponse(BaseModel):
     error: str
+    seq: int | None = None
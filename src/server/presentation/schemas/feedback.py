@@ -10,3 +10,8 @@ class FeedbackItem(BaseModel):
 
 class FeedbackResponse(BaseModel):
     feedbacks: List[FeedbackItem]
+    seq: int | None = None
+
+
+class FeedbackBatchResponse(BaseModel):
+    results: list[FeedbackResponse]
@@ -1,6 +1,6 @@
 from typing import List
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class EmgSensor(BaseModel):
@@ -11,3 +11,8 @@ class EmgSensor(BaseModel):
 class ProcessRequest(BaseModel):
     landmarks: List[List[float]]
     emgs: List[EmgSensor]
+    seq: int | None = None
+
+
+class ProcessBatchRequest(BaseModel):
+    frames: list[ProcessRequest] = Field(min_length=1)
@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class FrameStreamStats:
+    """
+    Снимок счётчиков потока кадров /analyze.
+
+    Fields:
+        received (int): получено кадров
+        processed (int): обработано кадров
+        coalesced (int): кадров вытеснено более новыми без обработки
+        rejected (int): отклонено некорректных кадров
+    """
+
+    received: int
+    processed: int
+    coalesced: int
+    rejected: int
+
+
+class FrameStreamMetrics:
+    """
+    Счётчики потока кадров по всем соединениям /analyze.
+    """
+
+    def __init__(self) -> None:
+        self._received = 0
+        self._processed = 0
+        self._coalesced = 0
+        self._rejected = 0
+
+    def record_received(self, frames: int = 1) -> None:
+        self._received += frames
+
+    def record_coalesced(self, frames: int = 1) -> None:
+        self._coalesced += frames
+
+    def record_processed(self, frames: int = 1) -> None:
+        self._processed += frames
+
+    def record_rejected(self) -> None:
+        self._rejected += 1
+
+    @property
+    def stats(self) -> FrameStreamStats:
+        return FrameStreamStats(
+            received=self._received,
+            processed=self._processed,
+            coalesced=self._coalesced,
+            rejected=self._rejected,
+        )
@@ -0,0 +1,56 @@
+import asyncio
+from collections import deque
+
+
+class LatestFrameBuffer[T]:
+    """
+    Буфер входящих кадров одного соединения, хранящий только N последних кадров.
+    Если обработка не успевает за клиентом, самые старые кадры вытесняются новыми,
+    поэтому задержка обратной связи не растёт вместе с очередью.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self._frames: deque[T] = deque(maxlen=capacity)
+        self._available = asyncio.Event()
+        self._closed = False
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def put(self, frame: T) -> T | None:
+        """
+        Добавляет кадр в буфер.
+
+        Args:
+            frame (T): новый кадр
+
+        Returns:
+            T | None: необработанный старый кадр, вытесненный новым, если такой был
+        """
+        evicted = self._frames[0] if len(self._frames) == self._frames.maxlen else None
+        self._frames.append(frame)
+        self._available.set()
+        return evicted
+
+    async def get(self) -> T | None:
+        """
+        Ожидает и извлекает самый старый из оставшихся в буфере кадров.
+
+        Returns:
+            T | None: кадр или None, если буфер закрыт и пуст
+        """
+        while not self._frames:
+            if self._closed:
+                return None
+            self._available.clear()
+            await self._available.wait()
+        return self._frames.popleft()
+
+    def close(self) -> None:
+        """
+        Закрывает буфер: после извлечения оставшихся кадров get() вернёт None.
+        """
+        self._closed = True
+        self._available.set()
@@ -0,0 +1,174 @@
+import numpy as np
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from domain.model.angle import Angle
+from domain.model.exercise_id import ExerciseId
+from domain.model.exercise_state import ExerciseState
+from domain.model.pose import Pose
+from domain.model.pose_id import PoseId
+from domain.model.pose_match_result import PoseMatchResult
+from domain.model.pose_rule import PoseRule
+from domain.model.session import Session
+from domain.model.session_id import SessionId
+from domain.service.exercise_state_machine import ExerciseStateMachine
+from domain.service.pose.pose_matcher.reference_pose_matrix import (
+    ReferencePoseMatrix,
+)
+from domain.service.pose.pose_matcher.strategy.penalty_strategy import PenaltyStrategy
+from domain.service.pose.skeleton_transformer import (
+    landmarks_to_pose,
+    landmarks_to_poses,
+)
+from domain.service.rule.pose_rule_validator import PoseRuleValidator
+from domain.service.rule.rule_validator import RuleValidator
+from domain.service.rule.strategy.pose_rule_strategy import PoseRuleStrategy
+from infrastructure.persistence.redis.mapper.session_mapper import SessionMapper
+from infrastructure.persistence.redis.model.session import RedisSession
+from presentation.mapper.process_request_mapper import map_to_context
+from presentation.schemas.process import EmgSensor, ProcessRequest
+
+SEED = 20240601
+SCALES = [4, 16, 64]
+
+
+def _skeleton(seed: int = SEED) -> list[list[float]]:
+    rng = np.random.default_rng(seed)
+    points: list[list[float]] = rng.random((33, 3)).tolist()
+    return points
+
+
+def _poses(count: int, seed: int = SEED) -> list[Pose]:
+    rng = np.random.default_rng(seed)
+    return [
+        Pose(
+            id=PoseId(f"pose_{i}"),
+            name=f"pose_{i}",
+            threshold=10.0,
+            **dict(
+                zip(
+                    Angle.get_all_field_names(),
+                    (rng.random(len(Angle)) * 180.0).tolist(),
+                    strict=True,
+                )
+            ),
+        )
+        for i in range(count)
+    ]
+
+
+def _rules(count: int, poses: list[Pose]) -> list[PoseRule]:
+    angles = list(Angle)
+    return [
+        PoseRule(
+            id=poses[i % len(poses)].id,
+            feature=angles[i % len(angles)],
+            operator=">" if i % 2 else "<",
+            value=15.0,
+            message=f"rule {i}",
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.benchmark(group="landmarks_to_pose")
+def test_landmarks_to_pose(benchmark: BenchmarkFixture) -> None:
+    skeleton = _skeleton()
+
+    pose = benchmark(landmarks_to_pose, skeleton)
+
+    assert len(pose.get_angles_list()) == len(Angle)
+
+
+@pytest.mark.benchmark(group="landmarks_to_pose")
+def test_landmarks_to_poses_batch_of_30(benchmark: BenchmarkFixture) -> None:
+    skeletons = np.stack([np.asarray(_skeleton(SEED + i)) for i in range(30)])
+
+    poses = benchmark(landmarks_to_poses, skeletons)
+
+    assert len(poses) == 30
+
+
+@pytest.mark.benchmark(group="penalty_strategy_match")
+@pytest.mark.parametrize("reference_poses", SCALES)
+def test_penalty_strategy_match(
+    benchmark: BenchmarkFixture, reference_poses: int
+) -> None:
+    matrix = ReferencePoseMatrix.from_poses(_poses(reference_poses))
+    current = landmarks_to_pose(_skeleton())
+
+    result = benchmark(PenaltyStrategy().match, current, matrix)
+
+    assert result.pose in matrix.poses
+
+
+@pytest.mark.benchmark(group="rule_validator_validate")
+@pytest.mark.parametrize("rules", SCALES)
+def test_rule_validator_validate(benchmark: BenchmarkFixture, rules: int) -> None:
+    poses = _poses(4)
+    validator = RuleValidator(rules=_rules(rules, poses), strategy=PoseRuleStrategy())
+    match_result = PoseMatchResult(
+        pose=poses[0],
+        deviations={Angle.LEFT_SHOULDER_ANGLE: 20.0, Angle.RIGHT_KNEE_ANGLE: 5.0},
+    )
+
+    violations = benchmark(validator.validate, match_result)
+
+    assert all(violation.id == poses[0].id for violation in violations)
+
+
+@pytest.mark.benchmark(group="rule_validator_validate")
+@pytest.mark.parametrize("rules", SCALES)
+def test_pose_rule_validator_validate(benchmark: BenchmarkFixture, rules: int) -> None:
+    poses = _poses(4)
+    validator = PoseRuleValidator(rules=_rules(rules, poses))
+    match_result = PoseMatchResult(
+        pose=poses[0],
+        deviations={Angle.LEFT_SHOULDER_ANGLE: 20.0, Angle.RIGHT_KNEE_ANGLE: 5.0},
+    )
+
+    violations = benchmark(validator.validate, match_result)
+
+    assert all(violation.id == poses[0].id for violation in violations)
+
+
+@pytest.mark.benchmark(group="exercise_state_machine")
+def test_exercise_state_machine_update(benchmark: BenchmarkFixture) -> None:
+    state_machine = ExerciseStateMachine(total_poses=4, frame_tolerance=3)
+    state = ExerciseState(current_pose_index=1, frame_tolerance_counter=2)
+
+    new_state = benchmark(
+        state_machine.update, state, is_pose_matched=True, is_pose_correct=True
+    )
+
+    assert new_state.current_pose_index == 2
+
+
+@pytest.mark.benchmark(group="session_mapper")
+def test_session_mapper_round_trip(benchmark: BenchmarkFixture) -> None:
+    session = Session(
+        session_id=SessionId("5f0c6f3e-8a4c-4f57-9d43-0f5a3c1e2b7d"),
+        exercise_id=ExerciseId("exercise_1"),
+        exercise_state=ExerciseState(current_pose_index=1, frame_tolerance_counter=2),
+    )
+
+    def round_trip() -> Session:
+        payload = SessionMapper.map_to(session).model_dump_json()
+        return SessionMapper.map_from(RedisSession.model_validate_json(payload))
+
+    assert benchmark(round_trip) == session
+
+
+@pytest.mark.benchmark(group="map_to_context")
+def test_map_to_context(benchmark: BenchmarkFixture) -> None:
+    request = ProcessRequest(
+        landmarks=_skeleton(),
+        emgs=[
+            EmgSensor(sensor_name="AA:BB:CC:DD:EE:01", zone="Green"),
+            EmgSensor(sensor_name="AA:BB:CC:DD:EE:02", zone="Red"),
+        ],
+    )
+
+    context = benchmark(map_to_context, request)
+
+    assert len(context.emgs) == 2
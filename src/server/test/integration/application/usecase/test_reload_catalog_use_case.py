@@ -0,0 +1,131 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from application.processor.camera.camera_pose_processor import CameraPoseProcessor
+from application.processor.camera.camera_pose_processor_factory import (
+    CameraPoseProcessorFactory,
+)
+from application.usecase.reload_catalog_use_case import ReloadCatalogUseCase
+from domain.model.angle import Angle
+from domain.model.exercise_id import ExerciseId
+from domain.model.pose_id import PoseId
+from domain.ports.errors import CatalogLoadError, EntityNotFoundError
+from domain.ports.exercise_repository import ExerciseRepository
+from domain.ports.pose_repository import PoseRepository
+from domain.service.pose.pose_matcher.strategy.penalty_strategy import PenaltyStrategy
+from infrastructure.persistence.json.repository.json_exercise_repository import (
+    JsonExerciseRepository,
+)
+from infrastructure.persistence.json.repository.json_pose_repository import (
+    JsonPoseRepository,
+)
+
+EXERCISE_ID = ExerciseId("exercise_1")
+
+
+def _write_pose(directory: Path, pose_id: str) -> None:
+    data = {
+        "id": pose_id,
+        "name": pose_id,
+        "threshold": 10.0,
+        **{name: 90.0 for name in Angle.get_all_field_names()},
+    }
+    (directory / f"{pose_id}.json").write_text(json.dumps(data), encoding="utf-8")
+
+
+def _write_exercise(directory: Path, poses: list[str]) -> None:
+    data = {"id": EXERCISE_ID.id, "name": "exercise", "poses": poses}
+    (directory / f"{EXERCISE_ID.id}.json").write_text(
+        json.dumps(data), encoding="utf-8"
+    )
+
+
+@pytest.fixture
+def catalog(
+    tmp_path: Path,
+) -> tuple[Path, Path, JsonExerciseRepository, JsonPoseRepository]:
+    exercises, poses = tmp_path / "exercise", tmp_path / "pose"
+    exercises.mkdir()
+    poses.mkdir()
+    _write_pose(poses, "pose_a")
+    _write_exercise(exercises, ["pose_a"])
+    return (
+        exercises,
+        poses,
+        JsonExerciseRepository(str(exercises), preload=True),
+        JsonPoseRepository(str(poses), preload=True),
+    )
+
+
+def _build_use_case(
+    exercise_repository: JsonExerciseRepository,
+    pose_repository: JsonPoseRepository,
+) -> tuple[ReloadCatalogUseCase, CameraPoseProcessorFactory]:
+    factory = CameraPoseProcessorFactory(
+        exercise_repository=exercise_repository,
+        pose_repository=pose_repository,
+        pose_matcher_strategy=PenaltyStrategy(),
+        frame_tolerance=3,
+    )
+    factory.preload()
+    use_case = ReloadCatalogUseCase(
+        exercise_repository=exercise_repository,
+        pose_repository=pose_repository,
+        processor_factory=factory,
+    )
+    return use_case, factory
+
+
+@pytest.mark.asyncio
+async def test_reload_swaps_poses_and_exercises_together(
+    catalog: tuple[Path, Path, JsonExerciseRepository, JsonPoseRepository],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    exercises, poses, exercise_repository, pose_repository = catalog
+    use_case, factory = _build_use_case(exercise_repository, pose_repository)
+    old_processor = factory.create(EXERCISE_ID)
+    (poses / "pose_a.json").unlink()
+    _write_pose(poses, "pose_b")
+    _write_exercise(exercises, ["pose_b"])
+
+    observed: list[PoseId] = []
+    build_all = factory.build_all
+
+    def build_all_with_check(
+        exercise_repository_: ExerciseRepository, pose_repository_: PoseRepository
+    ) -> dict[ExerciseId, CameraPoseProcessor]:
+        # Пока новая версия собирается, сессии получают прежние данные
+        observed.extend(exercise_repository.get_by_id(EXERCISE_ID).poses)
+        assert factory.create(EXERCISE_ID) is old_processor
+        return build_all(exercise_repository_, pose_repository_)
+
+    monkeypatch.setattr(factory, "build_all", build_all_with_check)
+    await use_case.execute()
+
+    assert observed == [PoseId("pose_a")]
+    assert exercise_repository.get_by_id(EXERCISE_ID).poses == [PoseId("pose_b")]
+    with pytest.raises(EntityNotFoundError):
+        pose_repository.get_by_id(PoseId("pose_a"))
+    new_processor = factory.create(EXERCISE_ID)
+    assert new_processor is not old_processor
+    assert factory.cache_stats.misses == 0
+
+
+@pytest.mark.asyncio
+async def test_reload_keeps_catalog_when_exercise_references_missing_pose(
+    catalog: tuple[Path, Path, JsonExerciseRepository, JsonPoseRepository],
+) -> None:
+    _exercises, poses, exercise_repository, pose_repository = catalog
+    use_case, factory = _build_use_case(exercise_repository, pose_repository)
+    old_processor = factory.create(EXERCISE_ID)
+    (poses / "pose_a.json").unlink()
+    _write_pose(poses, "pose_b")
+
+    with pytest.raises(CatalogLoadError):
+        await use_case.execute()
+
+    assert (exercise_repository.version, pose_repository.version) == (0, 0)
+    assert pose_repository.get_by_id(PoseId("pose_a")).name == "pose_a"
+    assert factory.create(EXERCISE_ID) is old_processor
@@ -0,0 +1,58 @@
+import pytest
+
+from config import Settings
+from domain.model.angle import Angle
+from domain.model.exercise_id import ExerciseId
+from domain.model.pose_id import PoseId
+from domain.model.pose_match_result import PoseMatchResult
+from domain.service.rule.pose_rule_validator import PoseRuleValidator
+from infrastructure.persistence.json.repository.json_exercise_repository import (
+    JsonExerciseRepository,
+)
+from infrastructure.persistence.json.repository.json_pose_repository import (
+    JsonPoseRepository,
+)
+
+LATERAL_RAISES_ID = ExerciseId("exercise_1")
+ARMS_DOWN_POSE_ID = PoseId("pose_1")
+LOWER_LEFT_ARM_MESSAGE = "Опустите левую руку полностью"
+
+
+@pytest.fixture
+def exercise_repository() -> JsonExerciseRepository:
+    return JsonExerciseRepository(Settings().exercise_data_path, preload=True)
+
+
+@pytest.fixture
+def pose_repository() -> JsonPoseRepository:
+    return JsonPoseRepository(Settings().pose_data_path, preload=True)
+
+
+def test_shipped_catalog_rules_resolve_to_angles(
+    exercise_repository: JsonExerciseRepository,
+) -> None:
+    rules = [
+        rule
+        for exercise in exercise_repository.get_all()
+        for rule in exercise.pose_rules
+    ]
+
+    assert rules
+    for rule in rules:
+        assert isinstance(Angle.from_feature(rule.feature), Angle)
+
+
+def test_shipped_catalog_rule_fires_on_matched_pose(
+    exercise_repository: JsonExerciseRepository,
+    pose_repository: JsonPoseRepository,
+) -> None:
+    exercise = exercise_repository.get_by_id(LATERAL_RAISES_ID)
+    validator = PoseRuleValidator(rules=exercise.pose_rules)
+    match = PoseMatchResult(
+        pose=pose_repository.get_by_id(ARMS_DOWN_POSE_ID),
+        deviations={Angle.LEFT_SHOULDER_ANGLE: 20.0},
+    )
+
+    messages = [rule.message for rule in validator.validate(match)]
+
+    assert LOWER_LEFT_ARM_MESSAGE in messages
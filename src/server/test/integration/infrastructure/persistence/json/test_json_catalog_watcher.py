@@ -0,0 +1,84 @@
+import json
+import os
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from infrastructure.persistence.json.catalog_watcher import JsonCatalogWatcher
+
+
+@pytest.fixture
+def temp_dir() -> Iterator[Path]:
+    with tempfile.TemporaryDirectory() as tmp:
+        yield Path(tmp)
+
+
+class _Reloads:
+    def __init__(self) -> None:
+        self.count = 0
+
+    async def __call__(self) -> None:
+        self.count += 1
+
+
+def _write(path: Path, data: dict[str, object], mtime_ns: int) -> None:
+    path.write_text(json.dumps(data), encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.mark.asyncio
+async def test_check_records_initial_state_without_reload(temp_dir: Path) -> None:
+    _write(temp_dir / "pose_1.json", {"id": "pose_1"}, 1_000_000_000)
+    reloads = _Reloads()
+    watcher = JsonCatalogWatcher([str(temp_dir)], on_change=reloads, interval=1.0)
+
+    assert await watcher.check() is False
+    assert await watcher.check() is False
+    assert reloads.count == 0
+
+
+@pytest.mark.asyncio
+async def test_check_reloads_on_modified_added_and_removed_files(
+    temp_dir: Path,
+) -> None:
+    _write(temp_dir / "pose_1.json", {"id": "pose_1"}, 1_000_000_000)
+    reloads = _Reloads()
+    watcher = JsonCatalogWatcher([str(temp_dir)], on_change=reloads, interval=1.0)
+    await watcher.check()
+
+    _write(temp_dir / "pose_1.json", {"id": "pose_1"}, 2_000_000_000)
+    assert await watcher.check() is True
+
+    _write(temp_dir / "pose_2.json", {"id": "pose_2"}, 2_000_000_000)
+    assert await watcher.check() is True
+
+    (temp_dir / "pose_2.json").unlink()
+    assert await watcher.check() is True
+
+    assert await watcher.check() is False
+    assert reloads.count == 3
+
+
+@pytest.mark.asyncio
+async def test_check_retries_failed_reload(temp_dir: Path) -> None:
+    _write(temp_dir / "pose_1.json", {"id": "pose_1"}, 1_000_000_000)
+    attempts = 0
+
+    async def failing_once() -> None:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise ValueError("broken catalog")
+
+    watcher = JsonCatalogWatcher([str(temp_dir)], on_change=failing_once, interval=1.0)
+    await watcher.check()
+
+    _write(temp_dir / "pose_1.json", {"id": "pose_1"}, 2_000_000_000)
+    with pytest.raises(ValueError):
+        await watcher.check()
+
+    assert await watcher.check() is True
+    assert await watcher.check() is False
+    assert attempts == 2
@@ -6,7 +6,7 @@ import tempfile
 import pytest
 
 from domain.model.exercise_id import ExerciseId
-from domain.ports.errors import EntityNotFoundError
+from domain.ports.errors import CatalogLoadError, EntityNotFoundError
 from infrastructure.persistence.json.errors import JsonParseError, JsonReadError
 from infrastructure.persistence.json.repository.json_exercise_repository import (
     JsonExerciseRepository,
@@ -116,3 +116,58 @@ def test_get_by_id_invalid_exercise_data(
     with pytest.raises(JsonParseError) as exc_info:
         exercise_repository.get_by_id(exercise_id)
     assert JSON_PARSE_ERROR_FRAGMENT in str(exc_info.value)
+
+
+def test_preload_reads_catalog_at_startup(
+    temp_dir: Path, valid_exercise_data: dict[str, object]
+) -> None:
+    exercise_file = temp_dir / f"{TEST_EXERCISE_ID}.json"
+    with open(exercise_file, "w", encoding="utf-8") as f:
+        json.dump(valid_exercise_data, f)
+
+    repository = JsonExerciseRepository(str(temp_dir), preload=True)
+    exercise_file.unlink()
+
+    assert [e.id for e in repository.get_all()] == [ExerciseId(TEST_EXERCISE_ID)]
+    assert repository.get_by_id(ExerciseId(TEST_EXERCISE_ID)).name == (
+        TEST_EXERCISE_NAME
+    )
+
+
+def test_preload_reports_every_invalid_file(
+    temp_dir: Path, invalid_exercise_data: dict[str, object]
+) -> None:
+    with open(temp_dir / f"{INVALID_JSON_EXERCISE_ID}.json", "w") as f:
+        f.write(INVALID_JSON_CONTENT)
+    with open(temp_dir / f"{INVALID_EXERCISE_DATA_ID}.json", "w") as f:
+        json.dump(invalid_exercise_data, f)
+
+    with pytest.raises(CatalogLoadError) as exc_info:
+        JsonExerciseRepository(str(temp_dir), preload=True)
+
+    assert len(exc_info.value.errors) == 2
+    assert JSON_READ_ERROR_FRAGMENT in str(exc_info.value)
+    assert JSON_PARSE_ERROR_FRAGMENT in str(exc_info.value)
+
+
+def test_preload_get_by_id_not_found(temp_dir: Path) -> None:
+    repository = JsonExerciseRepository(str(temp_dir), preload=True)
+
+    with pytest.raises(EntityNotFoundError):
+        repository.get_by_id(ExerciseId(NON_EXISTENT_EXERCISE_ID))
+
+
+def test_stage_keeps_previous_catalog_on_error(
+    temp_dir: Path, valid_exercise_data: dict[str, object]
+) -> None:
+    with open(temp_dir / f"{TEST_EXERCISE_ID}.json", "w", encoding="utf-8") as f:
+        json.dump(valid_exercise_data, f)
+    repository = JsonExerciseRepository(str(temp_dir), preload=True)
+    with open(temp_dir / f"{INVALID_JSON_EXERCISE_ID}.json", "w") as f:
+        f.write(INVALID_JSON_CONTENT)
+
+    with pytest.raises(CatalogLoadError):
+        repository.stage()
+
+    assert repository.version == 0
+    assert [e.id for e in repository.get_all()] == [ExerciseId(TEST_EXERCISE_ID)]
@@ -141,3 +141,22 @@ def test_get_by_id_invalid_pose_data(
     with pytest.raises(JsonParseError) as exc_info:
         pose_repository.get_by_id(pose_id)
     assert JSON_PARSE_ERROR_FRAGMENT in str(exc_info.value)
+
+
+def test_stage_and_swap_reread_files_and_bump_version(
+    pose_repository: JsonPoseRepository,
+    temp_dir: Path,
+    valid_pose_data: dict[str, object],
+) -> None:
+    pose_id = PoseId(TEST_POSE_ID)
+    pose_file = temp_dir / f"{pose_id}.json"
+    with open(pose_file, "w", encoding="utf-8") as f:
+        json.dump(valid_pose_data, f)
+    pose_repository.get_by_id(pose_id)
+
+    with open(pose_file, "w", encoding="utf-8") as f:
+        json.dump({**valid_pose_data, "name": "Renamed Pose"}, f)
+    pose_repository.swap(pose_repository.stage())
+
+    assert pose_repository.version == 1
+    assert pose_repository.get_by_id(pose_id).name == "Renamed Pose"
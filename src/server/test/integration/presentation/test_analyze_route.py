@@ -0,0 +1,108 @@
+import asyncio
+from collections.abc import Iterator
+
+import fakeredis
+import numpy as np
+import pytest
+import redis.asyncio as redis
+from fastapi.testclient import TestClient
+from starlette.testclient import WebSocketTestSession
+
+from application.processor.camera.camera_pose_processor import CameraPoseProcessor
+from application.processor.camera.camera_pose_processor_factory import (
+    CameraPoseProcessorFactory,
+)
+from composition.main import app, container
+from domain.model.exercise_id import ExerciseId
+from domain.ports.exercise_repository import ExerciseRepository
+from domain.ports.pose_repository import PoseRepository
+from presentation.schemas.binary_frame import (
+    FRAME_SUBPROTOCOL,
+    encode_binary_frame,
+)
+
+
+@pytest.fixture
+def client() -> Iterator[TestClient]:
+    with (
+        container.override({redis.Redis: fakeredis.FakeAsyncRedis()}),
+        TestClient(app) as test_client,
+    ):
+        yield test_client
+
+
+def _connect(client: TestClient) -> WebSocketTestSession:
+    response = client.post("/start", json={"exercise_id": "exercise_1"})
+    response.raise_for_status()
+    session_id = response.json()["session_id"]
+    return client.websocket_connect(
+        f"/analyze/{session_id}", subprotocols=[FRAME_SUBPROTOCOL]
+    )
+
+
+def _landmarks(count: int = 33) -> np.ndarray:
+    return np.random.default_rng(1).random((count, 3)).astype(np.float32)
+
+
+@pytest.mark.parametrize("count", [0, 10])
+def test_wrong_landmarks_count_is_rejected_without_closing_socket(
+    client: TestClient, count: int
+) -> None:
+    with _connect(client) as websocket:
+        websocket.send_bytes(encode_binary_frame(_landmarks(count), [], seq=7))
+        error = websocket.receive_json()
+
+        websocket.send_bytes(encode_binary_frame(_landmarks(), [], seq=8))
+        feedback = websocket.receive_json()
+
+    assert error == {"error": "Invalid landmarks format", "seq": 7}
+    assert feedback["seq"] == 8
+
+
+def test_batch_with_mixed_landmarks_counts_is_rejected(client: TestClient) -> None:
+    payload = encode_binary_frame(_landmarks(), [], seq=1) + encode_binary_frame(
+        _landmarks(32), [], seq=2
+    )
+    with _connect(client) as websocket:
+        websocket.send_bytes(payload)
+        error = websocket.receive_json()
+
+        websocket.send_bytes(encode_binary_frame(_landmarks(), [], seq=3))
+        feedback = websocket.receive_json()
+
+    assert error == {"error": "Invalid landmarks format", "seq": 2}
+    assert feedback["seq"] == 3
+
+
+def test_processor_rebuild_after_invalidation_runs_off_event_loop(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    assert client.portal is not None
+    factory: CameraPoseProcessorFactory = client.portal.call(
+        container.get, CameraPoseProcessorFactory
+    )
+    build = factory._build
+    built_on_loop: list[bool] = []
+
+    def recording_build(
+        exercise_id: ExerciseId,
+        exercise_repository: ExerciseRepository,
+        pose_repository: PoseRepository,
+    ) -> CameraPoseProcessor:
+        try:
+            asyncio.get_running_loop()
+            built_on_loop.append(True)
+        except RuntimeError:
+            built_on_loop.append(False)
+        return build(exercise_id, exercise_repository, pose_repository)
+
+    monkeypatch.setattr(factory, "_build", recording_build)
+
+    with _connect(client) as websocket:
+        factory.invalidate()
+        websocket.send_bytes(encode_binary_frame(_landmarks(), [], seq=1))
+        feedback = websocket.receive_json()
+
+    assert feedback["seq"] == 1
+    assert built_on_loop
+    assert not any(built_on_loop)
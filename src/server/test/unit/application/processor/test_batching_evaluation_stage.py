@@ -0,0 +1,151 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from application.processor.batching_evaluation_stage import BatchingEvaluationStage
+from application.processor.process_context import ProcessContext
+from application.processor.sensor_processor import SensorProcessor
+from domain.model.angle import Angle
+from domain.model.exercise_state import ExerciseState
+from domain.model.feedback import Feedback, FeedbackType
+from domain.model.frame_pose import FramePose
+
+
+class _RecordingProcessor(SensorProcessor):
+    """
+    Процессор, который переводит упражнение на следующую позу и запоминает, какими
+    пачками его вызывали.
+    """
+
+    def __init__(
+        self,
+        failing_index: int | None = None,
+        error: type[Exception] = ValueError,
+    ) -> None:
+        self.batch_sizes: list[int] = []
+        self.processed = 0
+        self._failing_index = failing_index
+        self._error = error
+
+    def process(
+        self, context: ProcessContext, state: ExerciseState
+    ) -> tuple[list[Feedback], ExerciseState]:
+        self.processed += 1
+        if state.current_pose_index == self._failing_index:
+            raise self._error("broken session")
+        return [
+            Feedback(
+                type=FeedbackType.POSE,
+                message=str(context.pose[Angle.LEFT_SHOULDER_ANGLE]),
+            )
+        ], ExerciseState(current_pose_index=state.current_pose_index + 1)
+
+    def process_sessions(
+        self, items: list[tuple[ProcessContext, ExerciseState]]
+    ) -> list[tuple[list[Feedback], ExerciseState]]:
+        self.batch_sizes.append(len(items))
+        return super().process_sessions(items)
+
+
+def _context(value: float) -> ProcessContext:
+    return ProcessContext(pose=FramePose.from_angles([value] * len(Angle)), emgs=[])
+
+
+async def _process_sessions(
+    stage: BatchingEvaluationStage, processor: SensorProcessor, sessions: int
+) -> list[tuple[list[Feedback], ExerciseState]]:
+    return await asyncio.gather(
+        *(
+            stage.process(
+                processor, _context(float(i)), ExerciseState(current_pose_index=i)
+            )
+            for i in range(sessions)
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_process_batches_frames_of_concurrent_sessions() -> None:
+    processor = _RecordingProcessor()
+
+    results = await _process_sessions(BatchingEvaluationStage(), processor, 5)
+
+    assert processor.batch_sizes == [5]
+    assert [state.current_pose_index for _, state in results] == [1, 2, 3, 4, 5]
+    assert [feedbacks[0].message for feedbacks, _ in results] == [
+        str(float(i)) for i in range(5)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_process_groups_frames_by_processor() -> None:
+    first, second = _RecordingProcessor(), _RecordingProcessor()
+    stage = BatchingEvaluationStage()
+
+    await asyncio.gather(
+        _process_sessions(stage, first, 3), _process_sessions(stage, second, 2)
+    )
+
+    assert first.batch_sizes == [3]
+    assert second.batch_sizes == [2]
+
+
+@pytest.mark.asyncio
+async def test_process_runs_batches_in_executor() -> None:
+    processor = _RecordingProcessor()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        stage = BatchingEvaluationStage(executor=executor)
+
+        results = await _process_sessions(stage, processor, 4)
+
+    assert processor.batch_sizes == [4]
+    assert [state.current_pose_index for _, state in results] == [1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_process_isolates_failing_session(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    processor = _RecordingProcessor(failing_index=1)
+    stage = BatchingEvaluationStage()
+
+    results = await asyncio.gather(
+        *(
+            stage.process(processor, _context(0.0), ExerciseState(current_pose_index=i))
+            for i in range(3)
+        ),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[1], ValueError)
+    assert [
+        result[1].current_pose_index
+        for result in results
+        if not isinstance(result, BaseException)
+    ] == [1, 3]
+    assert [record.levelno for record in caplog.records] == [logging.WARNING]
+
+
+@pytest.mark.asyncio
+async def test_process_fails_whole_group_on_unexpected_error() -> None:
+    processor = _RecordingProcessor(failing_index=1, error=RuntimeError)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        stage = BatchingEvaluationStage(executor=executor)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                *(
+                    stage.process(
+                        processor, _context(0.0), ExerciseState(current_pose_index=i)
+                    )
+                    for i in range(3)
+                ),
+                return_exceptions=True,
+            ),
+            timeout=5,
+        )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert processor.processed == 2
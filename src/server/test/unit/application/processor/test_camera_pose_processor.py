@@ -3,8 +3,9 @@ from unittest.mock import Mock, patch
 
 from application.processor.camera.camera_pose_processor import CameraPoseProcessor
 from application.processor.process_context import ProcessContext
+from domain.model.angle import Angle
 from domain.model.exercise_state import ExerciseState
-from domain.model.pose import Pose
+from domain.model.frame_pose import FramePose
 from domain.model.pose_id import PoseId
 
 
@@ -16,7 +17,7 @@ def _build_processor(
     current_index: int,
     next_index: int,
 ) -> tuple[
-    CameraPoseProcessor, SimpleNamespace, Mock, Mock, Mock, Pose, SimpleNamespace
+    CameraPoseProcessor, SimpleNamespace, Mock, Mock, Mock, FramePose, SimpleNamespace
 ]:
     exercise = SimpleNamespace(
         poses=[SimpleNamespace(id=expected_pose_id, name="Поза 1")],
@@ -45,19 +46,7 @@ def _build_processor(
         rule_validator=rule_validator,
         state_machine=state_machine,
     )
-    input_pose = Pose(
-        id=PoseId("test_pose"),
-        name="Test Pose",
-        threshold=0.1,
-        left_shoulder_angle=90.0,
-        right_shoulder_angle=90.0,
-        left_elbow_angle=90.0,
-        right_elbow_angle=90.0,
-        left_knee_angle=90.0,
-        right_knee_angle=90.0,
-        left_hip_angle=90.0,
-        right_hip_angle=90.0,
-    )
+    input_pose = FramePose.from_angles([90.0] * len(Angle))
 
     return (
         processor,
@@ -159,3 +148,26 @@ def test_process_appends_transition_feedback_when_pose_index_changes() -> None:
     assert [feedback.message for feedback in feedbacks] == [
         "Отлично! Переходим к следующему движению.",
     ]
+
+
+def test_process_sessions_matches_all_frames_in_one_call() -> None:
+    processor, _, pose_matcher, _, state_machine, input_pose, match_result = (
+        _build_processor(
+            expected_pose_id=PoseId("pose_1"),
+            matched_pose_id=PoseId("pose_1"),
+            violations=[],
+            current_index=0,
+            next_index=0,
+        )
+    )
+    pose_matcher.match_batch.return_value = [match_result, match_result]
+    current_state = state_machine.state
+    context = ProcessContext(pose=input_pose, emgs=[])
+
+    results = processor.process_sessions(
+        [(context, current_state), (context, current_state)]
+    )
+
+    assert [feedbacks for feedbacks, _ in results] == [[], []]
+    pose_matcher.match_batch.assert_called_once_with([input_pose, input_pose])
+    pose_matcher.match.assert_not_called()
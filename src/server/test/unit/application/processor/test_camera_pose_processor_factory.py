@@ -0,0 +1,147 @@
+from unittest.mock import Mock
+
+import pytest
+
+from application.processor.camera.camera_pose_processor_factory import (
+    CameraPoseProcessorFactory,
+)
+from domain.model.angle import Angle
+from domain.model.exercise import Exercise
+from domain.model.exercise_id import ExerciseId
+from domain.model.pose import Pose
+from domain.model.pose_id import PoseId
+from domain.ports.errors import CatalogLoadError, EntityNotFoundError
+from domain.ports.exercise_repository import ExerciseRepository
+from domain.ports.pose_repository import PoseRepository
+from domain.service.pose.pose_matcher.strategy.penalty_strategy import PenaltyStrategy
+
+EXERCISE_ID = ExerciseId("exercise_1")
+OTHER_EXERCISE_ID = ExerciseId("exercise_2")
+
+
+def _make_pose(pose_id: PoseId) -> Pose:
+    return Pose(
+        id=pose_id,
+        name=pose_id.id,
+        threshold=10.0,
+        **{name: 90.0 for name in Angle.get_all_field_names()},
+    )
+
+
+def _build_factory() -> tuple[CameraPoseProcessorFactory, Mock, Mock]:
+    exercise_repository = Mock(spec=ExerciseRepository)
+    exercise_repository.version = 0
+    exercise_repository.get_by_id.side_effect = lambda exercise_id: Exercise(
+        id=exercise_id,
+        name="exercise",
+        poses=[PoseId("pose_1"), PoseId("pose_2")],
+        pose_rules=[],
+    )
+    pose_repository = Mock(spec=PoseRepository)
+    pose_repository.version = 0
+    pose_repository.get_by_id.side_effect = _make_pose
+
+    factory = CameraPoseProcessorFactory(
+        exercise_repository=exercise_repository,
+        pose_repository=pose_repository,
+        pose_matcher_strategy=PenaltyStrategy(),
+        frame_tolerance=3,
+    )
+    return factory, exercise_repository, pose_repository
+
+
+def test_create_reuses_processor_for_same_exercise() -> None:
+    factory, exercise_repository, pose_repository = _build_factory()
+
+    first = factory.create(EXERCISE_ID)
+    second = factory.create(EXERCISE_ID)
+
+    assert first is second
+    exercise_repository.get_by_id.assert_called_once_with(EXERCISE_ID)
+    assert pose_repository.get_by_id.call_count == 2
+    assert factory.cache_stats.hits == 1
+    assert factory.cache_stats.misses == 1
+    assert factory.cache_stats.size == 1
+
+
+def test_create_builds_separate_processors_per_exercise() -> None:
+    factory, _, _ = _build_factory()
+
+    first = factory.create(EXERCISE_ID)
+    second = factory.create(OTHER_EXERCISE_ID)
+
+    assert first is not second
+    assert factory.cache_stats.misses == 2
+    assert factory.cache_stats.size == 2
+
+
+def test_create_rebuilds_processor_when_repository_version_changes() -> None:
+    factory, exercise_repository, pose_repository = _build_factory()
+
+    first = factory.create(EXERCISE_ID)
+    pose_repository.version = 1
+    second = factory.create(EXERCISE_ID)
+
+    assert first is not second
+    assert exercise_repository.get_by_id.call_count == 2
+    assert factory.cache_stats.invalidations == 1
+    assert factory.cache_stats.misses == 2
+
+
+def test_invalidate_drops_cached_processors() -> None:
+    factory, _, _ = _build_factory()
+    first = factory.create(EXERCISE_ID)
+
+    factory.invalidate()
+    second = factory.create(EXERCISE_ID)
+
+    assert first is not second
+    assert factory.cache_stats.invalidations == 1
+
+
+def test_preload_builds_processors_for_all_exercises() -> None:
+    factory, exercise_repository, _ = _build_factory()
+    exercise_repository.get_all.return_value = [
+        exercise_repository.get_by_id(EXERCISE_ID),
+        exercise_repository.get_by_id(OTHER_EXERCISE_ID),
+    ]
+
+    factory.preload()
+
+    assert factory.cache_stats.size == 2
+    factory.create(EXERCISE_ID)
+    assert factory.cache_stats.hits == 1
+
+
+def test_preload_reports_every_broken_exercise() -> None:
+    factory, exercise_repository, pose_repository = _build_factory()
+    exercise_repository.get_all.return_value = [
+        exercise_repository.get_by_id(EXERCISE_ID),
+        exercise_repository.get_by_id(OTHER_EXERCISE_ID),
+    ]
+    pose_repository.get_by_id.side_effect = EntityNotFoundError("Pose", "pose_1")
+
+    with pytest.raises(CatalogLoadError) as exc_info:
+        factory.preload()
+
+    assert len(exc_info.value.errors) == 2
+
+
+def test_create_retries_build_when_catalog_is_swapped_meanwhile() -> None:
+    factory, exercise_repository, pose_repository = _build_factory()
+    calls = 0
+
+    def get_pose(pose_id: PoseId) -> Pose:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            pose_repository.version = 1
+            raise EntityNotFoundError("Pose", pose_id.id)
+        return _make_pose(pose_id)
+
+    pose_repository.get_by_id.side_effect = get_pose
+
+    processor = factory.create(EXERCISE_ID)
+
+    assert factory.create(EXERCISE_ID) is processor
+    assert exercise_repository.get_by_id.call_count == 2
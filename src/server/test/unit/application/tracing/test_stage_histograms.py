@@ -0,0 +1,34 @@
+import pytest
+
+from application.tracing.stage_histograms import (
+    HistogramStageTracer,
+    LatencyHistogram,
+    StageHistograms,
+)
+
+
+def test_histogram_snapshot_has_cumulative_bucket_counts() -> None:
+    histogram = LatencyHistogram(buckets=(0.001, 0.01, 0.1))
+    for seconds in (0.0005, 0.001, 0.005, 0.05, 2.0):
+        histogram.observe(seconds)
+
+    snapshot = histogram.snapshot
+
+    assert snapshot.counts == (2, 3, 4)
+    assert snapshot.count == 5
+    assert snapshot.total == pytest.approx(2.0565)
+
+
+def test_tracer_records_stage_even_when_it_raises() -> None:
+    histograms = StageHistograms()
+    tracer = HistogramStageTracer(histograms)
+
+    with tracer.stage("session_get"):
+        pass
+    with pytest.raises(RuntimeError), tracer.stage("session_update"):
+        raise RuntimeError("redis is down")
+
+    snapshot = histograms.snapshot
+    assert list(snapshot) == ["session_get", "session_update"]
+    assert snapshot["session_get"].count == 1
+    assert snapshot["session_update"].count == 1
@@ -1,8 +1,14 @@
+import asyncio
+import time
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 
 from application.processor.process_context import ProcessContext
+from application.processor.sensor_processor import (
+    SensorProcessor,
+    SensorProcessorFactory,
+)
 from application.usecase.evaluate_exercise_use_case import EvaluateExerciseUseCase
 from application.dto.feedback import FeedbackItemDto
 from domain.model.exercise_id import ExerciseId
@@ -95,3 +101,142 @@ async def test_execute_handles_empty_processor_list() -> None:
     session_repository.get.assert_awaited_once_with(session.session_id)
     session_repository.update.assert_awaited_once_with(session)
     assert response.feedbacks == []
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_loads_and_persists_session_once() -> None:
+    session = Session(
+        session_id=SessionId("session-3"),
+        exercise_id=ExerciseId("exercise-3"),
+        exercise_state=ExerciseState(current_pose_index=0, frame_tolerance_counter=0),
+    )
+    session_repository = Mock(spec=SessionRepository)
+    session_repository.get = AsyncMock(return_value=session)
+    session_repository.update = AsyncMock(return_value=session)
+
+    final_state = ExerciseState(current_pose_index=1, frame_tolerance_counter=0)
+    processor = Mock()
+    processor.process_batch.return_value = (
+        [[], [Feedback(type=FeedbackType.SYSTEM, message="next")]],
+        final_state,
+    )
+    factory = Mock()
+    factory.create.return_value = processor
+
+    use_case = EvaluateExerciseUseCase(
+        session_repository=session_repository,
+        processor_factories=[factory],
+    )
+    contexts = [
+        ProcessContext(pose=landmarks_to_pose(_landmarks_32()), emgs=[]),
+        ProcessContext(pose=landmarks_to_pose(_landmarks_32()), emgs=[]),
+    ]
+
+    responses = await use_case.execute_batch(session.session_id, contexts)
+
+    session_repository.get.assert_awaited_once_with(session.session_id)
+    processor.process_batch.assert_called_once_with(contexts, session.exercise_state)
+    session_repository.update.assert_awaited_once()
+    assert session_repository.update.await_args.args[0].exercise_state == final_state
+    assert [response.feedbacks for response in responses] == [
+        [],
+        [FeedbackItemDto(type=FeedbackType.SYSTEM.value, message="next")],
+    ]
+
+
+COLD_READ_SECONDS = 0.3
+
+
+class _ColdReadFactory(SensorProcessorFactory):
+    """
+    Фабрика, которая при первом обращении к упражнению блокирует поток, как чтение
+    каталога с диска.
+    """
+
+    def __init__(self, processor: SensorProcessor, warm: set[ExerciseId]) -> None:
+        self._processor = processor
+        self.warm = warm
+
+    def create(self, exercise_id: ExerciseId) -> SensorProcessor:
+        if exercise_id not in self.warm:
+            time.sleep(COLD_READ_SECONDS)
+            self.warm.add(exercise_id)
+        return self._processor
+
+    def is_cached(self, exercise_id: ExerciseId) -> bool:
+        return exercise_id in self.warm
+
+
+@pytest.mark.asyncio
+async def test_prepare_does_not_block_other_sessions_on_cold_read() -> None:
+    hot_session = Session(
+        session_id=SessionId("session-hot"),
+        exercise_id=ExerciseId("exercise-hot"),
+        exercise_state=ExerciseState(),
+    )
+    cold_session = Session(
+        session_id=SessionId("session-cold"),
+        exercise_id=ExerciseId("exercise-cold"),
+        exercise_state=ExerciseState(),
+    )
+    sessions = {s.session_id: s for s in (hot_session, cold_session)}
+    session_repository = Mock(spec=SessionRepository)
+    session_repository.get = AsyncMock(side_effect=lambda sid: sessions[sid])
+    session_repository.update = AsyncMock(side_effect=lambda s: s.session_id)
+    processor = Mock(spec=SensorProcessor)
+    processor.process.return_value = ([], ExerciseState())
+    factory = _ColdReadFactory(processor, warm={hot_session.exercise_id})
+    use_case = EvaluateExerciseUseCase(
+        session_repository=session_repository, processor_factories=[factory]
+    )
+    request = ProcessContext(pose=landmarks_to_pose(_landmarks_32()), emgs=[])
+
+    cold_prepare = asyncio.create_task(use_case.prepare(cold_session.session_id))
+    await asyncio.sleep(0.01)
+    started = time.perf_counter()
+    for _ in range(10):
+        await use_case.execute(hot_session.session_id, request)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < COLD_READ_SECONDS / 3
+    assert not cold_prepare.done()
+    await cold_prepare
+    assert cold_session.exercise_id in factory.warm
+
+
+@pytest.mark.asyncio
+async def test_execute_does_not_block_other_sessions_on_cache_miss() -> None:
+    hot_session = Session(
+        session_id=SessionId("session-hot"),
+        exercise_id=ExerciseId("exercise-hot"),
+        exercise_state=ExerciseState(),
+    )
+    cold_session = Session(
+        session_id=SessionId("session-cold"),
+        exercise_id=ExerciseId("exercise-cold"),
+        exercise_state=ExerciseState(),
+    )
+    sessions = {s.session_id: s for s in (hot_session, cold_session)}
+    session_repository = Mock(spec=SessionRepository)
+    session_repository.get = AsyncMock(side_effect=lambda sid: sessions[sid])
+    session_repository.update = AsyncMock(side_effect=lambda s: s.session_id)
+    processor = Mock(spec=SensorProcessor)
+    processor.process.return_value = ([], ExerciseState())
+    factory = _ColdReadFactory(processor, warm={hot_session.exercise_id})
+    use_case = EvaluateExerciseUseCase(
+        session_repository=session_repository, processor_factories=[factory]
+    )
+    request = ProcessContext(pose=landmarks_to_pose(_landmarks_32()), emgs=[])
+
+    cold_execute = asyncio.create_task(
+        use_case.execute(cold_session.session_id, request)
+    )
+    await asyncio.sleep(0.01)
+    started = time.perf_counter()
+    for _ in range(10):
+        await use_case.execute(hot_session.session_id, request)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < COLD_READ_SECONDS / 3
+    assert not cold_execute.done()
+    await cold_execute
@@ -0,0 +1,48 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import ClassVar
+
+import pytest
+from wireup import create_async_container
+
+from application.processor.evaluation_stage import EvaluationStage
+from composition.di import application_di
+
+
+class _RecordingExecutor(ThreadPoolExecutor):
+    instances: ClassVar[list["_RecordingExecutor"]] = []
+
+    def __init__(self, max_workers: int, thread_name_prefix: str) -> None:
+        super().__init__(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self.shutdown_calls: list[bool] = []
+        self.instances.append(self)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        self.shutdown_calls.append(wait)
+        super().shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+@pytest.mark.parametrize("evaluation_batching", [False, True])
+def test_closing_container_shuts_down_evaluation_executor(
+    monkeypatch: pytest.MonkeyPatch, evaluation_batching: bool
+) -> None:
+    monkeypatch.setattr(_RecordingExecutor, "instances", [])
+    monkeypatch.setattr(application_di, "ThreadPoolExecutor", _RecordingExecutor)
+    container = create_async_container(
+        config={
+            "evaluation_executor": "thread",
+            "evaluation_threads": 1,
+            "evaluation_batching": evaluation_batching,
+            "evaluation_batch_window_seconds": 0.0,
+        },
+        injectables=[application_di.make_evaluation_stage],
+    )
+
+    async def resolve_and_close() -> None:
+        await container.get(EvaluationStage)
+        await container.close()
+
+    asyncio.run(resolve_and_close())
+
+    [executor] = _RecordingExecutor.instances
+    assert executor.shutdown_calls == [False]
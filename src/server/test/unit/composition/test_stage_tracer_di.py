@@ -0,0 +1,24 @@
+from application.tracing.stage_histograms import (
+    HistogramStageTracer,
+    StageHistograms,
+)
+from application.tracing.stage_tracer import NullStageTracer
+from composition.di.infrastructure_di import make_stage_tracer
+
+
+def test_otel_endpoint_without_tracing_enabled_does_not_export() -> None:
+    tracer = make_stage_tracer(
+        tracing_enabled=False,
+        otel_endpoint="http://collector:4317",
+        histograms=StageHistograms(),
+    )
+
+    assert isinstance(tracer, NullStageTracer)
+
+
+def test_tracing_enabled_without_endpoint_records_histograms_only() -> None:
+    tracer = make_stage_tracer(
+        tracing_enabled=True, otel_endpoint="", histograms=StageHistograms()
+    )
+
+    assert isinstance(tracer, HistogramStageTracer)
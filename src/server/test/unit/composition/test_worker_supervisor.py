@@ -0,0 +1,103 @@
+import itertools
+import os
+import signal
+import socket
+from collections.abc import Iterator
+
+import pytest
+
+from composition.serve import WorkerSupervisor
+
+
+class _RecordingSupervisor(WorkerSupervisor):
+    """
+    Супервизор, который вместо форка выдает фиктивные pid и записывает задержки
+    перезапуска вместо ожидания.
+    """
+
+    def __init__(
+        self, sock: socket.socket, max_backoff: float, max_crashes: int
+    ) -> None:
+        super().__init__(
+            sock,
+            workers=1,
+            backoff=0.5,
+            max_backoff=max_backoff,
+            max_crashes=max_crashes,
+            crash_window=60.0,
+        )
+        self.spawned: list[int] = []
+        self.delays: list[float] = []
+        self._next_pid = itertools.count(100)
+
+    def _spawn(self) -> None:
+        pid = next(self._next_pid)
+        self.spawned.append(pid)
+        self._pids.add(pid)
+
+    def _sleep(self, seconds: float) -> None:
+        self.delays.append(seconds)
+
+
+@pytest.fixture
+def sock(monkeypatch: pytest.MonkeyPatch) -> Iterator[socket.socket]:
+    monkeypatch.setattr(signal, "signal", lambda *args: None)
+    with socket.socket() as sock:
+        yield sock
+
+
+def _crash_every_worker(
+    monkeypatch: pytest.MonkeyPatch, supervisor: _RecordingSupervisor
+) -> None:
+    def wait() -> tuple[int, int]:
+        return supervisor.spawned[-1], 1 << 8
+
+    monkeypatch.setattr(os, "wait", wait)
+
+
+def test_restart_delay_doubles_up_to_max_backoff(
+    monkeypatch: pytest.MonkeyPatch, sock: socket.socket
+) -> None:
+    supervisor = _RecordingSupervisor(sock, max_backoff=1.5, max_crashes=4)
+    _crash_every_worker(monkeypatch, supervisor)
+
+    supervisor.run()
+
+    assert supervisor.delays == [0.5, 1.0, 1.5, 1.5]
+
+
+def test_gives_up_when_workers_crash_too_often(
+    monkeypatch: pytest.MonkeyPatch, sock: socket.socket
+) -> None:
+    supervisor = _RecordingSupervisor(sock, max_backoff=30.0, max_crashes=3)
+    _crash_every_worker(monkeypatch, supervisor)
+
+    exit_code = supervisor.run()
+
+    assert exit_code == 1
+    assert len(supervisor.spawned) == 4
+    assert len(supervisor.delays) == 3
+
+
+def test_clean_exit_is_not_restarted(
+    monkeypatch: pytest.MonkeyPatch, sock: socket.socket
+) -> None:
+    supervisor = _RecordingSupervisor(sock, max_backoff=30.0, max_crashes=3)
+    monkeypatch.setattr(os, "wait", lambda: (supervisor.spawned[-1], 0))
+
+    exit_code = supervisor.run()
+
+    assert exit_code == 0
+    assert supervisor.spawned == [100]
+    assert supervisor.delays == []
+
+
+def test_signal_exit_is_restarted(
+    monkeypatch: pytest.MonkeyPatch, sock: socket.socket
+) -> None:
+    supervisor = _RecordingSupervisor(sock, max_backoff=30.0, max_crashes=1)
+    monkeypatch.setattr(os, "wait", lambda: (supervisor.spawned[-1], signal.SIGKILL))
+
+    supervisor.run()
+
+    assert supervisor.delays == [0.5]
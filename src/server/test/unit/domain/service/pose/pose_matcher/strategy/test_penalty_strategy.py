@@ -0,0 +1,134 @@
+import numpy as np
+import pytest
+
+from domain.model.angle import Angle
+from domain.model.frame_pose import FramePose
+from domain.model.pose import Pose
+from domain.model.pose_id import PoseId
+from domain.service.pose.pose_deviants import calculate_deviations_with_threshold
+from domain.service.pose.pose_matcher.pose_matcher import PoseMatcher
+from domain.service.pose.pose_matcher.reference_pose_matrix import (
+    ReferencePoseMatrix,
+)
+from domain.service.pose.pose_matcher.strategy.penalty_strategy import PenaltyStrategy
+
+
+def _make_pose(pose_id: str, angles: list[float], threshold: float = 10.0) -> Pose:
+    return Pose(
+        id=PoseId(pose_id),
+        name=pose_id,
+        threshold=threshold,
+        **dict(zip(Angle.get_all_field_names(), angles, strict=True)),
+    )
+
+
+def _random_poses(count: int, seed: int = 7) -> list[Pose]:
+    rng = np.random.default_rng(seed)
+    return [
+        _make_pose(f"pose_{i}", (rng.random(len(Angle)) * 180.0).tolist(), 10.0)
+        for i in range(count)
+    ]
+
+
+def test_from_poses_builds_bounds_in_angle_order() -> None:
+    pose = _make_pose("pose_1", [float(i * 10) for i in range(len(Angle))], 5.0)
+
+    matrix = ReferencePoseMatrix.from_poses([pose])
+
+    assert matrix.lower.shape == (1, len(Angle))
+    assert matrix.lower[0].tolist() == [
+        min_ for min_, _ in pose.get_angle_ranges().values()
+    ]
+    assert matrix.upper[0].tolist() == [
+        max_ for _, max_ in pose.get_angle_ranges().values()
+    ]
+
+
+def test_match_returns_pose_with_lowest_penalty() -> None:
+    first = _make_pose("pose_1", [0.0] * len(Angle))
+    second = _make_pose("pose_2", [90.0] * len(Angle))
+    current = FramePose.from_angles([85.0] * len(Angle))
+
+    result = PenaltyStrategy().match(
+        current, ReferencePoseMatrix.from_poses([first, second])
+    )
+
+    assert result.pose is second
+    assert result.deviations == {}
+
+
+def test_match_reports_only_out_of_range_deviations() -> None:
+    reference = _make_pose("pose_1", [90.0] * len(Angle))
+    angles = [90.0] * len(Angle)
+    angles[0] = 70.0
+    angles[1] = 105.0
+    current = FramePose.from_angles(angles)
+
+    result = PenaltyStrategy().match(
+        current, ReferencePoseMatrix.from_poses([reference])
+    )
+
+    assert result.deviations == pytest.approx(
+        {Angle.LEFT_SHOULDER_ANGLE: 10.0, Angle.RIGHT_SHOULDER_ANGLE: 5.0}
+    )
+
+
+def test_match_agrees_with_per_pose_deviations() -> None:
+    references = _random_poses(24)
+    matcher = PoseMatcher(reference_poses=references, strategy=PenaltyStrategy())
+
+    for current in map(FramePose.from_pose, _random_poses(20, seed=11)):
+        penalties = [
+            sum(calculate_deviations_with_threshold(current, reference).values())
+            for reference in references
+        ]
+        expected = references[int(np.argmin(penalties))]
+
+        result = matcher.match(current)
+
+        assert result.pose is expected
+        assert result.deviations == pytest.approx(
+            calculate_deviations_with_threshold(current, expected)
+        )
+
+
+def test_match_raises_when_no_reference_poses() -> None:
+    current = FramePose.from_angles([0.0] * len(Angle))
+
+    with pytest.raises(ValueError, match="No best match found"):
+        PenaltyStrategy().match(current, ReferencePoseMatrix.from_poses([]))
+
+
+def test_match_batch_agrees_with_match() -> None:
+    references = _random_poses(24)
+    matcher = PoseMatcher(reference_poses=references, strategy=PenaltyStrategy())
+    current_poses = [FramePose.from_pose(pose) for pose in _random_poses(20, seed=13)]
+
+    results = matcher.match_batch(current_poses)
+
+    assert [result.pose for result in results] == [
+        matcher.match(current).pose for current in current_poses
+    ]
+    assert [result.deviations for result in results] == [
+        pytest.approx(matcher.match(current).deviations) for current in current_poses
+    ]
+
+
+def test_match_skips_references_with_non_finite_penalty() -> None:
+    broken = _make_pose("pose_1", [float("nan")] * len(Angle))
+    valid = _make_pose("pose_2", [0.0] * len(Angle))
+    matrix = ReferencePoseMatrix.from_poses([broken, valid])
+    current = FramePose.from_angles([90.0] * len(Angle))
+
+    assert PenaltyStrategy().match(current, matrix).pose is valid
+    assert PenaltyStrategy().match_batch([current], matrix)[0].pose is valid
+
+
+def test_match_raises_when_all_penalties_are_non_finite() -> None:
+    matrix = ReferencePoseMatrix.from_poses([_make_pose("pose_1", [0.0] * len(Angle))])
+    current = FramePose.from_angles([float("nan")] * len(Angle))
+
+    with pytest.raises(ValueError, match="No best match found"):
+        PenaltyStrategy().match(current, matrix)
+    with pytest.raises(ValueError, match="No best match found"):
+        PenaltyStrategy().match_batch([current], matrix)
@@ -0,0 +1,91 @@
+import math
+
+import numpy as np
+import pytest
+
+from domain.model.angle import Angle
+from domain.service.pose.angle_engine import ANGLE_INDICES, calculate_angles_xy
+from domain.service.pose.skeleton_transformer import (
+    calculate_angle_xy,
+    landmarks_to_pose,
+    landmarks_to_poses,
+)
+
+LANDMARKS_COUNT = 33
+
+
+def _random_skeletons(frames: int, seed: int = 42) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return rng.random((frames, LANDMARKS_COUNT, 3))
+
+
+def test_angle_indices_follow_angle_enum_order() -> None:
+    assert ANGLE_INDICES.shape == (len(Angle), 3)
+    for row, angle in zip(ANGLE_INDICES, Angle):
+        assert tuple(row) == (
+            angle.side_a.index,
+            angle.vertex.index,
+            angle.side_b.index,
+        )
+
+
+def test_calculate_angles_xy_matches_scalar_implementation() -> None:
+    skeleton = _random_skeletons(1)[0].tolist()
+
+    angles = calculate_angles_xy(skeleton)
+
+    assert angles.shape == (len(Angle),)
+    for value, angle in zip(angles, Angle):
+        assert value == pytest.approx(calculate_angle_xy(skeleton, angle))
+
+
+def test_calculate_angles_xy_returns_zero_for_degenerate_vectors() -> None:
+    skeleton = np.zeros((LANDMARKS_COUNT, 3))
+
+    angles = calculate_angles_xy(skeleton)
+
+    assert np.all(angles == 0.0)
+
+
+def test_calculate_angles_xy_computes_right_angle() -> None:
+    skeleton = np.zeros((LANDMARKS_COUNT, 3))
+    side_a, vertex, side_b = ANGLE_INDICES[0]
+    skeleton[side_a] = [1.0, 0.0, 0.0]
+    skeleton[vertex] = [0.0, 0.0, 0.0]
+    skeleton[side_b] = [0.0, 1.0, 5.0]
+
+    angles = calculate_angles_xy(skeleton)
+
+    assert angles[0] == pytest.approx(90.0)
+
+
+def test_calculate_angles_xy_rejects_invalid_shape() -> None:
+    with pytest.raises(ValueError):
+        calculate_angles_xy(np.zeros(LANDMARKS_COUNT))
+
+
+def test_landmarks_to_pose_matches_scalar_implementation() -> None:
+    skeleton = _random_skeletons(1)[0].tolist()
+
+    pose = landmarks_to_pose(skeleton)
+
+    for angle in Angle:
+        assert pose[angle] == pytest.approx(calculate_angle_xy(skeleton, angle))
+        assert type(pose[angle]) is float
+
+
+def test_landmarks_to_poses_matches_per_frame_conversion() -> None:
+    skeletons = _random_skeletons(5)
+
+    poses = landmarks_to_poses(skeletons)
+
+    assert len(poses) == 5
+    for pose, skeleton in zip(poses, skeletons):
+        expected = landmarks_to_pose(skeleton)
+        for angle in Angle:
+            assert math.isclose(pose[angle], expected[angle])
+
+
+def test_landmarks_to_poses_rejects_single_skeleton() -> None:
+    with pytest.raises(ValueError):
+        landmarks_to_poses(_random_skeletons(1)[0])
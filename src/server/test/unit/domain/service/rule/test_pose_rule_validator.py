@@ -0,0 +1,95 @@
+import pytest
+
+from domain.model.angle import Angle
+from domain.model.pose import Pose
+from domain.model.pose_id import PoseId
+from domain.model.pose_match_result import PoseMatchResult
+from domain.model.pose_rule import PoseRule
+from domain.service.rule.pose_rule_validator import PoseRuleValidator
+from domain.service.rule.rule_validator import RuleValidator
+from domain.service.rule.strategy.pose_rule_strategy import PoseRuleStrategy
+
+
+def _make_pose(pose_id: str) -> Pose:
+    return Pose(
+        id=PoseId(id=pose_id),
+        name="pose",
+        threshold=10.0,
+        left_shoulder_angle=90.0,
+        right_shoulder_angle=90.0,
+        left_elbow_angle=180.0,
+        right_elbow_angle=180.0,
+        left_knee_angle=180.0,
+        right_knee_angle=180.0,
+        left_hip_angle=180.0,
+        right_hip_angle=180.0,
+    )
+
+
+def _rules() -> list[PoseRule]:
+    angles = list(Angle)
+    return [
+        PoseRule(
+            id=PoseId(id=f"pose-{i % 3}"),
+            feature=angles[i % len(angles)],
+            operator=">" if i % 2 else "<",
+            value=15.0,
+            message=f"rule {i}",
+        )
+        for i in range(24)
+    ]
+
+
+@pytest.mark.parametrize("pose_id", ["pose-0", "pose-1", "pose-2"])
+def test_validate_matches_per_rule_strategy(pose_id: str) -> None:
+    rules = _rules()
+    result = PoseMatchResult(
+        pose=_make_pose(pose_id),
+        deviations={
+            Angle.LEFT_SHOULDER_ANGLE: 20.0,
+            Angle.RIGHT_KNEE_ANGLE: 5.0,
+            Angle.LEFT_HIP_ANGLE: 15.0,
+        },
+    )
+    reference = RuleValidator(rules=rules, strategy=PoseRuleStrategy())
+
+    assert PoseRuleValidator(rules=rules).validate(result) == reference.validate(result)
+
+
+def test_validate_returns_empty_list_for_pose_without_rules() -> None:
+    validator = PoseRuleValidator(rules=_rules())
+    result = PoseMatchResult(
+        pose=_make_pose("pose-unknown"),
+        deviations={Angle.LEFT_SHOULDER_ANGLE: 20.0},
+    )
+
+    assert validator.validate(result) == []
+
+
+def test_validate_resolves_string_features() -> None:
+    rule = PoseRule(
+        id=PoseId(id="pose-1"),
+        feature="LEFT_SHOULDER",
+        operator=">",
+        value=15.0,
+        message="left shoulder too high",
+    )
+    result = PoseMatchResult(
+        pose=_make_pose("pose-1"),
+        deviations={Angle.LEFT_SHOULDER_ANGLE: 20.0},
+    )
+
+    assert PoseRuleValidator(rules=[rule]).validate(result) == [rule]
+
+
+def test_init_raises_for_unknown_operator() -> None:
+    rule = PoseRule(
+        id=PoseId(id="pose-1"),
+        feature=Angle.LEFT_SHOULDER_ANGLE,
+        operator=">=",
+        value=15.0,
+        message="left shoulder too high",
+    )
+
+    with pytest.raises(ValueError):
+        PoseRuleValidator(rules=[rule])
@@ -0,0 +1,49 @@
+import pytest
+
+from domain.model.exercise_id import ExerciseId
+from domain.model.exercise_state import ExerciseState
+from domain.model.session import Session
+from domain.model.session_id import SessionId
+from infrastructure.persistence.redis.codec.binary_session_codec import (
+    BinarySessionCodec,
+)
+from infrastructure.persistence.redis.codec.json_session_codec import JsonSessionCodec
+
+
+def _make_session() -> Session:
+    return Session(
+        session_id=SessionId("6f1c2d3e-0000-4000-8000-123456789abc"),
+        exercise_id=ExerciseId("упражнение_1"),
+        exercise_state=ExerciseState(current_pose_index=3, frame_tolerance_counter=2),
+    )
+
+
+def test_round_trip_preserves_session() -> None:
+    codec = BinarySessionCodec()
+    session = _make_session()
+
+    assert codec.decode(codec.encode(session)) == session
+
+
+def test_encoding_is_smaller_than_json() -> None:
+    session = _make_session()
+
+    binary = BinarySessionCodec().encode(session)
+    json = JsonSessionCodec().encode(session)
+
+    assert len(binary) < len(json)
+
+
+def test_decode_accepts_legacy_json_records() -> None:
+    session = _make_session()
+    legacy = JsonSessionCodec().encode(session)
+
+    assert BinarySessionCodec().decode(legacy) == session
+
+
+def test_decode_rejects_unknown_format_version() -> None:
+    encoded = bytearray(BinarySessionCodec().encode(_make_session()))
+    encoded[0] = 0x7F
+
+    with pytest.raises(ValueError, match="Unsupported session format version"):
+        BinarySessionCodec().decode(bytes(encoded))
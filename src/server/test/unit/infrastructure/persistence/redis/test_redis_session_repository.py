@@ -81,7 +81,7 @@ async def test_redis_connection_error_is_wrapped(
     async def raise_connection_error(*args: object, **kwargs: object) -> None:
         raise RedisConnectionException("redis is unavailable")
 
-    monkeypatch.setattr(repo._redis_client, "exists", raise_connection_error)
+    monkeypatch.setattr(repo._redis_client, "set", raise_connection_error)
 
     session = Session(SessionId("connection-error"), ExerciseId("ex"), ExerciseState())
 
@@ -101,3 +101,89 @@ async def test_redis_operation_error_is_wrapped(
 
     with pytest.raises(RedisOperationError, match="delete session"):
         await repo.delete(SessionId("delete-error"))
+
+
+@pytest.mark.asyncio
+async def test_update_overwrites_state_and_refreshes_ttl(
+    repo: RedisSessionRepository,
+    fake_redis: fakeredis.aioredis.FakeRedis,
+) -> None:
+    session_id = SessionId("to-update")
+    await repo.create(Session(session_id, ExerciseId("ex"), ExerciseState()))
+    await fake_redis.expire("session:to-update", 5)
+
+    updated = Session(
+        session_id,
+        ExerciseId("ex"),
+        ExerciseState(current_pose_index=1, frame_tolerance_counter=2),
+    )
+    await repo.update(updated)
+
+    assert await repo.get(session_id) == updated
+    assert await fake_redis.ttl("session:to-update") > 5
+
+
+@pytest.mark.asyncio
+async def test_create_and_update_use_single_round_trip(
+    repo: RedisSessionRepository,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def fail_exists(*args: object, **kwargs: object) -> None:
+        raise AssertionError("EXISTS must not be called")
+
+    monkeypatch.setattr(repo._redis_client, "exists", fail_exists)
+    session = Session(SessionId("atomic"), ExerciseId("ex"), ExerciseState())
+
+    await repo.create(session)
+    await repo.update(session)
+
+
+@pytest.mark.asyncio
+async def test_get_many_skips_missing_sessions(repo: RedisSessionRepository) -> None:
+    first = Session(SessionId("many-1"), ExerciseId("ex"), ExerciseState())
+    second = Session(SessionId("many-2"), ExerciseId("ex"), ExerciseState(1, 0))
+    await repo.create(first)
+    await repo.create(second)
+
+    sessions = await repo.get_many(
+        [first.session_id, SessionId("missing"), second.session_id]
+    )
+
+    assert sessions == {first.session_id: first, second.session_id: second}
+
+
+@pytest.mark.asyncio
+async def test_update_many_updates_only_existing_sessions(
+    repo: RedisSessionRepository,
+) -> None:
+    existing = Session(SessionId("batch-1"), ExerciseId("ex"), ExerciseState())
+    await repo.create(existing)
+    updated = Session(existing.session_id, ExerciseId("ex"), ExerciseState(2, 1))
+    missing = Session(SessionId("batch-missing"), ExerciseId("ex"), ExerciseState())
+
+    updated_ids = await repo.update_many([updated, missing])
+
+    assert updated_ids == [existing.session_id]
+    assert await repo.get(existing.session_id) == updated
+    with pytest.raises(EntityNotFoundError):
+        await repo.get(missing.session_id)
+
+
+@pytest.mark.asyncio
+async def test_get_reads_legacy_json_record(
+    repo: RedisSessionRepository,
+    fake_redis: fakeredis.aioredis.FakeRedis,
+) -> None:
+    await fake_redis.set(
+        "session:legacy",
+        '{"session_id": "legacy", "exercise_id": "ex", '
+        '"current_pose_index": 1, "frame_tolerance_counter": 2}',
+    )
+
+    session = await repo.get(SessionId("legacy"))
+
+    assert session == Session(
+        SessionId("legacy"),
+        ExerciseId("ex"),
+        ExerciseState(current_pose_index=1, frame_tolerance_counter=2),
+    )
@@ -0,0 +1,134 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from domain.model.exercise_id import ExerciseId
+from domain.model.exercise_state import ExerciseState
+from domain.model.session import Session
+from domain.model.session_id import SessionId
+from domain.ports.session_repository import SessionRepository
+from infrastructure.persistence.write_behind.write_behind_session_repository import (
+    WriteBehindSessionRepository,
+)
+
+FLUSH_INTERVAL = 1.0
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _make_session(pose_index: int = 0, counter: int = 0) -> Session:
+    return Session(
+        session_id=SessionId("session-1"),
+        exercise_id=ExerciseId("exercise-1"),
+        exercise_state=ExerciseState(
+            current_pose_index=pose_index, frame_tolerance_counter=counter
+        ),
+    )
+
+
+def _build_repository(
+    stored: Session,
+) -> tuple[WriteBehindSessionRepository, Mock, _FakeClock]:
+    backing = Mock(spec=SessionRepository)
+    backing.get = AsyncMock(return_value=stored)
+    backing.update = AsyncMock(return_value=stored.session_id)
+    backing.delete = AsyncMock(return_value=None)
+    clock = _FakeClock()
+    repository = WriteBehindSessionRepository(
+        backing_repository=backing, flush_interval=FLUSH_INTERVAL, clock=clock
+    )
+    return repository, backing, clock
+
+
+@pytest.mark.asyncio
+async def test_get_loads_session_once_per_connection() -> None:
+    stored = _make_session()
+    repository, backing, _ = _build_repository(stored)
+
+    first = await repository.get(stored.session_id)
+    second = await repository.get(stored.session_id)
+
+    assert first == second == stored
+    backing.get.assert_awaited_once_with(stored.session_id)
+
+
+@pytest.mark.asyncio
+async def test_update_keeps_counter_changes_in_memory_until_interval() -> None:
+    stored = _make_session()
+    repository, backing, clock = _build_repository(stored)
+    await repository.get(stored.session_id)
+
+    updated = _make_session(counter=1)
+    await repository.update(updated)
+
+    backing.update.assert_not_awaited()
+    assert await repository.get(stored.session_id) == updated
+
+    clock.now = FLUSH_INTERVAL
+    await repository.update(_make_session(counter=2))
+
+    backing.update.assert_awaited_once_with(_make_session(counter=2))
+
+
+@pytest.mark.asyncio
+async def test_update_flushes_immediately_when_pose_index_changes() -> None:
+    stored = _make_session()
+    repository, backing, _ = _build_repository(stored)
+    await repository.get(stored.session_id)
+
+    await repository.update(_make_session(pose_index=1))
+
+    backing.update.assert_awaited_once_with(_make_session(pose_index=1))
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_only_dirty_state() -> None:
+    stored = _make_session()
+    repository, backing, _ = _build_repository(stored)
+    await repository.get(stored.session_id)
+
+    await repository.flush()
+    backing.update.assert_not_awaited()
+
+    await repository.update(_make_session(counter=1))
+    await repository.flush()
+    await repository.flush()
+
+    backing.update.assert_awaited_once_with(_make_session(counter=1))
+
+
+@pytest.mark.asyncio
+async def test_delete_drops_cached_session() -> None:
+    stored = _make_session()
+    repository, backing, _ = _build_repository(stored)
+    await repository.get(stored.session_id)
+
+    await repository.delete(stored.session_id)
+    await repository.get(stored.session_id)
+
+    backing.delete.assert_awaited_once_with(stored.session_id)
+    assert backing.get.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_update_refreshes_unchanged_session_after_interval() -> None:
+    stored = _make_session(counter=1)
+    repository, backing, clock = _build_repository(stored)
+    await repository.get(stored.session_id)
+
+    await repository.update(stored)
+    backing.update.assert_not_awaited()
+
+    session_ttl = 60.0
+    for step in range(1, int(session_ttl / FLUSH_INTERVAL) + 2):
+        clock.now = step * FLUSH_INTERVAL
+        await repository.update(stored)
+
+    assert backing.update.await_count == int(session_ttl / FLUSH_INTERVAL) + 1
+    backing.update.assert_awaited_with(stored)
@@ -0,0 +1,39 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from config import settings
+from domain.ports.errors import RepositoryError
+from infrastructure.persistence.write_behind.write_behind_session_repository import (
+    WriteBehindSessionRepository,
+)
+from presentation.routes.evaluate import _flush_periodically
+
+FLUSH_INTERVAL = 0.01
+FLUSHES = 3
+
+
+@pytest.mark.asyncio
+async def test_idle_connection_keeps_flushing_after_repository_error(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "session_flush_interval_seconds", FLUSH_INTERVAL)
+    repository = Mock(spec=WriteBehindSessionRepository)
+    flushed = asyncio.Event()
+
+    async def flush() -> None:
+        if repository.flush.await_count == 1:
+            raise RepositoryError("redis is down")
+        if repository.flush.await_count >= FLUSHES:
+            flushed.set()
+
+    repository.flush = AsyncMock(side_effect=flush)
+    task = asyncio.create_task(_flush_periodically(repository, "session-1"))
+    try:
+        await asyncio.wait_for(flushed.wait(), timeout=1.0)
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    assert repository.flush.await_count >= FLUSHES
@@ -0,0 +1,125 @@
+import json
+
+import numpy as np
+import pytest
+
+from presentation.mapper.process_request_mapper import (
+    map_frame_to_context,
+    map_to_context,
+)
+from presentation.schemas.binary_frame import (
+    BinaryEmgReading,
+    BinaryFrameError,
+    decode_binary_frame,
+    decode_binary_frames,
+    encode_binary_frame,
+)
+from presentation.schemas.process import EmgSensor, ProcessRequest
+
+
+def _landmarks() -> np.ndarray:
+    rng = np.random.default_rng(3)
+    return rng.random((33, 3)).astype(np.float32)
+
+
+def test_round_trip_preserves_landmarks_and_emgs() -> None:
+    landmarks = _landmarks()
+    emgs = [
+        BinaryEmgReading(sensor_name="AA:BB:CC:DD:EE:FF", zone="Red"),
+        BinaryEmgReading(sensor_name="датчик", zone="Green"),
+    ]
+
+    frame = decode_binary_frame(encode_binary_frame(landmarks, emgs))
+
+    assert frame.landmarks.shape == (33, 3)
+    assert np.array_equal(frame.landmarks, landmarks)
+    assert frame.emgs == emgs
+
+
+def test_binary_frame_is_smaller_than_json_request() -> None:
+    landmarks = _landmarks()
+    emgs = [BinaryEmgReading(sensor_name="AA:BB:CC:DD:EE:FF", zone="Red")]
+    json_payload = json.dumps(
+        {
+            "landmarks": landmarks.tolist(),
+            "emgs": [{"sensor_name": "AA:BB:CC:DD:EE:FF", "zone": "Red"}],
+        }
+    )
+
+    binary_payload = encode_binary_frame(landmarks, emgs)
+
+    assert len(binary_payload) * 4 < len(json_payload.encode("utf-8"))
+
+
+def test_frame_maps_to_same_context_as_json_request() -> None:
+    landmarks = _landmarks()
+    request = ProcessRequest(
+        landmarks=landmarks.tolist(),
+        emgs=[EmgSensor(sensor_name="sensor", zone="Yellow")],
+    )
+    frame = decode_binary_frame(
+        encode_binary_frame(
+            landmarks, [BinaryEmgReading(sensor_name="sensor", zone="Yellow")]
+        )
+    )
+
+    assert map_frame_to_context(frame) == map_to_context(request)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b"",
+        bytes((2, 0, 0, 0)),
+        bytes((1, 33, 0, 0)) + b"\x00" * 10,
+        bytes((1, 0, 0, 0)),
+        bytes((1, 10, 0, 0)) + b"\x00" * 120,
+        bytes((1, 33, 1, 0)) + b"\x00" * 396 + bytes((9, 0)),
+        bytes((1, 33, 1, 0)) + b"\x00" * 396 + bytes((3, 0)),
+        bytes((1, 33, 1, 0)) + b"\x00" * 396 + bytes((0, 5)) + b"abc",
+        bytes((1, 33, 1, 0)) + b"\x00" * 396 + bytes((0, 1, 0xFF)),
+        bytes((1, 33, 0, 0)) + b"\x00" * 397,
+    ],
+)
+def test_decode_rejects_malformed_frames(payload: bytes) -> None:
+    with pytest.raises(ValueError):
+        decode_binary_frame(payload)
+
+
+def test_round_trip_preserves_sequence_number() -> None:
+    landmarks = _landmarks()
+
+    unsequenced = decode_binary_frame(encode_binary_frame(landmarks, []))
+    sequenced = decode_binary_frame(encode_binary_frame(landmarks, [], seq=70000))
+
+    assert unsequenced.seq is None
+    assert sequenced.seq == 70000
+    assert np.array_equal(sequenced.landmarks, landmarks)
+
+
+def test_decode_frames_splits_concatenated_frames() -> None:
+    landmarks = _landmarks()
+    payload = encode_binary_frame(landmarks, [], seq=1) + encode_binary_frame(
+        landmarks[::-1],
+        [BinaryEmgReading(sensor_name="s", zone="Yellow")],
+        seq=2,
+    )
+
+    frames = decode_binary_frames(payload)
+
+    assert [frame.seq for frame in frames] == [1, 2]
+    assert np.array_equal(frames[1].landmarks, landmarks[::-1])
+    assert frames[1].emgs == [BinaryEmgReading(sensor_name="s", zone="Yellow")]
+    with pytest.raises(ValueError):
+        decode_binary_frame(payload)
+
+
+def test_decode_error_reports_sequence_of_invalid_frame() -> None:
+    payload = encode_binary_frame(_landmarks(), [], seq=1) + encode_binary_frame(
+        _landmarks()[:10], [], seq=2
+    )
+
+    with pytest.raises(BinaryFrameError) as error:
+        decode_binary_frames(payload)
+
+    assert error.value.seq == 2
@@ -0,0 +1,40 @@
+import asyncio
+
+import pytest
+
+from presentation.stream.latest_frame_buffer import LatestFrameBuffer
+
+
+def test_put_keeps_only_newest_frames() -> None:
+    buffer: LatestFrameBuffer[int] = LatestFrameBuffer(capacity=2)
+
+    evicted = [buffer.put(frame) for frame in range(5)]
+
+    assert evicted == [None, None, 0, 1, 2]
+    assert len(buffer) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_returns_frames_in_order_then_none_after_close() -> None:
+    buffer: LatestFrameBuffer[int] = LatestFrameBuffer(capacity=2)
+    for frame in range(3):
+        buffer.put(frame)
+    buffer.close()
+
+    assert [await buffer.get(), await buffer.get(), await buffer.get()] == [1, 2, None]
+
+
+@pytest.mark.asyncio
+async def test_get_waits_for_next_frame() -> None:
+    buffer: LatestFrameBuffer[str] = LatestFrameBuffer(capacity=1)
+    waiter = asyncio.create_task(buffer.get())
+    await asyncio.sleep(0)
+
+    assert not waiter.done()
+    buffer.put("frame")
+    assert await asyncio.wait_for(waiter, timeout=1) == "frame"
+
+
+def test_rejects_non_positive_capacity() -> None:
+    with pytest.raises(ValueError):
+        LatestFrameBuffer[int](capacity=0)